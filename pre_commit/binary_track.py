@@ -124,10 +124,23 @@ Configuration:
     - "retry_delay_seconds": Delay between retries (default: 1.0)
     - Failed builds are recorded in manifest for tracking failure history
 
+    Build Manifest:
+    - Build records are kept as JSON in .binary-track-manifest.json
+    - Read and written with orjson when installed (pip install pre_commit[speedups])
+    - The parsed configuration is cached in .git/binary-track-config-cache.json
+      and reused until the YAML file's mtime or size changes
+
+    Editing Configuration:
+    - --add and --remove rewrite .binariesrc.yaml in place
+    - Comments and formatting are kept when ruamel.yaml is installed
+      (pip install pre_commit[roundtrip])
+
     Service Management:
     - For binaries running as system services (daemons, background agents)
     - Automatically stops service before rebuild and restarts after
     - Supports launchd (macOS), systemd (Linux), and custom commands
+    - systemd status is read over D-Bus when dbus-python is installed
+      (pip install pre_commit[systemd]), falling back to systemctl
 
     Service Configuration:
     {
@@ -168,24 +181,27 @@ from __future__ import annotations
 
 import argparse
 import fnmatch
+import functools
 import hashlib
 import json
 import os
 import platform
+import queue
+import re
+import selectors
 import shutil
+import signal
 import stat
 import subprocess
 import sys
 import threading
 import time
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from enum import Enum
-from pathlib import Path
-from typing import Any, TypedDict
-
-import yaml
+from pathlib import Path, PurePath
+from typing import IO, Any, Callable, TypedDict, cast
 
 # Version
 __version__ = "2.0.0"
@@ -196,9 +212,40 @@ CONFIG_FILE_NAMES = [".binariesrc.yaml", ".binariesrc.yml", "binaries.config.yam
 # Manifest file for tracking build state
 BUILD_MANIFEST_FILE = ".binary-track-manifest.json"
 
+# Parsed configuration cache, kept in the git directory and reused while the
+# YAML file is unchanged
+CONFIG_CACHE_FILE = "binary-track-config-cache.json"
+
+# Example configuration printed when no binaries are configured
+_EXAMPLE_CONFIG_YAML = """\
+binaries:
+  mytool:
+    source_patterns:
+    - cmd/mytool/**/*.go
+    - internal/**/*.go
+    build_cmd: go build -o ~/.local/bin/mytool ./cmd/mytool
+    install_path: ~/.local/bin/mytool
+    language: go
+track_by: git_commit
+pre_commit_policy: warn
+"""
+
 # Pre-commit config file
 PRE_COMMIT_CONFIG = ".pre-commit-config.yaml"
 
+# Number of trailing output lines kept per stream for build and test commands
+OUTPUT_TAIL_LINES = 2000
+
+# Read buffer for hashing source files where hashlib.file_digest is unavailable
+HASH_READ_BUFFER = 1 << 18
+
+# Source sets larger than this are hashed on a thread pool
+PARALLEL_HASH_MIN_FILES = 16
+
+# Read buffer for build and test output pipes, sized to a full pipe so each
+# read() drains whatever the child has written instead of 8KB at a time
+PIPE_READ_BUFFER = 65536
+
 
 class Platform(Enum):
     """Supported operating system platforms."""
@@ -249,6 +296,7 @@ class InstallLocation:
         return os.access(self.path, os.W_OK)
 
 
+@functools.lru_cache(maxsize=1)
 def get_current_platform() -> Platform:
     """Detect the current operating system platform."""
     system = platform.system().lower()
@@ -839,6 +887,7 @@ class ConfigDict(TypedDict, total=False):
     pre_commit_policy: str
     track_by: str
     parallel_builds: bool
+    parallel_codesign: bool
     max_workers: int
     codesign: CodesignConfigDict
     ensure_executable: bool  # Global default for setting executable permissions
@@ -918,6 +967,18 @@ class ServiceConfig:
         )
 
 
+def _expand_path(path: str) -> Path:
+    """Expand ~ in a configured path, caching per home directory."""
+    # expanduser reads HOME (USERPROFILE on Windows), so both key the cache
+    return _expand_path_for_home(path, os.environ.get("HOME"), os.environ.get("USERPROFILE"))
+
+
+@functools.lru_cache(maxsize=1024)
+def _expand_path_for_home(path: str, home: str | None, userprofile: str | None) -> Path:
+    """Cached body of _expand_path; the home arguments only key the cache."""
+    return Path(os.path.expanduser(path))
+
+
 @dataclass
 class BinaryConfig:
     """Configuration for a single tracked binary."""
@@ -976,7 +1037,8 @@ class BinaryConfig:
             rebuild_on_commit=data.get("rebuild_on_commit", True),
             check_in_path=data.get("check_in_path", True),
             working_dir=data.get("working_dir", "."),
-            env=data.get("env", {}),
+            # Normalize once here so YAML scalars (ints, bools) are valid env values
+            env={str(k): str(v) for k, v in (data.get("env") or {}).items()},
             timeout=data.get("timeout", 300),
             codesign=CodesignConfig.from_dict(data.get("codesign")),
             service=ServiceConfig.from_dict(data.get("service")),
@@ -987,9 +1049,17 @@ class BinaryConfig:
             retry_delay_seconds=data.get("retry_delay_seconds", 1.0),
         )
 
+    def get_build_environment(self) -> dict[str, str]:
+        """Get the process environment with this binary's overrides applied.
+
+        Built from the live os.environ on each call, once per build or test
+        run, so changes made earlier in the process are picked up.
+        """
+        return {**os.environ, **self.env}
+
     def get_expanded_install_path(self) -> Path:
         """Get install path with ~ expanded."""
-        return Path(os.path.expanduser(self.install_path))
+        return _expand_path(self.install_path)
 
     def get_install_directory(self) -> Path:
         """Get the directory containing the binary."""
@@ -1000,7 +1070,7 @@ class BinaryConfig:
         return ensure_install_path_exists(self.get_install_directory())
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackConfig:
     """Configuration for binary tracking operations."""
 
@@ -1013,6 +1083,7 @@ class TrackConfig:
     pre_commit_policy: PreCommitPolicy = PreCommitPolicy.WARN
     track_by: TrackingMethod = TrackingMethod.GIT_COMMIT
     parallel_builds: bool = True
+    parallel_codesign: bool = True
     max_workers: int = 4
     dry_run: bool = False
     verbose: bool = False
@@ -1066,6 +1137,7 @@ class TrackConfig:
             pre_commit_policy=policy,
             track_by=track_by,
             parallel_builds=data.get("parallel_builds", True),
+            parallel_codesign=data.get("parallel_codesign", True),
             max_workers=data.get("max_workers", 4),
             codesign=global_codesign,
             ensure_executable=global_ensure_executable,
@@ -1125,6 +1197,8 @@ class BuildManifest:
     records: dict[str, BuildRecord] = field(default_factory=dict)
     created_at: str = ""
     updated_at: str = ""
+    # Source content hashes keyed by path relative to the root: (mtime_ns, size, sha256)
+    file_hashes: dict[str, tuple[int, int, str]] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -1132,6 +1206,7 @@ class BuildManifest:
             "created_at": self.created_at,
             "updated_at": self.updated_at,
             "records": {name: record.to_dict() for name, record in self.records.items()},
+            "file_hashes": {path: list(entry) for path, entry in self.file_hashes.items()},
         }
 
     @classmethod
@@ -1140,10 +1215,16 @@ class BuildManifest:
         records = {}
         for name, record_data in data.get("records", {}).items():
             records[name] = BuildRecord.from_dict(record_data)
+        file_hashes = {
+            path: (int(entry[0]), int(entry[1]), str(entry[2]))
+            for path, entry in (data.get("file_hashes") or {}).items()
+            if isinstance(entry, list) and len(entry) == 3
+        }
         return cls(
             records=records,
             created_at=data.get("created_at", ""),
             updated_at=data.get("updated_at", ""),
+            file_hashes=file_hashes,
         )
 
 
@@ -1339,9 +1420,19 @@ class Colors:
         cls.GRAY = ""
 
 
+# Decide on colors at import so output written before the Logger exists,
+# such as config errors, is plain too; honors https://no-color.org
+if not sys.stdout.isatty() or "NO_COLOR" in os.environ or os.environ.get("TERM") == "dumb":
+    Colors.disable()
+
+
 class Logger:
     """Logger with colored output and verbosity levels."""
 
+    # Builds, status checks and signing log from worker threads; print()
+    # writes the text and the line ending separately, so serialize them
+    _lock = threading.Lock()
+
     def __init__(self, verbose: bool = False, quiet: bool = False, json_output: bool = False) -> None:
         self.verbose = verbose
         self.quiet = quiet
@@ -1349,40 +1440,119 @@ class Logger:
         if not sys.stdout.isatty() or json_output:
             Colors.disable()
 
+    def _print(self, line: str, file: IO[str] | None = None) -> None:
+        """Print one line without interleaving with other threads."""
+        with self._lock:
+            print(line, file=file)
+
     def info(self, message: str) -> None:
         """Print info message."""
         if not self.quiet and not self.json_output:
-            print(f"{Colors.BLUE}ℹ{Colors.RESET} {message}")
+            self._print(f"{Colors.BLUE}ℹ{Colors.RESET} {message}")
 
     def success(self, message: str) -> None:
         """Print success message."""
         if not self.quiet and not self.json_output:
-            print(f"{Colors.GREEN}✓{Colors.RESET} {message}")
+            self._print(f"{Colors.GREEN}✓{Colors.RESET} {message}")
 
     def warn(self, message: str) -> None:
         """Print warning message."""
         if not self.quiet and not self.json_output:
-            print(f"{Colors.YELLOW}⚠{Colors.RESET} {message}")
+            self._print(f"{Colors.YELLOW}⚠{Colors.RESET} {message}")
 
     def error(self, message: str) -> None:
         """Print error message."""
         if not self.json_output:
-            print(f"{Colors.RED}✗{Colors.RESET} {message}", file=sys.stderr)
+            self._print(f"{Colors.RED}✗{Colors.RESET} {message}", sys.stderr)
+
+    def is_debug_enabled(self) -> bool:
+        """Check whether debug messages are printed.
+
+        Call sites whose message is costly to build check this first.
+        """
+        return self.verbose and not self.quiet and not self.json_output
 
     def debug(self, message: str) -> None:
         """Print debug message (verbose only)."""
-        if self.verbose and not self.quiet and not self.json_output:
-            print(f"{Colors.GRAY}  {message}{Colors.RESET}")
+        if self.is_debug_enabled():
+            self._print(f"{Colors.GRAY}  {message}{Colors.RESET}")
 
     def header(self, message: str) -> None:
         """Print header message."""
         if not self.quiet and not self.json_output:
-            print(f"\n{Colors.BOLD}=== {message} ==={Colors.RESET}")
+            self._print(f"\n{Colors.BOLD}=== {message} ==={Colors.RESET}")
 
     def status_line(self, icon: str, color: str, name: str, detail: str) -> None:
         """Print a status line."""
         if not self.quiet and not self.json_output:
-            print(f"  {color}{icon}{Colors.RESET} {Colors.BOLD}{name}{Colors.RESET} {detail}")
+            self._print(f"  {color}{icon}{Colors.RESET} {Colors.BOLD}{name}{Colors.RESET} {detail}")
+
+
+def _config_cache_path(root_dir: Path) -> Path | None:
+    """Locate the config cache inside the git directory of root_dir.
+
+    Keeping it there leaves the working tree clean. Worktrees and submodules
+    have a .git file pointing at their git directory, which is followed without
+    starting git.
+
+    Returns:
+        The cache path, or None if root_dir is not the top of a git checkout.
+    """
+    git_path = root_dir / ".git"
+    if git_path.is_dir():
+        return git_path / CONFIG_CACHE_FILE
+    try:
+        pointer = git_path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    if not pointer.startswith("gitdir:"):
+        return None
+    return root_dir / pointer[len("gitdir:"):].strip() / CONFIG_CACHE_FILE
+
+
+def _read_config_yaml(full_path: Path, root_dir: Path) -> ConfigDict:
+    """Parse a YAML config file, going through the JSON config cache.
+
+    The cache holds the parsed document of the last file read, keyed by its
+    path, mtime and size. It is only written when the document survives a
+    JSON round trip unchanged and the file is older than the racy-mtime
+    window, so a stale entry cannot hide an edit made in the same tick.
+    Outside a git checkout the file is parsed every time.
+
+    Args:
+        full_path: Path to the YAML config file.
+        root_dir: Project root whose git directory holds the cache file.
+
+    Returns:
+        The parsed configuration.
+    """
+    st = full_path.stat()
+    key = {"path": str(full_path), "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+    cache_path = _config_cache_path(root_dir)
+
+    if cache_path is not None:
+        try:
+            cached = _load_json(cache_path.read_text(encoding="utf-8"))
+            if isinstance(cached, dict) and all(cached.get(k) == v for k, v in key.items()):
+                return cast(ConfigDict, cached["data"])
+        except (OSError, KeyError, ValueError):
+            pass
+
+    with open(full_path, encoding="utf-8") as f:
+        data = cast(ConfigDict, _load_yaml(f) or {})
+
+    if cache_path is not None and time.time_ns() - st.st_mtime_ns >= _RACY_MTIME_WINDOW_NS:
+        try:
+            text = _dump_json({**key, "data": data})
+            # YAML can express values JSON cannot (dates, non-string keys)
+            if _load_json(text)["data"] == data:
+                tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+                tmp_path.write_text(text, encoding="utf-8")
+                os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    return data
 
 
 def load_config_file(config_path: Path | None = None, root_dir: Path | None = None) -> ConfigDict:
@@ -1394,18 +1564,14 @@ def load_config_file(config_path: Path | None = None, root_dir: Path | None = No
     if config_path:
         full_path = root_dir / config_path
         if full_path.exists():
-            with open(full_path, encoding="utf-8") as f:
-                data: ConfigDict = yaml.safe_load(f) or {}
-                return data
+            return _read_config_yaml(full_path, root_dir)
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
     # Try default config file names
     for filename in CONFIG_FILE_NAMES:
         full_path = root_dir / filename
         if full_path.exists():
-            with open(full_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
-                return data
+            return _read_config_yaml(full_path, root_dir)
 
     return {}
 
@@ -1413,15 +1579,17 @@ def load_config_file(config_path: Path | None = None, root_dir: Path | None = No
 def load_env_config() -> ConfigDict:
     """Load configuration from environment variables."""
     config: ConfigDict = {}
+    env = os.environ
 
-    if os.environ.get("BINARY_TRACK_AUTO_REBUILD") == "true":
+    if env.get("BINARY_TRACK_AUTO_REBUILD") == "true":
         config["auto_rebuild"] = True
-    if os.environ.get("BINARY_TRACK_POLICY"):
-        config["pre_commit_policy"] = os.environ["BINARY_TRACK_POLICY"]
+    policy = env.get("BINARY_TRACK_POLICY")
+    if policy:
+        config["pre_commit_policy"] = policy
 
     # Codesigning environment variables
-    codesign_enabled = os.environ.get("BINARY_TRACK_CODESIGN") == "true"
-    codesign_identity = os.environ.get("BINARY_TRACK_CODESIGN_ID")
+    codesign_enabled = env.get("BINARY_TRACK_CODESIGN") == "true"
+    codesign_identity = env.get("BINARY_TRACK_CODESIGN_ID")
     if codesign_enabled or codesign_identity:
         config["codesign"] = {
             "enabled": codesign_enabled,
@@ -1432,15 +1600,84 @@ def load_env_config() -> ConfigDict:
     return config
 
 
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 timestamp with second precision."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
+
+
+def _dump_json(data: Any) -> str:
+    """Serialize data as indented JSON, using orjson when available."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(data, indent=2)
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
+def _emit_json(data: Any) -> None:
+    """Write data to stdout as indented JSON and a newline in a single write.
+
+    The encoded output goes straight to the binary buffer when stdout has
+    one, skipping the str round trip, and uses orjson when available.
+    """
+    try:
+        import orjson
+    except ImportError:
+        payload = (json.dumps(data, indent=2) + "\n").encode("utf-8")
+    else:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(payload.decode("utf-8"))
+        return
+    # Keep ordering with anything already written through the text layer
+    sys.stdout.flush()
+    buffer.write(payload)
+    buffer.flush()
+
+
+def _load_json(text: str) -> Any:
+    """Parse JSON text, using orjson when available."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(text)
+    return orjson.loads(text)
+
+
+# PyYAML is imported on first use: cached configs and JSON manifests never
+# need it, and importing it is a noticeable share of a hook run's startup
+def _load_yaml(stream: Any) -> Any:
+    """Parse YAML safely, with the libyaml-backed loader when available."""
+    import yaml
+
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def _dump_yaml(data: Any, stream: Any = None) -> Any:
+    """Emit block-style YAML in key order, with the libyaml-backed dumper when available."""
+    import yaml
+
+    return yaml.dump(
+        data,
+        stream,
+        Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+        default_flow_style=False,
+        sort_keys=False,
+    )
+
+
 def save_manifest(manifest: BuildManifest, root_dir: Path) -> None:
     """Save the build manifest to disk."""
-    manifest.updated_at = datetime.now(timezone.utc).isoformat()
+    manifest.updated_at = _now_iso()
     if not manifest.created_at:
         manifest.created_at = manifest.updated_at
 
+    manifest.file_hashes = _snapshot_file_hashes(root_dir)
+
     manifest_path = root_dir / BUILD_MANIFEST_FILE
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        yaml.dump(manifest.to_dict(), f, default_flow_style=False, sort_keys=False)
+    manifest_path.write_text(_dump_json(manifest.to_dict()), encoding="utf-8")
 
 
 def load_manifest(root_dir: Path) -> BuildManifest:
@@ -1450,12 +1687,24 @@ def load_manifest(root_dir: Path) -> BuildManifest:
         return BuildManifest()
 
     try:
-        with open(manifest_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-        return BuildManifest.from_dict(data)
-    except (yaml.YAMLError, KeyError):
+        text = manifest_path.read_text(encoding="utf-8")
+        try:
+            data = _load_json(text)
+        except ValueError:
+            # Manifests written by earlier versions are YAML
+            import yaml
+
+            try:
+                data = _load_yaml(text)
+            except yaml.YAMLError:
+                return BuildManifest()
+        manifest = BuildManifest.from_dict(data or {})
+    except (KeyError, TypeError, ValueError):
         return BuildManifest()
 
+    _seed_file_hashes(root_dir, manifest.file_hashes)
+    return manifest
+
 
 def get_git_root(path: Path) -> Path | None:
     """Get the git repository root."""
@@ -1528,15 +1777,15 @@ def get_commits_between(root_dir: Path, old_commit: str, new_commit: str) -> int
 def expand_patterns(root_dir: Path, patterns: list[str]) -> list[Path]:
     """Expand glob patterns to actual file paths."""
     files: list[Path] = []
+    # Overlapping patterns match the same paths again; a set keeps the
+    # duplicate check constant-time and stats each path only once
+    seen: set[Path] = set()
     for pattern in patterns:
-        # Handle ** for recursive matching
-        if "**" in pattern:
-            matched = list(root_dir.glob(pattern))
-        else:
-            matched = list(root_dir.glob(pattern))
-
-        for path in matched:
-            if path.is_file() and path not in files:
+        for path in root_dir.glob(pattern):
+            if path in seen:
+                continue
+            seen.add(path)
+            if path.is_file():
                 files.append(path)
 
     return files
@@ -1544,15 +1793,77 @@ def expand_patterns(root_dir: Path, patterns: list[str]) -> list[Path]:
 
 def compute_file_hash(file_path: Path, algorithm: str = "sha256") -> str:
     """Compute hash of file contents."""
-    hash_func = hashlib.new(algorithm)
     try:
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hash_func.update(chunk)
-        return hash_func.hexdigest()
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: the read loop runs in C, straight from the fd
+                return hashlib.file_digest(f, algorithm).hexdigest()
+
+            hash_func = hashlib.new(algorithm)
+            buffer = bytearray(HASH_READ_BUFFER)
+            view = memoryview(buffer)
+            while size := f.readinto(buffer):
+                hash_func.update(view[:size])
+            return hash_func.hexdigest()
+    except OSError:
+        return ""
+
+
+# Content hashes of source files keyed by absolute path: (mtime_ns, size, sha256).
+# Shared by status checks and rebuilds in a process, persisted in the manifest.
+_file_hash_cache: dict[str, tuple[int, int, str]] = {}
+_file_hash_cache_lock = threading.Lock()
+
+# Files modified this recently are not cached: a second write within the same
+# mtime tick would otherwise go unnoticed
+_RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+
+def _cached_file_hash(file_path: Path) -> str:
+    """Hash a file, reusing the cached hash while its mtime and size are unchanged."""
+    key = str(file_path)
+    try:
+        st = os.stat(file_path)
     except OSError:
+        with _file_hash_cache_lock:
+            _file_hash_cache.pop(key, None)
         return ""
 
+    with _file_hash_cache_lock:
+        entry = _file_hash_cache.get(key)
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2]
+
+    digest = compute_file_hash(file_path)
+    if digest and time.time_ns() - st.st_mtime_ns > _RACY_MTIME_WINDOW_NS:
+        with _file_hash_cache_lock:
+            _file_hash_cache[key] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+
+def _seed_file_hashes(root_dir: Path, file_hashes: dict[str, tuple[int, int, str]]) -> None:
+    """Load persisted hashes into the in-process cache, keeping fresher entries."""
+    with _file_hash_cache_lock:
+        for rel_path, entry in file_hashes.items():
+            _file_hash_cache.setdefault(str(root_dir / rel_path), entry)
+
+
+def _snapshot_file_hashes(root_dir: Path) -> dict[str, tuple[int, int, str]]:
+    """Collect cached hashes of files that still exist under root_dir, keyed relative to it."""
+    with _file_hash_cache_lock:
+        entries = list(_file_hash_cache.items())
+
+    snapshot: dict[str, tuple[int, int, str]] = {}
+    for key, entry in entries:
+        path = Path(key)
+        try:
+            rel_path = path.relative_to(root_dir)
+        except ValueError:
+            continue
+        if path.exists():
+            snapshot[str(rel_path)] = entry
+    return dict(sorted(snapshot.items()))
+
 
 def get_source_fingerprint(
     root_dir: Path, patterns: list[str], method: TrackingMethod
@@ -1568,10 +1879,14 @@ def get_source_fingerprint(
         return commit, {}, {}
 
     elif method == TrackingMethod.HASH:
-        hashes = {}
-        for f in files:
-            rel_path = str(f.relative_to(root_dir))
-            hashes[rel_path] = compute_file_hash(f)
+        # hashlib releases the GIL while hashing, so larger source sets are
+        # hashed across threads; small ones are not worth the pool
+        if len(files) > PARALLEL_HASH_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 4)) as executor:
+                digests = list(executor.map(_cached_file_hash, files))
+        else:
+            digests = [_cached_file_hash(f) for f in files]
+        hashes = {str(f.relative_to(root_dir)): digest for f, digest in zip(files, digests)}
         return "", hashes, {}
 
     elif method == TrackingMethod.MTIME:
@@ -1649,6 +1964,23 @@ def is_binary_stale(
     return False, "unknown tracking method", []
 
 
+def _is_executable(path: Path, st: os.stat_result) -> bool:
+    """Check if the current user can execute a path, given its stat result.
+
+    Mode bits settle the common cases (no execute bits at all, or execute
+    for everyone) without another syscall; mixed modes fall back to
+    os.access, which accounts for the user's ownership and groups.
+    """
+    if os.name == "nt":
+        return os.access(path, os.X_OK)
+    mode = st.st_mode & 0o111
+    if mode == 0:
+        return False
+    if mode == 0o111:
+        return True
+    return os.access(path, os.X_OK)
+
+
 def check_binary_health(binary_config: BinaryConfig) -> BinaryStatusResult:
     """Check the health status of a binary."""
     path = binary_config.get_expanded_install_path()
@@ -1671,12 +2003,14 @@ def check_binary_health(binary_config: BinaryConfig) -> BinaryStatusResult:
             path=conflict_path,
             scope=conflict_scope,
             binary_type=binary_config.binary_type,
-            is_executable=os.access(conflict_path, os.X_OK) if conflict_path.exists() else False,
+            is_executable=os.access(conflict_path, os.X_OK),
             description=description,
         ))
 
     # Check if file exists
-    if not path.exists():
+    try:
+        st = os.stat(path)
+    except OSError:
         result.status = BinaryStatus.MISSING
         result.message = f"Binary not found at {path}"
         return result
@@ -1684,7 +2018,7 @@ def check_binary_health(binary_config: BinaryConfig) -> BinaryStatusResult:
     result.exists = True
 
     # Check if executable
-    if not os.access(path, os.X_OK):
+    if not _is_executable(path, st):
         result.status = BinaryStatus.NOT_EXECUTABLE
         result.message = "Binary exists but is not executable"
         return result
@@ -1809,6 +2143,233 @@ def ensure_binary_executable(
 # Service Management Functions
 # =============================================================================
 
+def _tail(text: str, limit: int = 4096) -> str:
+    """Return at most the last `limit` characters of command output for messages."""
+    return text[-limit:] if len(text) > limit else text
+
+
+# Lazily-connected systemd manager object shared by all status checks, so a
+# batch of checks reuses one D-Bus connection instead of forking systemctl
+_systemd_bus: Any = None
+_systemd_bus_lock = threading.Lock()
+_systemd_bus_unavailable = False
+
+# Seconds to wait for each systemd D-Bus reply before falling back to systemctl
+_SYSTEMD_DBUS_TIMEOUT = 5.0
+
+
+def _get_systemd_bus() -> Any:
+    """Get the shared system D-Bus connection, or None if unavailable."""
+    global _systemd_bus, _systemd_bus_unavailable
+    with _systemd_bus_lock:
+        if _systemd_bus is None and not _systemd_bus_unavailable:
+            try:
+                import dbus
+
+                _systemd_bus = dbus.SystemBus()
+            except Exception:
+                # dbus-python not installed or no system bus (e.g. containers)
+                _systemd_bus_unavailable = True
+        return _systemd_bus
+
+
+def _systemctl_is_active_dbus(name: str) -> tuple[str, bool] | None:
+    """Query a systemd unit's state over D-Bus.
+
+    Args:
+        name: Unit name (".service" is assumed when no suffix is given)
+
+    Returns:
+        Tuple of (ActiveState, unit_not_found), or None if D-Bus can't be used
+        (including a call timing out) and the caller should fall back to systemctl
+    """
+    bus = _get_systemd_bus()
+    if bus is None:
+        return None
+
+    unit_name = name if "." in name else f"{name}.service"
+    try:
+        # Skip introspection: it is an extra round trip with dbus-python's
+        # default timeout, and the interfaces are named on every call anyway
+        systemd = bus.get_object("org.freedesktop.systemd1", "/org/freedesktop/systemd1", introspect=False)
+        unit_path = systemd.LoadUnit(
+            unit_name, dbus_interface="org.freedesktop.systemd1.Manager", timeout=_SYSTEMD_DBUS_TIMEOUT
+        )
+        unit = bus.get_object("org.freedesktop.systemd1", unit_path, introspect=False)
+        props = "org.freedesktop.DBus.Properties"
+        active_state = str(
+            unit.Get("org.freedesktop.systemd1.Unit", "ActiveState", dbus_interface=props, timeout=_SYSTEMD_DBUS_TIMEOUT)
+        )
+        load_state = str(
+            unit.Get("org.freedesktop.systemd1.Unit", "LoadState", dbus_interface=props, timeout=_SYSTEMD_DBUS_TIMEOUT)
+        )
+    except Exception:
+        # DBusException covers NoReply timeouts as well as missing services
+        return None
+    return active_state.lower(), load_state == "not-found"
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> str | None:
+    """Look up a system tool on PATH once per process."""
+    return shutil.which(name)
+
+
+def _resolve_executable(name: str) -> str:
+    """Resolve a command name to an absolute path, falling back to the name."""
+    return _which(name) or name
+
+
+def _run_service_command(cmd: list[str] | str, timeout: float) -> subprocess.CompletedProcess[str]:
+    """Run a service manager command, capturing its output.
+
+    Fixed-argv commands (launchctl, systemctl) are spawned with an absolute
+    executable path and close_fds=False, which lets CPython use posix_spawn()
+    instead of fork()+exec(). Descriptors Python opens are non-inheritable by
+    default, so this does not leak anything into the child.
+    """
+    if isinstance(cmd, str):
+        return subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=timeout)
+    return subprocess.run(
+        [_resolve_executable(cmd[0]), *cmd[1:]],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        close_fds=False,
+    )
+
+
+# Progressive verbs for service operations, used in log and error messages
+_SERVICE_OPERATION_VERBS = {"stop": "Stopping", "start": "Starting"}
+
+
+def _service_status_command(service_config: ServiceConfig) -> list[str] | str | None:
+    """Get the command that reports a service's status, or None if there is none."""
+    if service_config.service_type == ServiceType.LAUNCHD:
+        return ["launchctl", "list", service_config.name]
+    elif service_config.service_type == ServiceType.SYSTEMD:
+        return ["systemctl", "is-active", service_config.name]
+    elif service_config.service_type == ServiceType.CUSTOM:
+        return service_config.status_cmd or None
+    return None
+
+
+def _service_control_command(service_config: ServiceConfig, operation: str) -> list[str] | str | None:
+    """Get the command that stops or starts a service, or None if there is none."""
+    if service_config.service_type == ServiceType.LAUNCHD:
+        return ["launchctl", operation, service_config.name]
+    elif service_config.service_type == ServiceType.SYSTEMD:
+        return ["systemctl", operation, service_config.name]
+    elif service_config.service_type == ServiceType.CUSTOM:
+        return (service_config.stop_cmd if operation == "stop" else service_config.start_cmd) or None
+    return None
+
+
+def _apply_systemd_state(result: ServiceResult, name: str, state: str, not_found: bool) -> None:
+    """Fill in a status result from a systemd ActiveState."""
+    if state == "active":
+        result.status = ServiceStatus.RUNNING
+        result.success = True
+        result.message = "Service is running"
+    elif not_found:
+        result.status = ServiceStatus.NOT_FOUND
+        result.message = f"Service '{name}' not found"
+    elif state in ("inactive", "dead"):
+        result.status = ServiceStatus.STOPPED
+        result.message = "Service is stopped"
+    else:
+        result.status = ServiceStatus.UNKNOWN
+        result.message = f"Unknown status: {state}"
+
+
+def _apply_service_status(
+    result: ServiceResult,
+    service_config: ServiceConfig,
+    proc: subprocess.CompletedProcess[str],
+) -> None:
+    """Fill in a status result from the output of the status command."""
+    if service_config.service_type == ServiceType.SYSTEMD:
+        _apply_systemd_state(
+            result,
+            service_config.name,
+            proc.stdout.strip().lower(),
+            "could not be found" in proc.stderr.lower(),
+        )
+    elif proc.returncode == 0:
+        result.status = ServiceStatus.RUNNING
+        result.success = True
+        result.message = "Service is running"
+    elif service_config.service_type == ServiceType.LAUNCHD and "could not find service" in proc.stderr.lower():
+        result.status = ServiceStatus.NOT_FOUND
+        result.message = f"Service '{service_config.name}' not found"
+    else:
+        result.status = ServiceStatus.STOPPED
+        result.message = "Service is stopped"
+
+
+def _apply_service_error(result: ServiceResult, error: Exception, timeout: int, logger: Logger) -> None:
+    """Fill in a service result for a command that raised instead of completing."""
+    operation = result.operation
+    result.success = False
+    if isinstance(error, subprocess.TimeoutExpired):
+        if operation == "status":
+            result.message = "Status check timed out"
+        else:
+            result.message = f"{operation.capitalize()} timed out after {timeout}s"
+    elif isinstance(error, FileNotFoundError):
+        result.message = f"Service manager not found: {error}"
+    elif operation == "status":
+        result.message = f"Error checking status: {error}"
+    else:
+        result.message = f"Error {_SERVICE_OPERATION_VERBS[operation].lower()} service: {error}"
+
+    if operation == "status":
+        result.status = ServiceStatus.UNKNOWN
+    else:
+        logger.error(result.message)
+
+
+def _begin_service_operation(
+    service_config: ServiceConfig,
+    operation: str,
+    logger: Logger,
+    dry_run: bool,
+) -> tuple[ServiceResult, list[str] | str | None]:
+    """Create the result for a stop/start and resolve its command.
+
+    The returned command is None when the result is already final (service not
+    configured, dry run, or no command available).
+    """
+    result = ServiceResult(
+        name=service_config.name,
+        service_type=service_config.service_type,
+        status=ServiceStatus.UNKNOWN,
+        operation=operation,
+    )
+
+    if not service_config.enabled or not service_config.name:
+        result.success = True
+        result.message = "Service not configured, skipping"
+        return result, None
+
+    logger.info(f"{_SERVICE_OPERATION_VERBS[operation]} service '{service_config.name}'...")
+
+    if dry_run:
+        result.success = True
+        result.message = f"[DRY-RUN] Would {operation} service '{service_config.name}'"
+        logger.info(result.message)
+        return result, None
+
+    cmd = _service_control_command(service_config, operation)
+    if cmd is None:
+        result.success = False
+        if service_config.service_type == ServiceType.CUSTOM:
+            result.message = f"No {operation} command configured"
+            logger.error(result.message)
+        else:
+            result.message = "Unknown service type"
+    return result, cmd
+
 
 def get_service_status(
     service_config: ServiceConfig,
@@ -1835,98 +2396,33 @@ def get_service_status(
         result.message = "Service not configured"
         return result
 
-    start_time = time.time()
-
-    try:
-        if service_config.service_type == ServiceType.LAUNCHD:
-            # macOS launchd
-            proc = subprocess.run(
-                ["launchctl", "list", service_config.name],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            result.duration = time.time() - start_time
-
-            if proc.returncode == 0:
-                result.status = ServiceStatus.RUNNING
-                result.success = True
-                result.message = "Service is running"
-            else:
-                # Check if it's not found vs stopped
-                if "could not find service" in proc.stderr.lower():
-                    result.status = ServiceStatus.NOT_FOUND
-                    result.message = f"Service '{service_config.name}' not found"
-                else:
-                    result.status = ServiceStatus.STOPPED
-                    result.message = "Service is stopped"
-
-        elif service_config.service_type == ServiceType.SYSTEMD:
-            # Linux systemd
-            proc = subprocess.run(
-                ["systemctl", "is-active", service_config.name],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            result.duration = time.time() - start_time
-
-            status_output = proc.stdout.strip().lower()
-            if status_output == "active":
-                result.status = ServiceStatus.RUNNING
-                result.success = True
-                result.message = "Service is running"
-            elif status_output in ("inactive", "dead"):
-                result.status = ServiceStatus.STOPPED
-                result.message = "Service is stopped"
-            elif "could not be found" in proc.stderr.lower():
-                result.status = ServiceStatus.NOT_FOUND
-                result.message = f"Service '{service_config.name}' not found"
-            else:
-                result.status = ServiceStatus.UNKNOWN
-                result.message = f"Unknown status: {status_output}"
-
-        elif service_config.service_type == ServiceType.CUSTOM:
-            # Custom status command
-            if service_config.status_cmd:
-                proc = subprocess.run(
-                    service_config.status_cmd,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
-                result.duration = time.time() - start_time
-
-                if proc.returncode == 0:
-                    result.status = ServiceStatus.RUNNING
-                    result.success = True
-                    result.message = "Service is running"
-                else:
-                    result.status = ServiceStatus.STOPPED
-                    result.message = "Service is stopped"
-            else:
-                result.status = ServiceStatus.UNKNOWN
-                result.message = "No status command configured"
-
+    cmd = _service_status_command(service_config)
+    if cmd is None:
+        result.status = ServiceStatus.UNKNOWN
+        if service_config.service_type == ServiceType.CUSTOM:
+            result.message = "No status command configured"
         else:
-            result.status = ServiceStatus.UNKNOWN
             result.message = "Unknown service type"
+        return result
 
-    except subprocess.TimeoutExpired:
-        result.duration = time.time() - start_time
-        result.status = ServiceStatus.UNKNOWN
-        result.message = "Status check timed out"
+    start_time = time.monotonic()
 
-    except FileNotFoundError as e:
-        result.duration = time.time() - start_time
-        result.status = ServiceStatus.UNKNOWN
-        result.message = f"Service manager not found: {e}"
+    try:
+        # systemd: prefer D-Bus, fall back to systemctl
+        unit_state = None
+        if service_config.service_type == ServiceType.SYSTEMD:
+            unit_state = _systemctl_is_active_dbus(service_config.name)
+
+        if unit_state is not None:
+            _apply_systemd_state(result, service_config.name, *unit_state)
+        else:
+            proc = _run_service_command(cmd, 10)
+            _apply_service_status(result, service_config, proc)
+        result.duration = time.monotonic() - start_time
 
     except Exception as e:
-        result.duration = time.time() - start_time
-        result.status = ServiceStatus.UNKNOWN
-        result.message = f"Error checking status: {e}"
+        result.duration = time.monotonic() - start_time
+        _apply_service_error(result, e, 10, logger)
 
     return result
 
@@ -1946,68 +2442,15 @@ def stop_service(
     Returns:
         ServiceResult indicating success/failure
     """
-    result = ServiceResult(
-        name=service_config.name,
-        service_type=service_config.service_type,
-        status=ServiceStatus.UNKNOWN,
-        operation="stop",
-    )
-
-    if not service_config.enabled or not service_config.name:
-        result.success = True
-        result.message = "Service not configured, skipping"
-        return result
-
-    logger.info(f"Stopping service '{service_config.name}'...")
-
-    if dry_run:
-        result.success = True
-        result.message = f"[DRY-RUN] Would stop service '{service_config.name}'"
-        logger.info(result.message)
+    result, cmd = _begin_service_operation(service_config, "stop", logger, dry_run)
+    if cmd is None:
         return result
 
-    start_time = time.time()
+    start_time = time.monotonic()
 
     try:
-        cmd: list[str] | str
-
-        if service_config.service_type == ServiceType.LAUNCHD:
-            # macOS: launchctl stop
-            cmd = ["launchctl", "stop", service_config.name]
-        elif service_config.service_type == ServiceType.SYSTEMD:
-            # Linux: systemctl stop
-            cmd = ["systemctl", "stop", service_config.name]
-        elif service_config.service_type == ServiceType.CUSTOM:
-            if service_config.stop_cmd:
-                cmd = service_config.stop_cmd
-            else:
-                result.success = False
-                result.message = "No stop command configured"
-                logger.error(result.message)
-                return result
-        else:
-            result.success = False
-            result.message = "Unknown service type"
-            return result
-
-        # Execute stop command
-        if isinstance(cmd, list):
-            proc = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=service_config.stop_timeout_seconds,
-            )
-        else:
-            proc = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=service_config.stop_timeout_seconds,
-            )
-
-        result.duration = time.time() - start_time
+        proc = _run_service_command(cmd, service_config.stop_timeout_seconds)
+        result.duration = time.monotonic() - start_time
 
         if proc.returncode == 0:
             result.success = True
@@ -2016,34 +2459,38 @@ def stop_service(
             logger.success(result.message)
         else:
             result.success = False
-            result.message = f"Failed to stop service: {proc.stderr or proc.stdout}"
+            result.message = f"Failed to stop service: {_tail(proc.stderr or proc.stdout)}"
             logger.error(result.message)
 
-    except subprocess.TimeoutExpired:
-        result.duration = time.time() - start_time
-        result.success = False
-        result.message = f"Stop timed out after {service_config.stop_timeout_seconds}s"
-        logger.error(result.message)
-
-    except FileNotFoundError as e:
-        result.duration = time.time() - start_time
-        result.success = False
-        result.message = f"Service manager not found: {e}"
-        logger.error(result.message)
-
     except Exception as e:
-        result.duration = time.time() - start_time
-        result.success = False
-        result.message = f"Error stopping service: {e}"
-        logger.error(result.message)
+        result.duration = time.monotonic() - start_time
+        _apply_service_error(result, e, service_config.stop_timeout_seconds, logger)
 
     return result
 
 
-def start_service(
-    service_config: ServiceConfig,
+def _finish_start(
+    result: ServiceResult,
+    status: ServiceResult,
     logger: Logger,
-    dry_run: bool = False,
+) -> None:
+    """Fill in a start result from the status check that follows it."""
+    if status.status == ServiceStatus.RUNNING:
+        result.success = True
+        result.status = ServiceStatus.RUNNING
+        result.message = f"Service started in {result.duration:.1f}s"
+        logger.success(result.message)
+    else:
+        result.success = False
+        result.status = status.status
+        result.message = f"Service started but not running: {status.message}"
+        logger.warn(result.message)
+
+
+def start_service(
+    service_config: ServiceConfig,
+    logger: Logger,
+    dry_run: bool = False,
 ) -> ServiceResult:
     """Start a service.
 
@@ -2055,106 +2502,28 @@ def start_service(
     Returns:
         ServiceResult indicating success/failure
     """
-    result = ServiceResult(
-        name=service_config.name,
-        service_type=service_config.service_type,
-        status=ServiceStatus.UNKNOWN,
-        operation="start",
-    )
-
-    if not service_config.enabled or not service_config.name:
-        result.success = True
-        result.message = "Service not configured, skipping"
-        return result
-
-    logger.info(f"Starting service '{service_config.name}'...")
-
-    if dry_run:
-        result.success = True
-        result.message = f"[DRY-RUN] Would start service '{service_config.name}'"
-        logger.info(result.message)
+    result, cmd = _begin_service_operation(service_config, "start", logger, dry_run)
+    if cmd is None:
         return result
 
-    start_time = time.time()
+    start_time = time.monotonic()
 
     try:
-        cmd: list[str] | str
-
-        if service_config.service_type == ServiceType.LAUNCHD:
-            # macOS: launchctl start
-            cmd = ["launchctl", "start", service_config.name]
-        elif service_config.service_type == ServiceType.SYSTEMD:
-            # Linux: systemctl start
-            cmd = ["systemctl", "start", service_config.name]
-        elif service_config.service_type == ServiceType.CUSTOM:
-            if service_config.start_cmd:
-                cmd = service_config.start_cmd
-            else:
-                result.success = False
-                result.message = "No start command configured"
-                logger.error(result.message)
-                return result
-        else:
-            result.success = False
-            result.message = "Unknown service type"
-            return result
-
-        # Execute start command
-        if isinstance(cmd, list):
-            proc = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=service_config.start_timeout_seconds,
-            )
-        else:
-            proc = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=service_config.start_timeout_seconds,
-            )
-
-        result.duration = time.time() - start_time
+        proc = _run_service_command(cmd, service_config.start_timeout_seconds)
+        result.duration = time.monotonic() - start_time
 
         if proc.returncode == 0:
             # Give service a moment to start, then verify
             time.sleep(0.5)
-            status = get_service_status(service_config, logger)
-
-            if status.status == ServiceStatus.RUNNING:
-                result.success = True
-                result.status = ServiceStatus.RUNNING
-                result.message = f"Service started in {result.duration:.1f}s"
-                logger.success(result.message)
-            else:
-                result.success = False
-                result.status = status.status
-                result.message = f"Service started but not running: {status.message}"
-                logger.warn(result.message)
+            _finish_start(result, get_service_status(service_config, logger), logger)
         else:
             result.success = False
-            result.message = f"Failed to start service: {proc.stderr or proc.stdout}"
+            result.message = f"Failed to start service: {_tail(proc.stderr or proc.stdout)}"
             logger.error(result.message)
 
-    except subprocess.TimeoutExpired:
-        result.duration = time.time() - start_time
-        result.success = False
-        result.message = f"Start timed out after {service_config.start_timeout_seconds}s"
-        logger.error(result.message)
-
-    except FileNotFoundError as e:
-        result.duration = time.time() - start_time
-        result.success = False
-        result.message = f"Service manager not found: {e}"
-        logger.error(result.message)
-
     except Exception as e:
-        result.duration = time.time() - start_time
-        result.success = False
-        result.message = f"Error starting service: {e}"
-        logger.error(result.message)
+        result.duration = time.monotonic() - start_time
+        _apply_service_error(result, e, service_config.start_timeout_seconds, logger)
 
     return result
 
@@ -2207,26 +2576,121 @@ def restart_service(
     return result
 
 
-def _get_stop_command_hint(service_config: ServiceConfig) -> str:
+@functools.lru_cache(maxsize=512)
+def _get_stop_command_hint(service_type: ServiceType, name: str, stop_cmd: str | None) -> str:
     """Get a hint for how to manually stop the service."""
-    if service_config.service_type == ServiceType.LAUNCHD:
-        return f"launchctl stop {service_config.name}"
-    elif service_config.service_type == ServiceType.SYSTEMD:
-        return f"sudo systemctl stop {service_config.name}"
-    elif service_config.service_type == ServiceType.CUSTOM and service_config.stop_cmd:
-        return service_config.stop_cmd
-    return f"stop service '{service_config.name}'"
+    if service_type == ServiceType.LAUNCHD:
+        return f"launchctl stop {name}"
+    elif service_type == ServiceType.SYSTEMD:
+        return f"sudo systemctl stop {name}"
+    elif service_type == ServiceType.CUSTOM and stop_cmd:
+        return stop_cmd
+    return f"stop service '{name}'"
 
 
-def _get_start_command_hint(service_config: ServiceConfig) -> str:
+@functools.lru_cache(maxsize=512)
+def _get_start_command_hint(service_type: ServiceType, name: str, start_cmd: str | None) -> str:
     """Get a hint for how to manually start the service."""
-    if service_config.service_type == ServiceType.LAUNCHD:
-        return f"launchctl start {service_config.name}"
-    elif service_config.service_type == ServiceType.SYSTEMD:
-        return f"sudo systemctl start {service_config.name}"
-    elif service_config.service_type == ServiceType.CUSTOM and service_config.start_cmd:
-        return service_config.start_cmd
-    return f"start service '{service_config.name}'"
+    if service_type == ServiceType.LAUNCHD:
+        return f"launchctl start {name}"
+    elif service_type == ServiceType.SYSTEMD:
+        return f"sudo systemctl start {name}"
+    elif service_type == ServiceType.CUSTOM and start_cmd:
+        return start_cmd
+    return f"start service '{name}'"
+
+
+# A build failure rule: (keywords, reason, suggestion)
+_FailureRule = tuple[tuple[str, ...], BuildFailureReason, str]
+
+# A language-specific build failure rule: (keyword groups, reason, suggestion)
+_LanguageFailureRule = tuple[tuple[tuple[str, ...], ...], BuildFailureReason, str]
+
+
+# Generic build failure rules, checked in priority order after any
+# language-specific checks: (keywords, reason, suggestion). A rule matches if
+# any of its keywords appears in the lowercased build output.
+_TOOLING_FAILURE_RULES: tuple[_FailureRule, ...] = (
+    # Command not found (highest priority - tool isn't even installed)
+    (
+        ("command not found", "not recognized"),
+        BuildFailureReason.COMMAND_NOT_FOUND,
+        "Build tool not found. Ensure {tool} toolchain is installed and in PATH",
+    ),
+    # Permission denied (system-level issue)
+    (
+        ("permission denied",),
+        BuildFailureReason.PERMISSION_DENIED,
+        "Permission denied. Check file permissions or run with appropriate privileges",
+    ),
+)
+
+_GENERIC_FAILURE_RULES: tuple[_FailureRule, ...] = (
+    (
+        ("syntax error", "parse error", "unexpected token"),
+        BuildFailureReason.COMPILATION_ERROR,
+        "Syntax error in source code. Check the build output for line numbers",
+    ),
+    (
+        ("undefined reference", "unresolved symbol", "linker error"),
+        BuildFailureReason.LINKER_ERROR,
+        "Linker error. Verify library dependencies and link flags",
+    ),
+    # Missing files/dependencies (check after compilation errors)
+    (
+        ("cannot find", "no such file", "not found", "cannot open"),
+        BuildFailureReason.MISSING_DEPENDENCY,
+        "Missing file or dependency. Check that all required files exist and paths are correct",
+    ),
+)
+
+_C_FAILURE_RULES: tuple[_LanguageFailureRule, ...] = (
+    (
+        (("undefined reference", "unresolved external"),),
+        BuildFailureReason.LINKER_ERROR,
+        "Linker error. Check library paths and ensure all dependencies are linked",
+    ),
+    (
+        (("error:",),),
+        BuildFailureReason.COMPILATION_ERROR,
+        "C/C++ compilation error. Check syntax and include paths",
+    ),
+)
+
+# Language-specific rules, checked before the generic ones. Each rule holds
+# keyword groups that must all match, a group matching if any of its keywords
+# appears in the lowercased build output.
+_LANGUAGE_FAILURE_RULES: dict[str, tuple[_LanguageFailureRule, ...]] = {
+    "go": (
+        (
+            (("undefined:", "cannot refer to"),),
+            BuildFailureReason.COMPILATION_ERROR,
+            "Go compilation error. Check for undefined references or import issues",
+        ),
+    ),
+    "rust": (
+        (
+            (("error[e",),),
+            BuildFailureReason.COMPILATION_ERROR,
+            "Rust compilation error. Run 'cargo check' for detailed diagnostics",
+        ),
+    ),
+    "swift": (
+        (
+            (("error:",), ("swift",)),
+            BuildFailureReason.COMPILATION_ERROR,
+            "Swift compilation error. Check Xcode build logs for details",
+        ),
+    ),
+    "c": _C_FAILURE_RULES,
+    "cpp": _C_FAILURE_RULES,
+    "c++": _C_FAILURE_RULES,
+}
+
+
+def _search_any(texts: tuple[str, ...], keywords: tuple[str, ...]) -> bool:
+    """Check whether any keyword occurs in any text, stopping at the first hit."""
+    return any(keyword in text for text in texts for keyword in keywords)
 
 
 def categorize_build_failure(
@@ -2246,73 +2710,21 @@ def categorize_build_failure(
     Returns:
         Tuple of (BuildFailureReason, actionable suggestion string)
     """
-    output = (stderr + stdout).lower()
+    # Lowercase each stream on its own rather than a concatenated copy, which
+    # would hold the whole output in memory twice; empty streams are skipped
+    outputs = tuple(text.lower() for text in (stderr, stdout) if text)
 
-    # Command not found (highest priority - tool isn't even installed)
-    if "command not found" in output or "not recognized" in output:
-        tool = language or "build"
-        return (
-            BuildFailureReason.COMMAND_NOT_FOUND,
-            f"Build tool not found. Ensure {tool} toolchain is installed and in PATH",
-        )
+    for keywords, reason, suggestion in _TOOLING_FAILURE_RULES:
+        if _search_any(outputs, keywords):
+            return reason, suggestion.format(tool=language or "build")
 
-    # Permission denied (system-level issue)
-    if "permission denied" in output:
-        return (
-            BuildFailureReason.PERMISSION_DENIED,
-            "Permission denied. Check file permissions or run with appropriate privileges",
-        )
+    for keyword_groups, reason, suggestion in _LANGUAGE_FAILURE_RULES.get(language, ()):
+        if all(_search_any(outputs, keywords) for keywords in keyword_groups):
+            return reason, suggestion
 
-    # Language-specific compilation errors (check BEFORE generic patterns)
-    if language == "go":
-        if "undefined:" in output or "cannot refer to" in output:
-            return (
-                BuildFailureReason.COMPILATION_ERROR,
-                "Go compilation error. Check for undefined references or import issues",
-            )
-    elif language == "rust":
-        if "error[e" in output:
-            return (
-                BuildFailureReason.COMPILATION_ERROR,
-                "Rust compilation error. Run 'cargo check' for detailed diagnostics",
-            )
-    elif language == "swift":
-        if "error:" in output and "swift" in output:
-            return (
-                BuildFailureReason.COMPILATION_ERROR,
-                "Swift compilation error. Check Xcode build logs for details",
-            )
-    elif language in ("c", "cpp", "c++"):
-        if "undefined reference" in output or "unresolved external" in output:
-            return (
-                BuildFailureReason.LINKER_ERROR,
-                "Linker error. Check library paths and ensure all dependencies are linked",
-            )
-        if "error:" in output:
-            return (
-                BuildFailureReason.COMPILATION_ERROR,
-                "C/C++ compilation error. Check syntax and include paths",
-            )
-
-    # Generic compilation/linker patterns
-    if any(x in output for x in ["syntax error", "parse error", "unexpected token"]):
-        return (
-            BuildFailureReason.COMPILATION_ERROR,
-            "Syntax error in source code. Check the build output for line numbers",
-        )
-
-    if any(x in output for x in ["undefined reference", "unresolved symbol", "linker error"]):
-        return (
-            BuildFailureReason.LINKER_ERROR,
-            "Linker error. Verify library dependencies and link flags",
-        )
-
-    # Missing files/dependencies (check after compilation errors)
-    if any(x in output for x in ["cannot find", "no such file", "not found", "cannot open"]):
-        return (
-            BuildFailureReason.MISSING_DEPENDENCY,
-            "Missing file or dependency. Check that all required files exist and paths are correct",
-        )
+    for keywords, reason, suggestion in _GENERIC_FAILURE_RULES:
+        if _search_any(outputs, keywords):
+            return reason, suggestion
 
     return (
         BuildFailureReason.UNKNOWN,
@@ -2320,6 +2732,127 @@ def categorize_build_failure(
     )
 
 
+def _drain_stream(stream: IO[str], sink: deque[str], logger: Logger) -> None:
+    """Read a pipe line by line into a bounded buffer, echoing each line as debug output."""
+    echo = logger.is_debug_enabled()
+    for line in iter(stream.readline, ""):
+        sink.append(line)
+        if echo:
+            logger.debug(line.rstrip("\n"))
+    stream.close()
+
+
+def _wait_for_exit(proc: subprocess.Popen[str], timeout: float) -> int:
+    """Wait for a child process to exit, sleeping in the kernel where possible.
+
+    Popen.wait(timeout=...) polls waitpid() with a sleep backoff of up to 50ms.
+    On Linux a pidfd becomes readable when the child exits, so a single
+    blocking select() wakes up as soon as the build finishes.
+
+    Raises:
+        subprocess.TimeoutExpired: If the process does not exit in time
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        return proc.wait(timeout=timeout)
+    try:
+        pidfd = pidfd_open(proc.pid)
+    except OSError:
+        # Kernel without pidfd support (< 5.3) or seccomp restrictions
+        return proc.wait(timeout=timeout)
+
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(pidfd, selectors.EVENT_READ)
+            if not selector.select(timeout):
+                raise subprocess.TimeoutExpired(proc.args, timeout)
+    finally:
+        os.close(pidfd)
+    return proc.wait()
+
+
+# How long to wait for output readers once a timed-out command is killed; a
+# descendant that left the process group can keep the pipes open forever
+_READER_JOIN_TIMEOUT = 1.0
+
+
+def _kill_process_group(proc: subprocess.Popen[str]) -> None:
+    """Kill a command started in its own session along with its descendants."""
+    killpg = getattr(os, "killpg", None)
+    if killpg is not None:
+        try:
+            killpg(proc.pid, signal.SIGKILL)
+            return
+        except OSError:
+            pass
+    proc.kill()
+
+
+def run_streaming_command(
+    cmd: str,
+    cwd: Path,
+    env: dict[str, str],
+    timeout: float,
+    logger: Logger,
+) -> subprocess.CompletedProcess[str]:
+    """Run a shell command, streaming its output instead of buffering it whole.
+
+    Output is forwarded to the logger line by line as it is produced (visible in
+    verbose mode), and only the last OUTPUT_TAIL_LINES lines of each stream are
+    retained, so memory stays bounded even for very chatty builds.
+
+    Args:
+        cmd: Shell command to run
+        cwd: Working directory
+        env: Environment for the child process
+        timeout: Seconds to wait before killing the command
+        logger: Logger instance for live output
+
+    Returns:
+        CompletedProcess with the retained tail of stdout and stderr
+
+    Raises:
+        subprocess.TimeoutExpired: If the command does not finish in time
+    """
+    # A session of its own lets a timeout kill everything the shell started,
+    # not just the shell
+    proc = subprocess.Popen(
+        cmd,
+        shell=True,
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=PIPE_READ_BUFFER,
+        text=True,
+        start_new_session=True,
+    )
+    assert proc.stdout is not None and proc.stderr is not None
+
+    stdout_tail: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    stderr_tail: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    readers = [
+        threading.Thread(target=_drain_stream, args=(proc.stdout, stdout_tail, logger), daemon=True),
+        threading.Thread(target=_drain_stream, args=(proc.stderr, stderr_tail, logger), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    try:
+        returncode = _wait_for_exit(proc, timeout)
+    except subprocess.TimeoutExpired:
+        _kill_process_group(proc)
+        proc.wait()
+        for reader in readers:
+            reader.join(_READER_JOIN_TIMEOUT)
+        raise
+
+    for reader in readers:
+        reader.join()
+
+    return subprocess.CompletedProcess(cmd, returncode, "".join(stdout_tail), "".join(stderr_tail))
+
+
 def run_test_command(
     binary_config: BinaryConfig,
     config: TrackConfig,
@@ -2345,22 +2878,19 @@ def run_test_command(
     logger.info(f"Running tests for {binary_config.name}...")
     logger.debug(f"Test command: {binary_config.test_cmd}")
 
-    env = os.environ.copy()
-    env.update(binary_config.env)
+    env = binary_config.get_build_environment()
     working_dir = config.root_dir / binary_config.working_dir
 
-    start_time = time.time()
+    start_time = time.monotonic()
     try:
-        proc = subprocess.run(
+        proc = run_streaming_command(
             binary_config.test_cmd,
-            shell=True,
-            cwd=working_dir,
-            env=env,
-            capture_output=True,
-            text=True,
-            timeout=binary_config.test_timeout,
+            working_dir,
+            env,
+            binary_config.test_timeout,
+            logger,
         )
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
 
         if proc.returncode == 0:
             logger.success(f"Tests passed in {duration:.1f}s")
@@ -2371,16 +2901,178 @@ def run_test_command(
             return False, output, duration
 
     except subprocess.TimeoutExpired:
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         logger.error(f"Tests timed out after {binary_config.test_timeout}s")
         return False, f"Test timed out after {binary_config.test_timeout}s", duration
 
     except Exception as e:
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
         logger.error(f"Test error: {e}")
         return False, str(e), duration
 
 
+def _run_build_attempt(
+    binary_config: BinaryConfig,
+    result: RebuildResult,
+    env: dict[str, str],
+    working_dir: Path,
+    logger: Logger,
+) -> tuple[bool, str, str]:
+    """Run the build command once, recording the outcome on the result.
+
+    Returns:
+        Tuple of (succeeded, error, retry_warning); error and retry_warning
+        are empty when the build succeeded
+    """
+    logger.debug(f"Command: {binary_config.build_cmd}")
+
+    start_time = time.monotonic()
+    try:
+        proc = run_streaming_command(
+            binary_config.build_cmd,
+            working_dir,
+            env,
+            binary_config.timeout,
+            logger,
+        )
+        duration = time.monotonic() - start_time
+        result.duration = duration
+        result.exit_code = proc.returncode
+
+        if proc.returncode == 0:
+            result.status = RebuildStatus.SUCCESS
+            result.message = f"Built in {duration:.1f}s"
+            result.output = proc.stdout
+            logger.success(f"Rebuilt {binary_config.name} in {duration:.1f}s")
+            return True, "", ""
+
+        # Build failed
+        stderr = proc.stderr or ""
+        stdout = proc.stdout or ""
+        result.output = stderr or stdout
+        error = f"Build failed with exit code {proc.returncode}"
+
+        # Categorize the failure
+        failure_reason, suggestion = categorize_build_failure(
+            proc.returncode, stderr, stdout, binary_config.language
+        )
+        result.failure_reason = failure_reason
+        result.suggestion = suggestion
+        return False, error, f"Build failed, will retry: {error}"
+
+    except subprocess.TimeoutExpired:
+        result.duration = time.monotonic() - start_time
+        result.failure_reason = BuildFailureReason.TIMEOUT
+        result.suggestion = f"Build exceeded {binary_config.timeout}s timeout. Consider increasing 'timeout' setting"
+        return False, f"Build timed out after {binary_config.timeout}s", "Build timed out, will retry"
+
+    except Exception as e:
+        result.duration = time.monotonic() - start_time
+        result.failure_reason = BuildFailureReason.UNKNOWN
+        result.suggestion = "Unexpected error. Check system logs and build environment"
+        return False, str(e), f"Build error, will retry: {e}"
+
+
+def _finish_successful_build(
+    binary_config: BinaryConfig,
+    config: TrackConfig,
+    manifest: BuildManifest,
+    logger: Logger,
+    result: RebuildResult,
+    service_was_running: bool,
+) -> None:
+    """Run the post-build steps and record the build in the manifest.
+
+    Sets permissions, runs tests, codesigns and restarts the service as
+    configured while the sources are fingerprinted in parallel. A failing
+    test downgrades the result to TEST_FAILED.
+    """
+    service_config = binary_config.service
+    restart_service_after = service_config.enabled and service_was_running and service_config.restart_after_build
+
+    # Fingerprint the sources once, in the background: hashing only reads the
+    # sources, so it overlaps with the tests and codesign below, which all
+    # act on the installed binary and must stay in order
+    executor = ThreadPoolExecutor(max_workers=1)
+    fingerprint_future = executor.submit(
+        get_source_fingerprint, config.root_dir, binary_config.source_patterns, config.track_by
+    )
+    executor.shutdown(wait=False)
+
+    # Ensure executable permissions if enabled
+    if binary_config.ensure_executable:
+        binary_path = binary_config.get_expanded_install_path()
+        if not ensure_binary_executable(binary_path, logger, config.dry_run):
+            result.output += "\nWarning: Could not set executable permissions"
+
+    # Run tests if configured
+    if binary_config.test_cmd:
+        test_success, test_output, test_duration = run_test_command(
+            binary_config, config, logger
+        )
+        result.test_output = test_output
+        result.test_duration = test_duration
+
+        if not test_success:
+            result.status = RebuildStatus.TEST_FAILED
+            result.failure_reason = BuildFailureReason.TEST_FAILED
+            result.message = f"Build succeeded but tests failed"
+            result.suggestion = "Review test output and fix failing tests"
+
+            # Still restart service even if tests failed (binary was built)
+            if restart_service_after:
+                start_result = start_service(service_config, logger, config.dry_run)
+                result.service_started = start_result.success
+                result.service_status = start_result.status
+
+            # Record failed test in manifest
+            current_commit, current_hashes, current_mtimes = fingerprint_future.result()
+            manifest.records[binary_config.name] = BuildRecord(
+                binary_name=binary_config.name,
+                built_at=_now_iso(),
+                source_commit=current_commit,
+                source_hashes=current_hashes,
+                source_mtimes=current_mtimes,
+                build_duration=result.duration,
+                success=False,
+                error=f"Tests failed: {test_output[:200]}",
+            )
+            return
+
+    # Codesign if enabled
+    if binary_config.codesign.enabled:
+        cs_result = codesign_binary(binary_config, config, logger)
+        if cs_result.status == CodesignStatus.FAILED:
+            result.output += f"\nCodesign warning: {cs_result.message}"
+
+    # Restart service if it was running and restart is enabled
+    if restart_service_after:
+        start_result = start_service(service_config, logger, config.dry_run)
+        result.service_started = start_result.success
+        result.service_status = start_result.status
+
+        if not start_result.success:
+            # Build succeeded but service failed to restart
+            result.output += f"\nWarning: Service restart failed: {start_result.message}"
+            logger.warn(f"Build succeeded but service restart failed")
+            start_hint = _get_start_command_hint(
+                service_config.service_type, service_config.name, service_config.start_cmd
+            )
+            logger.info(f"  💡 Start manually: {start_hint}")
+
+    # Update manifest with success
+    current_commit, current_hashes, current_mtimes = fingerprint_future.result()
+    manifest.records[binary_config.name] = BuildRecord(
+        binary_name=binary_config.name,
+        built_at=_now_iso(),
+        source_commit=current_commit,
+        source_hashes=current_hashes,
+        source_mtimes=current_mtimes,
+        build_duration=result.duration,
+        success=True,
+    )
+
+
 def rebuild_binary(
     binary_config: BinaryConfig,
     config: TrackConfig,
@@ -2440,164 +3132,34 @@ def rebuild_binary(
             result.status = RebuildStatus.FAILED
             result.failure_reason = BuildFailureReason.SERVICE_STOP_FAILED
             result.message = f"Failed to stop service: {stop_result.message}"
-            result.suggestion = f"Manually stop the service with: {_get_stop_command_hint(service_config)}"
+            stop_hint = _get_stop_command_hint(
+                service_config.service_type, service_config.name, service_config.stop_cmd
+            )
+            result.suggestion = f"Manually stop the service with: {stop_hint}"
             logger.error(result.message)
             return result
 
     # Prepare environment
-    env = os.environ.copy()
-    env.update(binary_config.env)
+    env = binary_config.get_build_environment()
     working_dir = config.root_dir / binary_config.working_dir
 
-    # Retry loop
     max_attempts = binary_config.retry_count + 1
-    last_error = ""
+    logger.info(f"Rebuilding {binary_config.name}...")
+    succeeded, last_error, retry_warning = _run_build_attempt(binary_config, result, env, working_dir, logger)
 
-    for attempt in range(max_attempts):
+    # Retries are opt-in; the default single attempt never enters this loop
+    attempt = 1
+    while not succeeded and attempt < max_attempts:
+        logger.warn(retry_warning)
         result.retry_attempt = attempt
+        logger.info(f"Retrying {binary_config.name} (attempt {attempt + 1}/{max_attempts})...")
+        time.sleep(binary_config.retry_delay_seconds)
+        succeeded, last_error, retry_warning = _run_build_attempt(binary_config, result, env, working_dir, logger)
+        attempt += 1
 
-        if attempt > 0:
-            logger.info(f"Retrying {binary_config.name} (attempt {attempt + 1}/{max_attempts})...")
-            time.sleep(binary_config.retry_delay_seconds)
-        else:
-            logger.info(f"Rebuilding {binary_config.name}...")
-
-        logger.debug(f"Command: {binary_config.build_cmd}")
-
-        start_time = time.time()
-        try:
-            proc = subprocess.run(
-                binary_config.build_cmd,
-                shell=True,
-                cwd=working_dir,
-                env=env,
-                capture_output=True,
-                text=True,
-                timeout=binary_config.timeout,
-            )
-            duration = time.time() - start_time
-            result.duration = duration
-            result.exit_code = proc.returncode
-
-            if proc.returncode == 0:
-                result.status = RebuildStatus.SUCCESS
-                result.message = f"Built in {duration:.1f}s"
-                result.output = proc.stdout
-                logger.success(f"Rebuilt {binary_config.name} in {duration:.1f}s")
-
-                # Ensure executable permissions if enabled
-                if binary_config.ensure_executable:
-                    binary_path = binary_config.get_expanded_install_path()
-                    if not ensure_binary_executable(binary_path, logger, config.dry_run):
-                        result.output += "\nWarning: Could not set executable permissions"
-
-                # Run tests if configured
-                if binary_config.test_cmd:
-                    test_success, test_output, test_duration = run_test_command(
-                        binary_config, config, logger
-                    )
-                    result.test_output = test_output
-                    result.test_duration = test_duration
-
-                    if not test_success:
-                        result.status = RebuildStatus.TEST_FAILED
-                        result.failure_reason = BuildFailureReason.TEST_FAILED
-                        result.message = f"Build succeeded but tests failed"
-                        result.suggestion = "Review test output and fix failing tests"
-
-                        # Still restart service even if tests failed (binary was built)
-                        if service_config.enabled and service_was_running and service_config.restart_after_build:
-                            start_result = start_service(service_config, logger, config.dry_run)
-                            result.service_started = start_result.success
-                            result.service_status = start_result.status
-
-                        # Record failed test in manifest
-                        current_commit, current_hashes, current_mtimes = get_source_fingerprint(
-                            config.root_dir, binary_config.source_patterns, config.track_by
-                        )
-                        manifest.records[binary_config.name] = BuildRecord(
-                            binary_name=binary_config.name,
-                            built_at=datetime.now(timezone.utc).isoformat(),
-                            source_commit=current_commit,
-                            source_hashes=current_hashes,
-                            source_mtimes=current_mtimes,
-                            build_duration=duration,
-                            success=False,
-                            error=f"Tests failed: {test_output[:200]}",
-                        )
-                        return result
-
-                # Codesign if enabled
-                if binary_config.codesign.enabled:
-                    cs_result = codesign_binary(binary_config, config, logger)
-                    if cs_result.status == CodesignStatus.FAILED:
-                        result.output += f"\nCodesign warning: {cs_result.message}"
-
-                # Restart service if it was running and restart is enabled
-                if service_config.enabled and service_was_running and service_config.restart_after_build:
-                    start_result = start_service(service_config, logger, config.dry_run)
-                    result.service_started = start_result.success
-                    result.service_status = start_result.status
-
-                    if not start_result.success:
-                        # Build succeeded but service failed to restart
-                        result.output += f"\nWarning: Service restart failed: {start_result.message}"
-                        logger.warn(f"Build succeeded but service restart failed")
-                        logger.info(f"  💡 Start manually: {_get_start_command_hint(service_config)}")
-
-                # Update manifest with success
-                current_commit, current_hashes, current_mtimes = get_source_fingerprint(
-                    config.root_dir, binary_config.source_patterns, config.track_by
-                )
-                manifest.records[binary_config.name] = BuildRecord(
-                    binary_name=binary_config.name,
-                    built_at=datetime.now(timezone.utc).isoformat(),
-                    source_commit=current_commit,
-                    source_hashes=current_hashes,
-                    source_mtimes=current_mtimes,
-                    build_duration=duration,
-                    success=True,
-                )
-                return result
-
-            else:
-                # Build failed
-                stderr = proc.stderr or ""
-                stdout = proc.stdout or ""
-                result.output = stderr or stdout
-                result.exit_code = proc.returncode
-                last_error = f"Build failed with exit code {proc.returncode}"
-
-                # Categorize the failure
-                failure_reason, suggestion = categorize_build_failure(
-                    proc.returncode, stderr, stdout, binary_config.language
-                )
-                result.failure_reason = failure_reason
-                result.suggestion = suggestion
-
-                if attempt < max_attempts - 1:
-                    logger.warn(f"Build failed, will retry: {last_error}")
-                    continue
-
-        except subprocess.TimeoutExpired:
-            result.duration = time.time() - start_time
-            result.failure_reason = BuildFailureReason.TIMEOUT
-            result.suggestion = f"Build exceeded {binary_config.timeout}s timeout. Consider increasing 'timeout' setting"
-            last_error = f"Build timed out after {binary_config.timeout}s"
-
-            if attempt < max_attempts - 1:
-                logger.warn(f"Build timed out, will retry")
-                continue
-
-        except Exception as e:
-            result.duration = time.time() - start_time
-            result.failure_reason = BuildFailureReason.UNKNOWN
-            result.suggestion = "Unexpected error. Check system logs and build environment"
-            last_error = str(e)
-
-            if attempt < max_attempts - 1:
-                logger.warn(f"Build error, will retry: {e}")
-                continue
+    if succeeded:
+        _finish_successful_build(binary_config, config, manifest, logger, result, service_was_running)
+        return result
 
     # All attempts failed
     result.status = RebuildStatus.FAILED
@@ -2607,17 +3169,13 @@ def rebuild_binary(
     if result.suggestion:
         logger.info(f"  💡 Suggestion: {result.suggestion}")
 
-    if result.output and config.verbose:
-        for line in result.output.strip().split("\n")[:20]:  # Limit output
-            logger.debug(f"  {line}")
-
     # Record failure in manifest
     current_commit, current_hashes, current_mtimes = get_source_fingerprint(
         config.root_dir, binary_config.source_patterns, config.track_by
     )
     manifest.records[binary_config.name] = BuildRecord(
         binary_name=binary_config.name,
-        built_at=datetime.now(timezone.utc).isoformat(),
+        built_at=_now_iso(),
         source_commit=current_commit,
         source_hashes=current_hashes,
         source_mtimes=current_mtimes,
@@ -2629,9 +3187,22 @@ def rebuild_binary(
     return result
 
 
+# First "Authority=" line of `codesign -d` output, or the ad-hoc marker
+_CODESIGN_IDENTITY_RE = re.compile(r"^Authority=(.*)$|signed with a", re.MULTILINE | re.IGNORECASE)
+
+
 def is_codesign_available() -> bool:
     """Check if codesign tool is available (macOS only)."""
-    return shutil.which(get_codesign_binary()) is not None
+    return _which(get_codesign_binary()) is not None
+
+
+def _parse_codesign_identity(display_output: bytes) -> str:
+    """Extract the signing identity from ``codesign -d`` output."""
+    # Extract identity from whichever line comes first
+    match = _CODESIGN_IDENTITY_RE.search(display_output.decode("utf-8", "replace"))
+    if not match:
+        return ""
+    return match.group(1) if match.group(1) is not None else "ad-hoc"
 
 
 def verify_signature(binary_path: Path, logger: Logger) -> CodesignResult:
@@ -2652,40 +3223,39 @@ def verify_signature(binary_path: Path, logger: Logger) -> CodesignResult:
         return result
 
     try:
-        # Check if signed
-        proc = subprocess.run(
-            [get_codesign_binary(), "-v", "--verbose=2", str(binary_path)],
-            capture_output=True,
-            text=True,
-        )
+        # codesign cannot verify and display in one invocation (alongside -d,
+        # -v only raises verbosity), so launch both at once rather than
+        # paying for two process startups back to back
+        codesign = get_codesign_binary()
+        with subprocess.Popen(
+            [codesign, "-v", "--verbose=2", str(binary_path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        ) as proc, subprocess.Popen(
+            [codesign, "-d", "--verbose=2", str(binary_path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        ) as display_proc:
+            _, verify_stderr = proc.communicate()
+            _, display_stderr = display_proc.communicate()
+
+        # codesign reports on stderr; the display output is only decoded if used
+        verify_output = verify_stderr.decode("utf-8", "replace")
 
         if proc.returncode == 0:
+            result.identity = _parse_codesign_identity(display_stderr)
             result.status = CodesignStatus.VALID
             result.message = "Valid signature"
-            result.details = proc.stderr.strip()  # codesign outputs to stderr
-
-            # Extract identity
-            display_proc = subprocess.run(
-                [get_codesign_binary(), "-d", "--verbose=2", str(binary_path)],
-                capture_output=True,
-                text=True,
-            )
-            for line in display_proc.stderr.split("\n"):
-                if line.startswith("Authority="):
-                    result.identity = line.split("=", 1)[1]
-                    break
-                elif "signed with a" in line.lower():
-                    result.identity = "ad-hoc"
-                    break
+            result.details = verify_output.strip()
         else:
             # Check if unsigned or invalid
-            if "not signed" in proc.stderr.lower():
+            if "not signed" in verify_output.lower():
                 result.status = CodesignStatus.UNSIGNED
                 result.message = "Binary is not signed"
             else:
                 result.status = CodesignStatus.INVALID
                 result.message = "Invalid signature"
-                result.details = proc.stderr.strip()
+                result.details = verify_output.strip()
 
     except Exception as e:
         result.status = CodesignStatus.FAILED
@@ -2694,6 +3264,26 @@ def verify_signature(binary_path: Path, logger: Logger) -> CodesignResult:
     return result
 
 
+# Upper bound on the combined length of the paths passed to one codesign call
+_CODESIGN_BATCH_ARG_CHARS = 10_000
+
+
+def _codesign_flags(cs_config: CodesignConfig) -> list[str]:
+    """Build the codesign signing flags for a configuration, without paths."""
+    flags = ["-s", cs_config.identity]
+
+    if cs_config.force:
+        flags.append("-f")
+
+    if cs_config.options:
+        flags.append(f"--options={','.join(cs_config.options)}")
+
+    if cs_config.entitlements:
+        flags.append(f"--entitlements={_expand_path(cs_config.entitlements)}")
+
+    return flags
+
+
 def codesign_binary(
     binary_config: BinaryConfig,
     config: TrackConfig,
@@ -2741,32 +3331,20 @@ def codesign_binary(
     logger.info(f"Signing {binary_config.name}...")
 
     # Build codesign command
-    cmd = [get_codesign_binary(), "-s", cs_config.identity]
-
-    if cs_config.force:
-        cmd.append("-f")
-
-    if cs_config.options:
-        cmd.append(f"--options={','.join(cs_config.options)}")
-
     if cs_config.entitlements:
-        entitlements_path = Path(os.path.expanduser(cs_config.entitlements))
+        entitlements_path = _expand_path(cs_config.entitlements)
         if not entitlements_path.exists():
             result.status = CodesignStatus.FAILED
             result.message = f"Entitlements file not found: {entitlements_path}"
             return result
-        cmd.append(f"--entitlements={entitlements_path}")
 
-    cmd.append(str(binary_path))
+    cmd = [get_codesign_binary(), *_codesign_flags(cs_config), str(binary_path)]
 
-    logger.debug(f"Command: {' '.join(cmd)}")
+    if logger.is_debug_enabled():
+        logger.debug(f"Command: {' '.join(cmd)}")
 
     try:
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-        )
+        proc = subprocess.run(cmd, capture_output=True)
 
         if proc.returncode == 0:
             result.status = CodesignStatus.SIGNED
@@ -2774,9 +3352,10 @@ def codesign_binary(
             result.message = "Successfully signed"
             logger.success(f"Signed {binary_config.name} with identity '{cs_config.identity}'")
         else:
+            stderr = proc.stderr.decode("utf-8", "replace")
             result.status = CodesignStatus.FAILED
-            result.message = f"codesign failed: {proc.stderr.strip()}"
-            result.details = proc.stderr
+            result.message = f"codesign failed: {stderr.strip()}"
+            result.details = stderr
             logger.error(f"Failed to sign {binary_config.name}: {result.message}")
 
     except Exception as e:
@@ -2787,6 +3366,88 @@ def codesign_binary(
     return result
 
 
+def _plan_codesign_batches(to_sign: list[BinaryConfig], dry_run: bool) -> list[list[BinaryConfig]]:
+    """Group binaries that can be signed by one codesign invocation.
+
+    Binaries sharing the same signing flags are batched, capped by the
+    combined length of their paths. Only forced signing is batched so that
+    a failed batch can be retried per binary; binaries that codesign_binary
+    would reject up front, and every binary in a dry run, are signed alone.
+    """
+    batches: list[list[BinaryConfig]] = []
+    groups: dict[tuple[str, ...], list[BinaryConfig]] = {}
+
+    for binary_config in to_sign:
+        cs_config = binary_config.codesign
+        batchable = (
+            not dry_run
+            and cs_config.force
+            and binary_config.get_expanded_install_path().exists()
+            and (not cs_config.entitlements or _expand_path(cs_config.entitlements).exists())
+        )
+        if batchable:
+            groups.setdefault(tuple(_codesign_flags(cs_config)), []).append(binary_config)
+        else:
+            batches.append([binary_config])
+
+    for members in groups.values():
+        batch: list[BinaryConfig] = []
+        batch_chars = 0
+        for binary_config in members:
+            path_chars = len(str(binary_config.get_expanded_install_path())) + 1
+            if batch and batch_chars + path_chars > _CODESIGN_BATCH_ARG_CHARS:
+                batches.append(batch)
+                batch, batch_chars = [], 0
+            batch.append(binary_config)
+            batch_chars += path_chars
+        batches.append(batch)
+
+    return batches
+
+
+def _sign_batch(batch: list[BinaryConfig], config: TrackConfig, logger: Logger) -> list[CodesignResult]:
+    """Sign a batch of binaries with one codesign call, retrying one by one on failure."""
+    if len(batch) == 1:
+        return [codesign_binary(batch[0], config, logger)]
+
+    cs_config = batch[0].codesign
+    logger.info(f"Signing {', '.join(bc.name for bc in batch)}...")
+
+    cmd = [
+        get_codesign_binary(),
+        *_codesign_flags(cs_config),
+        *(str(bc.get_expanded_install_path()) for bc in batch),
+    ]
+    if logger.is_debug_enabled():
+        logger.debug(f"Command: {' '.join(cmd)}")
+
+    try:
+        proc = subprocess.run(cmd, capture_output=True)
+    except OSError as e:
+        logger.debug(f"Batch signing error: {e}")
+    else:
+        if proc.returncode == 0:
+            results: list[CodesignResult] = []
+            for binary_config in batch:
+                results.append(
+                    CodesignResult(
+                        name=binary_config.name,
+                        status=CodesignStatus.SIGNED,
+                        identity=cs_config.identity,
+                        message="Successfully signed",
+                    )
+                )
+                logger.success(f"Signed {binary_config.name} with identity '{cs_config.identity}'")
+            return results
+        if logger.is_debug_enabled():
+            logger.debug(f"Batch signing failed: {proc.stderr.decode('utf-8', 'replace').strip()}")
+
+    # A failed batch does not say which binary was at fault; signing each
+    # one on its own attributes the failure (batches always use -f, so
+    # re-signing binaries the batch did sign is safe)
+    return [codesign_binary(binary_config, config, logger) for binary_config in batch]
+
+
 def codesign_all_binaries(config: TrackConfig, logger: Logger) -> list[CodesignResult]:
     """Sign all binaries that have codesigning enabled."""
     results: list[CodesignResult] = []
@@ -2797,13 +3458,24 @@ def codesign_all_binaries(config: TrackConfig, logger: Logger) -> list[CodesignR
 
     logger.header("Codesigning Binaries")
 
+    to_sign: list[BinaryConfig] = []
     for name, binary_config in config.binaries.items():
         if not binary_config.codesign.enabled:
             logger.debug(f"Skipping {name} (codesigning not enabled)")
             continue
+        to_sign.append(binary_config)
+
+    # codesign spends most of its time on I/O and timestamping, so batches
+    # are signed in parallel; results keep the configuration order
+    batches = _plan_codesign_batches(to_sign, config.dry_run)
+    if config.parallel_codesign and len(batches) > 1:
+        with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+            batch_results = list(executor.map(lambda batch: _sign_batch(batch, config, logger), batches))
+    else:
+        batch_results = [_sign_batch(batch, config, logger) for batch in batches]
 
-        result = codesign_binary(binary_config, config, logger)
-        results.append(result)
+    by_name = {r.name: r for batch_result in batch_results for r in batch_result}
+    results = [by_name[bc.name] for bc in to_sign]
 
     # Summary
     if not config.quiet and not config.json_output:
@@ -2830,11 +3502,17 @@ def verify_all_signatures(config: TrackConfig, logger: Logger) -> list[CodesignR
 
     logger.header("Signature Verification")
 
-    for name, binary_config in config.binaries.items():
-        binary_path = binary_config.get_expanded_install_path()
-        result = verify_signature(binary_path, logger)
+    # Each check is a few codesign subprocesses, so run them concurrently and
+    # report on the main thread in configuration order
+    paths = [bc.get_expanded_install_path() for bc in config.binaries.values()]
+    if len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+            results = list(executor.map(lambda path: verify_signature(path, logger), paths))
+    else:
+        results = [verify_signature(path, logger) for path in paths]
+
+    for name, result in zip(config.binaries, results):
         result.name = name  # Use config name, not filename
-        results.append(result)
 
         # Display status
         if result.status == CodesignStatus.VALID:
@@ -2877,24 +3555,27 @@ def show_install_locations(logger: Logger, json_output: bool = False) -> None:
     current_platform = get_current_platform()
     locations = get_default_install_locations()
 
+    # Probe each location once; both output formats read from these
+    probes = [
+        {
+            "path": str(loc.path),
+            "scope": loc.scope.value,
+            "binary_type": loc.binary_type.value,
+            "description": loc.description,
+            "exists": loc.exists(),
+            "writable": loc.is_writable(),
+            "in_path": is_path_in_system_path(loc.path) if loc.binary_type == BinaryType.CLI else None,
+            "requires_admin": loc.requires_admin,
+        }
+        for loc in locations
+    ]
+
     if json_output:
         output = {
             "platform": current_platform.value,
-            "locations": [
-                {
-                    "path": str(loc.path),
-                    "scope": loc.scope.value,
-                    "binary_type": loc.binary_type.value,
-                    "description": loc.description,
-                    "exists": loc.exists(),
-                    "writable": loc.is_writable(),
-                    "in_path": is_path_in_system_path(loc.path) if loc.binary_type == BinaryType.CLI else None,
-                    "requires_admin": loc.requires_admin,
-                }
-                for loc in locations
-            ],
+            "locations": probes,
         }
-        print(json.dumps(output, indent=2))
+        _emit_json(output)
         return
 
     logger.header(f"Default Install Locations ({current_platform.value})")
@@ -2902,7 +3583,7 @@ def show_install_locations(logger: Logger, json_output: bool = False) -> None:
 
     # Group by binary type
     for bt in [BinaryType.CLI, BinaryType.GUI]:
-        bt_locations = [loc for loc in locations if loc.binary_type == bt]
+        bt_locations = [(loc, probe) for loc, probe in zip(locations, probes) if loc.binary_type == bt]
         if not bt_locations:
             continue
 
@@ -2910,23 +3591,23 @@ def show_install_locations(logger: Logger, json_output: bool = False) -> None:
         print(f"{Colors.BOLD}{type_label}:{Colors.RESET}")
         print()
 
-        for loc in bt_locations:
+        for loc, probe in bt_locations:
             scope_label = "[user]  " if loc.scope == InstallScope.USER else "[system]"
-            path_str = str(loc.path)
+            path_str = probe["path"]
 
             # Status indicators
             indicators = []
-            if loc.exists():
+            if probe["exists"]:
                 indicators.append(f"{Colors.GREEN}exists{Colors.RESET}")
             else:
                 indicators.append(f"{Colors.GRAY}missing{Colors.RESET}")
 
-            if loc.is_writable():
+            if probe["writable"]:
                 indicators.append(f"{Colors.GREEN}writable{Colors.RESET}")
             else:
                 indicators.append(f"{Colors.YELLOW}read-only{Colors.RESET}")
 
-            if bt == BinaryType.CLI and is_path_in_system_path(loc.path):
+            if bt == BinaryType.CLI and probe["in_path"]:
                 indicators.append(f"{Colors.GREEN}in PATH{Colors.RESET}")
             elif bt == BinaryType.CLI:
                 indicators.append(f"{Colors.YELLOW}not in PATH{Colors.RESET}")
@@ -2939,7 +3620,13 @@ def show_install_locations(logger: Logger, json_output: bool = False) -> None:
 
     # Show PATH setup instructions for recommended CLI location
     recommended = get_recommended_install_path(BinaryType.CLI, InstallScope.USER)
-    if not is_path_in_system_path(recommended):
+    recommended_in_path = next(
+        (probe["in_path"] for probe in probes if probe["path"] == str(recommended) and probe["in_path"] is not None),
+        None,
+    )
+    if recommended_in_path is None:
+        recommended_in_path = is_path_in_system_path(recommended)
+    if not recommended_in_path:
         print(f"{Colors.YELLOW}Tip:{Colors.RESET} Recommended CLI path is not in PATH.")
         print(get_path_setup_instructions(recommended))
         print()
@@ -2954,8 +3641,14 @@ def check_all_binaries(config: TrackConfig, logger: Logger) -> TrackResult:
 
     shadow_warnings: list[tuple[str, list[ShadowConflict]]] = []
 
-    for name, binary_config in config.binaries.items():
-        status = get_binary_status(binary_config, config, manifest, logger)
+    # Status checks are git, stat and hashing work that only reads the
+    # manifest, so compute them concurrently and report in configuration order
+    with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+        statuses = list(
+            executor.map(lambda bc: get_binary_status(bc, config, manifest, logger), config.binaries.values())
+        )
+
+    for name, status in zip(config.binaries, statuses):
         result.statuses.append(status)
 
         # Collect shadow conflicts for later display
@@ -2971,7 +3664,7 @@ def check_all_binaries(config: TrackConfig, logger: Logger) -> TrackResult:
             if status.commits_behind > 0:
                 detail = f"- {status.commits_behind} commit(s) behind"
             logger.status_line("⚠", Colors.YELLOW, name, f"- STALE {detail}")
-            if status.stale_files and config.verbose:
+            if status.stale_files and logger.is_debug_enabled():
                 for f in status.stale_files[:5]:
                     logger.debug(f"    └ {f}")
                 if len(status.stale_files) > 5:
@@ -3038,13 +3731,15 @@ def rebuild_stale_binaries(config: TrackConfig, logger: Logger, rebuild_all: boo
     result = TrackResult(dry_run=config.dry_run)
     manifest = load_manifest(config.root_dir)
 
-    # First, get status of all binaries
-    binaries_to_rebuild: list[BinaryConfig] = []
-
-    for name, binary_config in config.binaries.items():
-        status = get_binary_status(binary_config, config, manifest, logger)
-        result.statuses.append(status)
+    # First, get status of all binaries, concurrently as check_all_binaries does
+    with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+        result.statuses = list(
+            executor.map(lambda bc: get_binary_status(bc, config, manifest, logger), config.binaries.values())
+        )
 
+    binaries_to_rebuild: list[BinaryConfig] = []
+    for status in result.statuses:
+        binary_config = config.binaries[status.name]
         if rebuild_all:
             binaries_to_rebuild.append(binary_config)
         elif status.status in (BinaryStatus.STALE, BinaryStatus.MISSING):
@@ -3132,6 +3827,142 @@ def verify_binaries(config: TrackConfig, logger: Logger) -> TrackResult:
     return result
 
 
+def _glob_segment_regex(segment: str) -> str:
+    """Translate one glob path segment to a regex whose wildcards stop at '/'."""
+    parts: list[str] = []
+    i, n = 0, len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == "*":
+            parts.append("[^/]*")
+        elif c == "?":
+            parts.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and segment[j] == "!":
+                j += 1
+            if j < n and segment[j] == "]":
+                j += 1
+            while j < n and segment[j] != "]":
+                j += 1
+            if j >= n:
+                parts.append(re.escape(c))
+                continue
+            body = segment[i:j].replace("\\", "\\\\")
+            i = j + 1
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            elif body.startswith("^"):
+                body = "\\" + body
+            parts.append(f"[{body}]")
+        else:
+            parts.append(re.escape(c))
+    return "".join(parts)
+
+
+def _compile_source_matcher(patterns: list[str]) -> re.Pattern[str]:
+    """Compile source patterns into one regex for matching changed paths.
+
+    A path matches if, for any pattern, Path.match (right-anchored, one path
+    component per pattern segment) or fnmatch on the whole path would match,
+    except that wildcards are never matched against the filesystem root
+    itself. Paths must use '/' separators and be tested with ``.match()``.
+    """
+    alternatives: list[str] = []
+    for pattern in patterns:
+        if not pattern:
+            continue
+        pure = PurePath(pattern)
+        segments = [part for part in pure.parts if part != pure.anchor]
+        body = "/".join(_glob_segment_regex(segment) for segment in segments)
+        prefix = re.escape(pure.anchor.replace("\\", "/")) if pure.anchor else "(?s:.*/)?"
+        alternatives.append(f"{prefix}{body}\\Z")
+        alternatives.append(fnmatch.translate(pattern))
+    if not alternatives:
+        return re.compile("(?!)")
+    return re.compile("|".join(f"(?:{alt})" for alt in alternatives), re.IGNORECASE if os.name == "nt" else 0)
+
+
+def _watch_directories(root_dir: Path, patterns: list[str]) -> set[Path]:
+    """Find the directories to watch for a set of source patterns.
+
+    Each pattern is watched from its longest literal directory prefix, or from
+    root_dir when that prefix is not an existing directory. Prefixes shared by
+    several patterns are only stat'ed once.
+    """
+    is_dir: dict[str, bool] = {}
+    watched_dirs: set[Path] = set()
+
+    for pattern in patterns:
+        # Extract base directory from pattern
+        base = str(root_dir)
+        for part in pattern.split("/"):
+            if "*" in part or "?" in part:
+                break
+            base = os.path.join(base, part)
+
+        if base not in is_dir:
+            try:
+                is_dir[base] = stat.S_ISDIR(os.stat(base).st_mode)
+            except OSError:
+                is_dir[base] = False
+        watched_dirs.add(Path(base) if is_dir[base] else root_dir)
+
+    return watched_dirs
+
+
+def _collect_ready_rebuilds(
+    events: queue.SimpleQueue[tuple[str, float]],
+    pending: dict[str, float],
+    debounce_sec: float,
+    wait: float,
+) -> list[str]:
+    """Merge queued change events and return binaries whose debounce has expired.
+
+    Waits up to ``wait`` seconds for the first event, then drains the rest
+    without blocking. ``pending`` maps each binary to its latest change time
+    and is owned by the single consumer, so it needs no lock.
+    """
+    try:
+        name, changed_at = events.get(timeout=wait)
+        pending[name] = changed_at
+        while True:
+            name, changed_at = events.get_nowait()
+            pending[name] = changed_at
+    except queue.Empty:
+        pass
+
+    now = time.monotonic()
+    ready = [name for name, changed_at in pending.items() if now - changed_at > debounce_sec]
+    for name in ready:
+        del pending[name]
+    return ready
+
+
+def _rebuild_changed(names: list[str], config: TrackConfig, manifest: BuildManifest, logger: Logger) -> None:
+    """Rebuild binaries whose sources changed in one debounce window.
+
+    Builds run in parallel like rebuild_stale_binaries, and the manifest is
+    saved once for the whole batch.
+    """
+    to_rebuild = [config.binaries[name] for name in names if name in config.binaries]
+    if not to_rebuild:
+        return
+
+    for binary_config in to_rebuild:
+        logger.info(f"Source changed, rebuilding {binary_config.name}...")
+
+    if config.parallel_builds and len(to_rebuild) > 1:
+        with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+            list(executor.map(lambda bc: rebuild_binary(bc, config, manifest, logger), to_rebuild))
+    else:
+        for binary_config in to_rebuild:
+            rebuild_binary(binary_config, config, manifest, logger)
+
+    save_manifest(manifest, config.root_dir)
+
+
 def watch_sources(config: TrackConfig, logger: Logger) -> None:
     """Watch source files and rebuild on changes."""
     try:
@@ -3144,9 +3975,20 @@ def watch_sources(config: TrackConfig, logger: Logger) -> None:
     logger.header("Watch Mode")
     logger.info("Watching for source changes... (Ctrl+C to stop)")
 
-    # Debounce tracking
-    pending_rebuilds: dict[str, float] = {}
-    lock = threading.Lock()
+    # Change events flow from the watchdog thread to the rebuild worker without
+    # a shared lock, so a busy worker never stalls event delivery
+    events: queue.SimpleQueue[tuple[str, float]] = queue.SimpleQueue()
+
+    # Events can arrive by the thousand during builds, so each binary's
+    # patterns are compiled once into a single regex, and the union of all
+    # of them rejects unrelated paths (build outputs, editor files) in one call
+    matchers = [
+        (name, _compile_source_matcher(binary_config.source_patterns))
+        for name, binary_config in config.binaries.items()
+    ]
+    any_source = _compile_source_matcher(
+        [pattern for binary_config in config.binaries.values() for pattern in binary_config.source_patterns]
+    )
 
     class ChangeHandler(FileSystemEventHandler):
         def on_modified(self, event: Any) -> None:
@@ -3160,15 +4002,14 @@ def watch_sources(config: TrackConfig, logger: Logger) -> None:
             self._handle_change(event.src_path)
 
         def _handle_change(self, file_path: str) -> None:
-            path = Path(file_path)
+            path = file_path.replace(os.sep, "/") if os.sep != "/" else file_path
+            if not any_source.match(path):
+                return
 
-            # Check which binaries are affected
-            for name, binary_config in config.binaries.items():
-                for pattern in binary_config.source_patterns:
-                    if path.match(pattern) or fnmatch.fnmatch(str(path), pattern):
-                        with lock:
-                            pending_rebuilds[name] = time.time()
-                        break
+            # Check which binaries are affected; a shared file can affect several
+            for name, matcher in matchers:
+                if matcher.match(path):
+                    events.put((name, time.monotonic()))
 
     # Process pending rebuilds in a background thread
     stop_event = threading.Event()
@@ -3176,24 +4017,11 @@ def watch_sources(config: TrackConfig, logger: Logger) -> None:
     def rebuild_worker() -> None:
         debounce_sec = config.watch_debounce_ms / 1000.0
         manifest = load_manifest(config.root_dir)
+        pending_rebuilds: dict[str, float] = {}
 
         while not stop_event.is_set():
-            time.sleep(0.1)
-
-            with lock:
-                now = time.time()
-                ready = [
-                    name for name, ts in pending_rebuilds.items()
-                    if now - ts > debounce_sec
-                ]
-                for name in ready:
-                    del pending_rebuilds[name]
-
-            for name in ready:
-                if name in config.binaries:
-                    logger.info(f"Source changed, rebuilding {name}...")
-                    rebuild_binary(config.binaries[name], config, manifest, logger)
-                    save_manifest(manifest, config.root_dir)
+            ready = _collect_ready_rebuilds(events, pending_rebuilds, debounce_sec, 0.1)
+            _rebuild_changed(ready, config, manifest, logger)
 
     worker = threading.Thread(target=rebuild_worker, daemon=True)
     worker.start()
@@ -3203,20 +4031,10 @@ def watch_sources(config: TrackConfig, logger: Logger) -> None:
     handler = ChangeHandler()
 
     # Watch all source patterns
-    watched_dirs: set[Path] = set()
-    for binary_config in config.binaries.values():
-        for pattern in binary_config.source_patterns:
-            # Extract base directory from pattern
-            parts = pattern.split("/")
-            base = config.root_dir
-            for part in parts:
-                if "*" in part or "?" in part:
-                    break
-                base = base / part
-            if base.exists() and base.is_dir():
-                watched_dirs.add(base)
-            else:
-                watched_dirs.add(config.root_dir)
+    watched_dirs = _watch_directories(
+        config.root_dir,
+        [pattern for binary_config in config.binaries.values() for pattern in binary_config.source_patterns],
+    )
 
     for dir_path in watched_dirs:
         observer.schedule(handler, str(dir_path), recursive=True)
@@ -3256,6 +4074,33 @@ def pre_commit_check(config: TrackConfig, logger: Logger) -> int:
     return 0
 
 
+def _round_trip_yaml() -> Any:
+    """Return a round-trip ruamel.yaml instance, or None if ruamel.yaml is not installed."""
+    try:
+        from ruamel.yaml import YAML
+    except ImportError:
+        return None
+    round_trip = YAML()
+    round_trip.preserve_quotes = True
+    return round_trip
+
+
+def _load_config_document(config_path: Path, round_trip: Any) -> Any:
+    """Load a config file for editing, keeping comments and layout with ruamel.yaml."""
+    with open(config_path, encoding="utf-8") as f:
+        data = round_trip.load(f) if round_trip else _load_yaml(f)
+    return data or {}
+
+
+def _dump_config_document(data: Any, config_path: Path, round_trip: Any) -> None:
+    """Write an edited config file back, with ruamel.yaml when it was used to load it."""
+    with open(config_path, "w", encoding="utf-8") as f:
+        if round_trip:
+            round_trip.dump(data, f)
+        else:
+            _dump_yaml(data, f)
+
+
 def add_binary_interactive(config: TrackConfig, logger: Logger) -> None:
     """Interactively add a new binary to track."""
     logger.header("Add New Binary")
@@ -3305,13 +4150,13 @@ def add_binary_interactive(config: TrackConfig, logger: Logger) -> None:
 
     # Load existing config file or create new one
     config_path = config.root_dir / CONFIG_FILE_NAMES[0]
+    round_trip = _round_trip_yaml()
     if config_path.exists():
-        with open(config_path, encoding="utf-8") as f:
-            file_config = yaml.safe_load(f) or {}
+        file_config = _load_config_document(config_path, round_trip)
     else:
         file_config = {"binaries": {}}
 
-    if "binaries" not in file_config:
+    if not file_config.get("binaries"):
         file_config["binaries"] = {}
 
     file_config["binaries"][name] = {
@@ -3321,8 +4166,7 @@ def add_binary_interactive(config: TrackConfig, logger: Logger) -> None:
         "language": language,
     }
 
-    with open(config_path, "w", encoding="utf-8") as f:
-        yaml.dump(file_config, f, default_flow_style=False, sort_keys=False)
+    _dump_config_document(file_config, config_path, round_trip)
 
     logger.success(f"Added '{name}' to {config_path}")
 
@@ -3338,14 +4182,13 @@ def remove_binary(config: TrackConfig, logger: Logger, name: str) -> None:
         logger.error(f"Configuration file not found: {config_path}")
         return
 
-    with open(config_path, encoding="utf-8") as f:
-        file_config = json.load(f)
+    round_trip = _round_trip_yaml()
+    file_config = _load_config_document(config_path, round_trip)
 
-    if "binaries" in file_config and name in file_config["binaries"]:
+    if file_config.get("binaries") and name in file_config["binaries"]:
         del file_config["binaries"][name]
 
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(file_config, f, indent=2)
+        _dump_config_document(file_config, config_path, round_trip)
 
         # Also remove from manifest
         manifest = load_manifest(config.root_dir)
@@ -3358,8 +4201,73 @@ def remove_binary(config: TrackConfig, logger: Logger, name: str) -> None:
         logger.error(f"Binary '{name}' not found in configuration file")
 
 
+# Boolean flags understood without building the argparse parser, mapped to
+# their destinations; the action flags among them are mutually exclusive
+_SIMPLE_ACTION_FLAGS: dict[str, str] = {
+    "--status": "status",
+    "--check": "check",
+    "--rebuild": "rebuild",
+    "--rebuild-all": "rebuild_all",
+    "--watch": "watch",
+    "--verify": "verify",
+    "--health": "health",
+    "--add": "add",
+    "--pre-commit": "pre_commit",
+    "--codesign": "codesign",
+    "--verify-signature": "verify_signature",
+    "--show-paths": "show_paths",
+}
+_SIMPLE_OPTION_FLAGS: dict[str, str] = {
+    "--dry-run": "dry_run",
+    "--verbose": "verbose",
+    "-v": "verbose",
+    "--quiet": "quiet",
+    "-q": "quiet",
+    "--json": "json_output",
+}
+
+
+def _parse_simple_args(argv: list[str]) -> argparse.Namespace | None:
+    """Parse argument lists made only of plain boolean flags.
+
+    Covers the common invocations (no arguments, ``--check``,
+    ``-q --pre-commit`` and so on) without building the full parser.
+
+    Args:
+        argv: Command-line arguments, excluding the program name.
+
+    Returns:
+        The parsed arguments, or None if the full parser is needed.
+    """
+    if len(set(argv)) != len(argv):
+        return None
+    if sum(arg in _SIMPLE_ACTION_FLAGS for arg in argv) > 1:
+        return None
+
+    args = argparse.Namespace(config=None, remove=None)
+    for dest in (*_SIMPLE_ACTION_FLAGS.values(), *_SIMPLE_OPTION_FLAGS.values()):
+        setattr(args, dest, False)
+    for arg in argv:
+        if arg in _SIMPLE_ACTION_FLAGS:
+            setattr(args, _SIMPLE_ACTION_FLAGS[arg], True)
+        elif arg in _SIMPLE_OPTION_FLAGS:
+            setattr(args, _SIMPLE_OPTION_FLAGS[arg], True)
+        else:
+            return None
+    return args
+
+
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     """Parse command-line arguments."""
+    args = _parse_simple_args(sys.argv[1:] if argv is None else argv)
+    if args is not None:
+        return args
+    return _build_parser().parse_args(argv)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the full command-line parser, once per process."""
     parser = argparse.ArgumentParser(
         prog="binary-track",
         description="Keep locally-installed binaries up to date with source code",
@@ -3507,35 +4415,196 @@ Pre-commit Integration:
         help="Output in JSON format",
     )
 
-    return parser.parse_args(argv)
+    return parser
+
+
+# A top-level pre_commit_policy key with a plain or quoted scalar value
+_PRE_COMMIT_POLICY_RE = re.compile(r"""^pre_commit_policy:[ \t]*(["']?)(\w+)\1[ \t]*(?:#.*)?$""", re.MULTILINE)
+
+
+def _peek_pre_commit_policy(config_path: Path | None, root_dir: Path) -> str | None:
+    """Find the pre-commit policy without loading the configuration.
+
+    Args:
+        config_path: Explicit config file from --config, if any.
+        root_dir: Directory the config file names are resolved against.
+
+    Returns:
+        The policy from BINARY_TRACK_POLICY or the config file's top-level
+        pre_commit_policy key, or None if it cannot be determined this way.
+    """
+    policy = os.environ.get("BINARY_TRACK_POLICY")
+    if policy:
+        return policy
+
+    candidates = [root_dir / config_path] if config_path else [root_dir / name for name in CONFIG_FILE_NAMES]
+    for path in candidates:
+        try:
+            text = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            continue
+        except (OSError, UnicodeDecodeError):
+            return None
+        # PyYAML keeps the last of duplicate keys
+        matches = _PRE_COMMIT_POLICY_RE.findall(text)
+        return matches[-1][1] if matches else None
+    return None
+
+
+def _loaded_yaml_errors() -> tuple[type[Exception], ...]:
+    """Return PyYAML's parse error type for an except clause, if yaml is imported.
+
+    The clause is only evaluated once something was raised, and a config
+    file that failed to parse has imported yaml by then, so main can catch
+    parse errors without importing yaml up front.
+    """
+    yaml = sys.modules.get("yaml")
+    return (yaml.YAMLError,) if yaml is not None else ()
+
+
+def _print_startup_error(message: str) -> None:
+    """Report an error raised before the logger exists, as one write to stderr."""
+    sys.stderr.write(f"{Colors.RED}Error:{Colors.RESET} {message}\n")
+    sys.stderr.flush()
+
+
+def _report_codesign_results(
+    results: list[CodesignResult], failing: tuple[CodesignStatus, ...], json_output: bool
+) -> int:
+    """Print codesign results as JSON if requested and compute the exit code.
+
+    Args:
+        results: Results of signing or verifying each binary.
+        failing: Statuses that make the command fail.
+        json_output: Whether to print the results as JSON.
+
+    Returns:
+        1 if any result has a failing status, 0 otherwise.
+    """
+    failed = 0
+    output = []
+    for r in results:
+        if r.status in failing:
+            failed += 1
+        if json_output:
+            output.append(
+                {"name": r.name, "status": r.status.value, "identity": r.identity, "message": r.message}
+            )
+    if json_output:
+        _emit_json(output)
+    return 1 if failed > 0 else 0
+
+
+def _report_track_result(result: TrackResult, config: TrackConfig) -> int:
+    """Print a track result as JSON if requested and compute the exit code."""
+    if config.json_output:
+        _emit_json(result.to_dict())
+    return 0 if result.all_current else 1
+
+
+def _add_action(config: TrackConfig, logger: Logger, args: argparse.Namespace) -> int:
+    """Interactively add a binary to the configuration."""
+    add_binary_interactive(config, logger)
+    return 0
+
+
+def _remove_action(config: TrackConfig, logger: Logger, args: argparse.Namespace) -> int:
+    """Remove a binary from the configuration."""
+    remove_binary(config, logger, args.remove)
+    return 0
+
+
+def _watch_action(config: TrackConfig, logger: Logger, args: argparse.Namespace) -> int:
+    """Watch sources and rebuild on change until interrupted."""
+    watch_sources(config, logger)
+    return 0
+
+
+def _rebuild_action(config: TrackConfig, logger: Logger, args: argparse.Namespace) -> int:
+    """Rebuild stale binaries, or all of them for --rebuild-all."""
+    return _report_track_result(rebuild_stale_binaries(config, logger, rebuild_all=args.rebuild_all), config)
+
+
+def _verify_action(config: TrackConfig, logger: Logger, args: argparse.Namespace) -> int:
+    """Verify that binaries exist and are executable."""
+    return _report_track_result(verify_binaries(config, logger), config)
+
+
+def _codesign_action(config: TrackConfig, logger: Logger, args: argparse.Namespace) -> int:
+    """Sign every binary with codesigning enabled."""
+    results = codesign_all_binaries(config, logger)
+    return _report_codesign_results(results, (CodesignStatus.FAILED,), config.json_output)
+
+
+def _verify_signature_action(config: TrackConfig, logger: Logger, args: argparse.Namespace) -> int:
+    """Verify the codesign signature of every binary."""
+    results = verify_all_signatures(config, logger)
+    return _report_codesign_results(results, (CodesignStatus.INVALID, CodesignStatus.UNSIGNED), config.json_output)
+
+
+def _pre_commit_action(config: TrackConfig, logger: Logger, args: argparse.Namespace) -> int:
+    """Run the pre-commit check under the configured policy."""
+    return pre_commit_check(config, logger)
+
+
+def _check_action(config: TrackConfig, logger: Logger, args: argparse.Namespace) -> int:
+    """Check for stale binaries, failing if any are stale."""
+    return _report_track_result(check_all_binaries(config, logger), config)
+
+
+def _status_action(config: TrackConfig, logger: Logger, args: argparse.Namespace) -> int:
+    """Show the status of every binary; the default action, which never fails."""
+    _report_track_result(check_all_binaries(config, logger), config)
+    return 0
+
+
+# Action flags and their handlers, checked in order; the action flags are
+# mutually exclusive and _status_action runs when none is given
+_ACTIONS: tuple[tuple[str, Callable[[TrackConfig, Logger, argparse.Namespace], int]], ...] = (
+    ("add", _add_action),
+    ("remove", _remove_action),
+    ("watch", _watch_action),
+    ("rebuild", _rebuild_action),
+    ("rebuild_all", _rebuild_action),
+    ("verify", _verify_action),
+    ("health", _verify_action),
+    ("codesign", _codesign_action),
+    ("verify_signature", _verify_signature_action),
+    ("pre_commit", _pre_commit_action),
+    ("check", _check_action),
+)
 
 
 def main(argv: list[str] | None = None) -> int:
     """Main entry point."""
     args = parse_args(argv)
+    root_dir = Path.cwd()
+
+    # The hook runs on every commit and has nothing to do under the ignore
+    # policy, so settle that before loading the configuration
+    if args.pre_commit and _peek_pre_commit_policy(args.config, root_dir) == PreCommitPolicy.IGNORE.value:
+        return 0
 
     # Load configuration
-    root_dir = Path.cwd()
     try:
         file_config = load_config_file(args.config, root_dir)
     except FileNotFoundError as e:
-        print(f"{Colors.RED}Error:{Colors.RESET} {e}", file=sys.stderr)
+        _print_startup_error(str(e))
         return 1
-    except yaml.YAMLError as e:
-        print(f"{Colors.RED}Error:{Colors.RESET} Invalid YAML in config file: {e}", file=sys.stderr)
+    except _loaded_yaml_errors() as e:
+        _print_startup_error(f"Invalid YAML in config file: {e}")
         return 1
 
     env_config = load_env_config()
-    merged_config: ConfigDict = {**file_config, **env_config}
+    # Environment overrides are usually absent; from_dict only reads the dict
+    merged_config: ConfigDict = {**file_config, **env_config} if env_config else file_config
     config = TrackConfig.from_dict(merged_config, root_dir)
 
-    # Set global config for binary path resolution
-    set_global_track_config(config)
-
     # Apply CLI overrides
-    if args.dry_run or os.environ.get("BINARY_TRACK_DRY_RUN") == "true":
+    env = os.environ
+    if args.dry_run or env.get("BINARY_TRACK_DRY_RUN") == "true":
         config.dry_run = True
-    if args.verbose or os.environ.get("BINARY_TRACK_VERBOSE") == "true":
+    if args.verbose or env.get("BINARY_TRACK_VERBOSE") == "true":
         config.verbose = True
     if args.quiet:
         config.quiet = True
@@ -3554,90 +4623,18 @@ def main(argv: list[str] | None = None) -> int:
         if not args.json_output:
             logger.info("No binaries configured. Use --add to add a binary or create .binariesrc.yaml")
             logger.info("\nExample configuration:")
-            example = {
-                "binaries": {
-                    "mytool": {
-                        "source_patterns": ["cmd/mytool/**/*.go", "internal/**/*.go"],
-                        "build_cmd": "go build -o ~/.local/bin/mytool ./cmd/mytool",
-                        "install_path": "~/.local/bin/mytool",
-                        "language": "go",
-                    }
-                },
-                "track_by": "git_commit",
-                "pre_commit_policy": "warn",
-            }
-            print(yaml.dump(example, default_flow_style=False, sort_keys=False))
+            print(_EXAMPLE_CONFIG_YAML)
         return 0
 
+    # Set global config for binary path resolution
+    set_global_track_config(config)
+
     # Execute action
     try:
-        if args.add:
-            add_binary_interactive(config, logger)
-            return 0
-
-        elif args.remove:
-            remove_binary(config, logger, args.remove)
-            return 0
-
-        elif args.watch:
-            watch_sources(config, logger)
-            return 0
-
-        elif args.rebuild:
-            result = rebuild_stale_binaries(config, logger, rebuild_all=False)
-            if config.json_output:
-                print(json.dumps(result.to_dict(), indent=2))
-            return 0 if result.all_current else 1
-
-        elif args.rebuild_all:
-            result = rebuild_stale_binaries(config, logger, rebuild_all=True)
-            if config.json_output:
-                print(json.dumps(result.to_dict(), indent=2))
-            return 0 if result.all_current else 1
-
-        elif args.verify or args.health:
-            result = verify_binaries(config, logger)
-            if config.json_output:
-                print(json.dumps(result.to_dict(), indent=2))
-            return 0 if result.all_current else 1
-
-        elif args.codesign:
-            results = codesign_all_binaries(config, logger)
-            if config.json_output:
-                output = [
-                    {"name": r.name, "status": r.status.value, "identity": r.identity, "message": r.message}
-                    for r in results
-                ]
-                print(json.dumps(output, indent=2))
-            failed = sum(1 for r in results if r.status == CodesignStatus.FAILED)
-            return 1 if failed > 0 else 0
-
-        elif args.verify_signature:
-            results = verify_all_signatures(config, logger)
-            if config.json_output:
-                output = [
-                    {"name": r.name, "status": r.status.value, "identity": r.identity, "message": r.message}
-                    for r in results
-                ]
-                print(json.dumps(output, indent=2))
-            invalid = sum(1 for r in results if r.status in (CodesignStatus.INVALID, CodesignStatus.UNSIGNED))
-            return 1 if invalid > 0 else 0
-
-        elif args.pre_commit:
-            return pre_commit_check(config, logger)
-
-        elif args.check:
-            result = check_all_binaries(config, logger)
-            if config.json_output:
-                print(json.dumps(result.to_dict(), indent=2))
-            return 0 if result.all_current else 1
-
-        else:
-            # Default action: show status
-            result = check_all_binaries(config, logger)
-            if config.json_output:
-                print(json.dumps(result.to_dict(), indent=2))
-            return 0
+        for attr, action in _ACTIONS:
+            if getattr(args, attr):
+                return action(config, logger, args)
+        return _status_action(config, logger, args)
 
     except Exception as e:
         logger.error(f"Fatal error: {e}")
@@ -3648,4 +4645,9 @@ def main(argv: list[str] | None = None) -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    exit_code = main()
+    # All output is written and nothing registers atexit work, so skip the
+    # interpreter teardown that would only garbage-collect module state
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(exit_code)
@@ -108,6 +108,12 @@ Configuration:
     - Useful when binaries are in non-standard locations
     - Supports absolute paths
 
+    Offline Queue:
+    - Failed pushes are journaled as JSON lines in .remote-sync-queue.json
+    - Each failure appends one line; --process-queue compacts the journal
+    - Read and written with orjson when installed (pip install pre_commit[speedups])
+    - Queue files written as a single JSON or YAML document are still read
+
 Environment Variables:
     REMOTE_SYNC_PARALLEL        Set to 'false' to disable parallel push
     REMOTE_SYNC_DRY_RUN         Set to 'true' for dry run
@@ -119,20 +125,27 @@ Environment Variables:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
 import fnmatch
+import functools
+import itertools
 import json
 import os
 import random
+import re
+import selectors
+import shlex
+import signal
 import subprocess
 import sys
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import TypedDict
+from typing import IO, Any, Iterable, Iterator, TypedDict
 
 import yaml
 
@@ -154,7 +167,7 @@ QUEUE_LOCK_FILE = ".remote-sync-queue.lock"
 
 # Remote defaults
 DEFAULT_REMOTE_PRIORITY = 1
-DEFAULT_REMOTE_BRANCHES = ["*"]  # Sync all branches
+DEFAULT_REMOTE_BRANCHES = ("*",)  # Sync all branches
 DEFAULT_FORCE_PUSH_POLICY = "block"  # Safe default - prevent accidental force push
 DEFAULT_REMOTE_RETRY = 3  # Retry count for push operations
 DEFAULT_REMOTE_TIMEOUT = 60  # Seconds - increased for large pushes
@@ -186,11 +199,12 @@ DEFAULT_PUSH_TAGS = False  # Don't push tags by default (explicit is better)
 # VPN defaults
 DEFAULT_VPN_TIMEOUT = 60  # Seconds to wait for VPN connection
 DEFAULT_VPN_AUTO_CONNECT = True  # Auto-connect if remote is unreachable
+DEFAULT_VPN_FAST_VERIFY = False  # Run connect and first check as one command
 
 # Sync targets (filesystem/rsync)
 DEFAULT_SYNC_DELETE = False  # Don't delete extraneous files (safe default)
 DEFAULT_RSYNC_PORT = 22
-DEFAULT_RSYNC_OPTIONS = ["-avz", "--progress"]  # Archive, verbose, compress
+DEFAULT_RSYNC_OPTIONS = ("-avz", "--progress")  # Archive, verbose, compress
 
 # Known hosting providers - used for smart defaults
 KNOWN_HOSTS = {
@@ -280,8 +294,11 @@ class VpnConfigDict(TypedDict, total=False):
     connect_cmd: str
     disconnect_cmd: str
     check_cmd: str
+    interface: str
     timeout: int
     auto_connect: bool
+    fast_verify: bool
+    ready_regex: str
 
 
 class FilesystemTargetDict(TypedDict, total=False):
@@ -353,17 +370,39 @@ class BranchMode(Enum):
     SPECIFIC = "specific"  # Always use a specific branch
 
 
-# Default excludes for sync targets (does NOT exclude .git to preserve repo state)
-DEFAULT_SYNC_EXCLUDES = ["__pycache__", "*.pyc", ".DS_Store", "*.egg-info", ".tox", ".pytest_cache", "node_modules", ".venv", "venv"]
+# Value -> member tables for config parsing, so unknown or missing values
+# fall back with a dict lookup instead of a raised and caught ValueError
+_FORCE_PUSH_BY_VALUE = {member.value: member for member in ForcePushPolicy}
+_BRANCH_MODE_BY_VALUE = {member.value: member for member in BranchMode}
+
+
+# Default excludes for sync targets (does NOT exclude .git to preserve repo state).
+# Defaults are tuples so they can be shared; each target gets its own list copy.
+DEFAULT_SYNC_EXCLUDES = (
+    "__pycache__",
+    "*.pyc",
+    ".DS_Store",
+    "*.egg-info",
+    ".tox",
+    ".pytest_cache",
+    "node_modules",
+    ".venv",
+    "venv",
+)
+
+
+def _list_or_default(value: list[str] | None, default: tuple[str, ...]) -> list[str]:
+    """Return a configured list, or a fresh copy of the default when unset."""
+    return value if value is not None else list(default)
 
 
-@dataclass
+@dataclass(slots=True)
 class FilesystemTarget:
     """Configuration for a local filesystem sync target."""
 
     name: str
     path: str
-    exclude: list[str] = field(default_factory=lambda: DEFAULT_SYNC_EXCLUDES.copy())
+    exclude: list[str] = field(default_factory=lambda: list(DEFAULT_SYNC_EXCLUDES))
     delete: bool = DEFAULT_SYNC_DELETE  # Delete extraneous files in destination
     branch_mode: BranchMode = BranchMode.MATCH  # Match source branch by default
     branch: str = ""  # Target branch for "specific" mode
@@ -373,22 +412,23 @@ class FilesystemTarget:
     def from_dict(cls, name: str, data: FilesystemTargetDict) -> FilesystemTarget:
         """Create from dictionary."""
         branch_mode_str = data.get("branch_mode", "match")
-        try:
-            branch_mode = BranchMode(branch_mode_str)
-        except ValueError:
-            branch_mode = BranchMode.MATCH
+        branch_mode = (
+            _BRANCH_MODE_BY_VALUE.get(branch_mode_str, BranchMode.MATCH)
+            if isinstance(branch_mode_str, str)
+            else BranchMode.MATCH
+        )
 
         return cls(
             name=name,
             path=data.get("path", ""),
-            exclude=data.get("exclude", DEFAULT_SYNC_EXCLUDES.copy()),
+            exclude=_list_or_default(data.get("exclude"), DEFAULT_SYNC_EXCLUDES),
             delete=data.get("delete", DEFAULT_SYNC_DELETE),
             branch_mode=branch_mode,
             branch=data.get("branch", ""),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RsyncTarget:
     """Configuration for an rsync sync target."""
 
@@ -398,9 +438,9 @@ class RsyncTarget:
     user: str = ""
     port: int = DEFAULT_RSYNC_PORT
     ssh_key: str = ""
-    exclude: list[str] = field(default_factory=lambda: DEFAULT_SYNC_EXCLUDES.copy())
+    exclude: list[str] = field(default_factory=lambda: list(DEFAULT_SYNC_EXCLUDES))
     delete: bool = DEFAULT_SYNC_DELETE
-    options: list[str] = field(default_factory=lambda: DEFAULT_RSYNC_OPTIONS.copy())
+    options: list[str] = field(default_factory=lambda: list(DEFAULT_RSYNC_OPTIONS))
     branch_mode: BranchMode = BranchMode.MATCH  # Match source branch by default
     branch: str = ""  # Target branch for "specific" mode
     target_type: SyncTargetType = SyncTargetType.RSYNC
@@ -409,17 +449,18 @@ class RsyncTarget:
     def from_dict(cls, name: str, data: RsyncTargetDict) -> RsyncTarget:
         """Create from dictionary."""
         branch_mode_str = data.get("branch_mode", "match")
-        try:
-            branch_mode = BranchMode(branch_mode_str)
-        except ValueError:
-            branch_mode = BranchMode.MATCH
+        branch_mode = (
+            _BRANCH_MODE_BY_VALUE.get(branch_mode_str, BranchMode.MATCH)
+            if isinstance(branch_mode_str, str)
+            else BranchMode.MATCH
+        )
 
         # Merge user options with defaults if provided, otherwise use defaults
         user_options = data.get("options")
         if user_options is not None:
             options = user_options  # User explicitly specified, use theirs
         else:
-            options = DEFAULT_RSYNC_OPTIONS.copy()  # Use sensible defaults
+            options = list(DEFAULT_RSYNC_OPTIONS)  # Use sensible defaults
 
         return cls(
             name=name,
@@ -428,7 +469,7 @@ class RsyncTarget:
             user=data.get("user", ""),
             port=data.get("port", DEFAULT_RSYNC_PORT),
             ssh_key=data.get("ssh_key", ""),
-            exclude=data.get("exclude", DEFAULT_SYNC_EXCLUDES.copy()),
+            exclude=_list_or_default(data.get("exclude"), DEFAULT_SYNC_EXCLUDES),
             delete=data.get("delete", DEFAULT_SYNC_DELETE),
             options=options,
             branch_mode=branch_mode,
@@ -448,7 +489,7 @@ class RsyncTarget:
         return self.host
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncTargetResult:
     """Result of a sync target operation."""
 
@@ -461,7 +502,28 @@ class SyncTargetResult:
     duration: float = 0.0
 
 
-@dataclass
+def _ready_regex_error(pattern: str) -> str | None:
+    """Return why a ready_regex does not compile, or None if it is usable."""
+    try:
+        re.compile(pattern)
+    except re.error as e:
+        return str(e)
+    return None
+
+
+def _checked_ready_regex(name: str, pattern: str) -> str:
+    """Warn about an invalid ready_regex while loading config.
+
+    The pattern is kept as written, so connecting reports the problem as a
+    failed VpnResult instead of silently waiting on the client.
+    """
+    error = _ready_regex_error(pattern) if pattern else None
+    if error is not None:
+        logger.warning(f"Invalid ready_regex for VPN '{name}': {error}")
+    return pattern
+
+
+@dataclass(slots=True)
 class VpnConfig:
     """Configuration for a VPN connection."""
 
@@ -469,8 +531,11 @@ class VpnConfig:
     connect_cmd: str
     disconnect_cmd: str
     check_cmd: str = ""  # Command to check if VPN is connected
+    interface: str = ""  # Network interface the VPN brings up, e.g. "wg0"
     timeout: int = DEFAULT_VPN_TIMEOUT
     auto_connect: bool = DEFAULT_VPN_AUTO_CONNECT
+    fast_verify: bool = DEFAULT_VPN_FAST_VERIFY
+    ready_regex: str = ""  # Output line that means a foreground client is up
 
     @classmethod
     def from_dict(cls, name: str, data: VpnConfigDict) -> VpnConfig:
@@ -480,18 +545,21 @@ class VpnConfig:
             connect_cmd=data.get("connect_cmd", ""),
             disconnect_cmd=data.get("disconnect_cmd", ""),
             check_cmd=data.get("check_cmd", ""),
+            interface=data.get("interface", ""),
             timeout=data.get("timeout", DEFAULT_VPN_TIMEOUT),
             auto_connect=data.get("auto_connect", DEFAULT_VPN_AUTO_CONNECT),
+            fast_verify=data.get("fast_verify", DEFAULT_VPN_FAST_VERIFY),
+            ready_regex=_checked_ready_regex(name, data.get("ready_regex", "")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RemoteConfig:
     """Configuration for a single remote."""
 
     name: str
     priority: int = DEFAULT_REMOTE_PRIORITY
-    branches: list[str] = field(default_factory=lambda: DEFAULT_REMOTE_BRANCHES.copy())
+    branches: list[str] = field(default_factory=lambda: list(DEFAULT_REMOTE_BRANCHES))
     force_push: ForcePushPolicy = ForcePushPolicy.BLOCK
     retry: int = DEFAULT_REMOTE_RETRY
     timeout: int = DEFAULT_REMOTE_TIMEOUT
@@ -503,10 +571,11 @@ class RemoteConfig:
     def from_dict(cls, name: str, data: RemoteConfigDict) -> RemoteConfig:
         """Create from dictionary."""
         force_push_str = data.get("force_push", DEFAULT_FORCE_PUSH_POLICY)
-        try:
-            force_push = ForcePushPolicy(force_push_str)
-        except ValueError:
-            force_push = ForcePushPolicy.BLOCK
+        force_push = (
+            _FORCE_PUSH_BY_VALUE.get(force_push_str, ForcePushPolicy.BLOCK)
+            if isinstance(force_push_str, str)
+            else ForcePushPolicy.BLOCK
+        )
 
         # Handle vpn field - can be string name or inline config
         vpn_value = data.get("vpn")
@@ -520,7 +589,7 @@ class RemoteConfig:
         return cls(
             name=name,
             priority=data.get("priority", DEFAULT_REMOTE_PRIORITY),
-            branches=data.get("branches", DEFAULT_REMOTE_BRANCHES.copy()),
+            branches=_list_or_default(data.get("branches"), DEFAULT_REMOTE_BRANCHES),
             force_push=force_push,
             retry=data.get("retry", DEFAULT_REMOTE_RETRY),
             timeout=data.get("timeout", DEFAULT_REMOTE_TIMEOUT),
@@ -540,7 +609,7 @@ class RemoteConfig:
                 config.timeout = host_config.get("timeout", DEFAULT_REMOTE_TIMEOUT)
                 config.retry = host_config.get("retry", DEFAULT_REMOTE_RETRY)
                 force_push_str = host_config.get("force_push", DEFAULT_FORCE_PUSH_POLICY)
-                config.force_push = ForcePushPolicy(force_push_str)
+                config.force_push = _FORCE_PUSH_BY_VALUE.get(str(force_push_str), ForcePushPolicy.BLOCK)
                 break
 
         # Detect backup remotes - give them higher retry counts
@@ -558,8 +627,12 @@ class RemoteConfig:
 
         return config
 
+    def matches_branch(self, branch: str) -> bool:
+        """Check if this remote should receive the given branch."""
+        return branch_matches_pattern(branch, self.branches)
+
 
-@dataclass
+@dataclass(slots=True)
 class SyncConfig:
     """Configuration for remote sync operations."""
 
@@ -640,7 +713,7 @@ class SyncConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PushResult:
     """Result of a single push operation."""
 
@@ -654,7 +727,7 @@ class PushResult:
     vpn_used: str | None = None  # VPN name if VPN was used
 
 
-@dataclass
+@dataclass(slots=True)
 class VpnResult:
     """Result of a VPN operation."""
 
@@ -664,7 +737,7 @@ class VpnResult:
     duration: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheckResult:
     """Result of a health check for a remote."""
 
@@ -675,7 +748,7 @@ class HealthCheckResult:
     error: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncStatusResult:
     """Status of sync between local and remote branches."""
 
@@ -688,14 +761,33 @@ class SyncStatusResult:
     behind_count: int = 0
 
 
-@dataclass
+def _epoch_seconds(value: float | str) -> float:
+    """Read a queued_at value, accepting ISO 8601 text from older queues.
+
+    Raises:
+        ValueError: If the value is neither a number nor an ISO 8601 timestamp
+    """
+    if not isinstance(value, str):
+        return float(value)
+    try:
+        return float(value)
+    except ValueError:
+        from datetime import datetime
+
+        # fromisoformat() only accepts a "Z" suffix from Python 3.11
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value).timestamp()
+
+
+@dataclass(slots=True)
 class QueuedPush:
     """A queued push operation for offline processing."""
 
     remote: str
     branch: str
     commit_sha: str
-    queued_at: str
+    queued_at: float  # epoch seconds
     retries: int = 0
     last_error: str = ""
 
@@ -717,13 +809,13 @@ class QueuedPush:
             remote=data["remote"],
             branch=data["branch"],
             commit_sha=data["commit_sha"],
-            queued_at=data["queued_at"],
+            queued_at=_epoch_seconds(data["queued_at"]),
             retries=data.get("retries", 0),
             last_error=data.get("last_error", ""),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class OfflineQueue:
     """Queue of push operations to retry later."""
 
@@ -749,7 +841,7 @@ class OfflineQueue:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncResult:
     """Result of a sync operation."""
 
@@ -804,38 +896,52 @@ class Colors:
         cls.WHITE = ""
 
 
+# Decide on colors once at import so every Logger (and anything printed
+# before one exists) agrees; honors https://no-color.org
+if not sys.stdout.isatty() or "NO_COLOR" in os.environ or os.environ.get("TERM") == "dumb":
+    Colors.disable()
+
+
 class Logger:
     """Logger with colored output and verbosity levels."""
 
     def __init__(self, verbose: bool = False, quiet: bool = False) -> None:
         self.verbose = verbose
         self.quiet = quiet
-        if not sys.stdout.isatty():
-            Colors.disable()
+
+        # Colors were settled at import, so build the per-level decorations once.
+        # Each line then goes out in a single write, which also keeps lines
+        # logged from parallel push workers from interleaving.
+        self._info_prefix = f"{Colors.BLUE}ℹ{Colors.RESET} "
+        self._success_prefix = f"{Colors.GREEN}✓{Colors.RESET} "
+        self._warning_prefix = f"{Colors.YELLOW}⚠{Colors.RESET} "
+        self._error_prefix = f"{Colors.RED}✗{Colors.RESET} "
+        self._debug_prefix = f"{Colors.DIM}  "
+        self._debug_suffix = f"{Colors.RESET}\n"
 
     def info(self, message: str) -> None:
         """Print info message."""
         if not self.quiet:
-            print(f"{Colors.BLUE}ℹ{Colors.RESET} {message}")
+            sys.stdout.write(self._info_prefix + message + "\n")
 
     def success(self, message: str) -> None:
         """Print success message."""
         if not self.quiet:
-            print(f"{Colors.GREEN}✓{Colors.RESET} {message}")
+            sys.stdout.write(self._success_prefix + message + "\n")
 
     def warning(self, message: str) -> None:
         """Print warning message."""
         if not self.quiet:
-            print(f"{Colors.YELLOW}⚠{Colors.RESET} {message}")
+            sys.stdout.write(self._warning_prefix + message + "\n")
 
     def error(self, message: str) -> None:
         """Print error message (always shown)."""
-        print(f"{Colors.RED}✗{Colors.RESET} {message}", file=sys.stderr)
+        sys.stderr.write(self._error_prefix + message + "\n")
 
     def debug(self, message: str) -> None:
         """Print debug message (only in verbose mode)."""
         if self.verbose:
-            print(f"{Colors.DIM}  {message}{Colors.RESET}")
+            sys.stdout.write(self._debug_prefix + message + self._debug_suffix)
 
     def header(self, message: str) -> None:
         """Print header message."""
@@ -882,6 +988,56 @@ def get_ssh_binary() -> str:
     return "ssh"
 
 
+# Environment for our git subprocesses, built on first use
+_git_env: dict[str, str] | None = None
+_git_env_lock = threading.Lock()
+
+
+def _get_git_env() -> dict[str, str]:
+    """Build the environment shared by every run_git_command call.
+
+    The repository is located once and pinned with GIT_DIR/GIT_WORK_TREE so
+    later git calls skip the upward .git discovery walk, and
+    GIT_OPTIONAL_LOCKS=0 keeps read-only commands from taking the index
+    lock. The same rev-parse also primes the current-branch memo. A GIT_DIR
+    already set by the caller (e.g. a hook) is left alone.
+    """
+    global _git_env
+    with _git_env_lock:
+        if _git_env is not None:
+            return _git_env
+
+        env = dict(os.environ, GIT_OPTIONAL_LOCKS="0")
+        if "GIT_DIR" not in env:
+            try:
+                result = subprocess.run(
+                    [
+                        get_git_binary(),
+                        "rev-parse",
+                        "--absolute-git-dir",
+                        "--show-toplevel",
+                        "--abbrev-ref",
+                        "HEAD",
+                    ],
+                    capture_output=True,
+                    text=True,
+                    timeout=10,
+                    check=False,
+                )
+                lines = result.stdout.splitlines() if result.returncode == 0 else []
+            except (OSError, subprocess.TimeoutExpired):
+                lines = []
+
+            # Bare repositories, unborn branches and non-repos keep discovery
+            if len(lines) == 3 and os.path.isdir(lines[0]):
+                env["GIT_DIR"] = lines[0]
+                env["GIT_WORK_TREE"] = lines[1]
+                _git_cache.setdefault(("branch",), lines[2] if lines[2] != "HEAD" else None)
+
+        _git_env = env
+        return env
+
+
 def run_git_command(
     args: list[str],
     timeout: int | None = None,
@@ -896,6 +1052,7 @@ def run_git_command(
             text=True,
             timeout=timeout,
             check=False,
+            env=_get_git_env(),
         )
         return result
     except subprocess.TimeoutExpired as e:
@@ -909,24 +1066,112 @@ def run_git_command(
         )
 
 
-def get_current_branch() -> str | None:
-    """Get the current git branch name."""
-    result = run_git_command(["rev-parse", "--abbrev-ref", "HEAD"])
-    if result.returncode == 0:
-        return result.stdout.strip()
-    return None
+# Per-run memo for git queries whose answers cannot change while we run
+# (remote URLs, the checked-out branch and commit), keyed by query; None
+# is a cached "no answer". Remote names are kept apart as a tuple.
+_git_cache: dict[tuple[str, ...], str | None] = {}
+_git_remotes_cache: tuple[str, ...] | None = None
+
+
+def reset_git_caches() -> None:
+    """Forget all memoized git state, including the ref snapshot."""
+    global _ahead_behind_supported, _git_env, _git_remotes_cache
+    _git_cache.clear()
+    _git_remotes_cache = None
+    _ahead_behind_supported = None
+    with _git_env_lock:
+        _git_env = None
+    invalidate_refs_cache()
+
+
+# Snapshot of refs/heads and refs/remotes (refname -> SHA) shared by the
+# commit lookups below; "HEAD" is included when a branch is checked out.
+_refs_cache: dict[str, str] | None = None
+_refs_lock = threading.Lock()
+
+
+def load_all_refs() -> dict[str, str] | None:
+    """Load every local and remote-tracking ref with a single git call.
+
+    The result is cached for the rest of the run; fetches and pushes drop it
+    via ``invalidate_refs_cache``.
+
+    Returns:
+        Mapping of full refname to commit SHA, or None if git failed.
+    """
+    global _refs_cache
+    with _refs_lock:
+        if _refs_cache is not None:
+            return _refs_cache
+
+        result = run_git_command(
+            [
+                "for-each-ref",
+                "--format=%(HEAD)%(objectname) %(refname)",
+                "refs/heads",
+                "refs/remotes",
+            ]
+        )
+        if result.returncode != 0:
+            return None
+
+        refs: dict[str, str] = {}
+        for line in result.stdout.splitlines():
+            sha, sep, refname = line[1:].partition(" ")
+            if not sep or not refname:
+                continue
+            refs[refname] = sha
+            if line[0] == "*":
+                refs["HEAD"] = sha
+
+        _refs_cache = refs
+        return refs
+
+
+def invalidate_refs_cache() -> None:
+    """Drop the cached ref snapshot after refs may have moved."""
+    global _refs_cache
+    with _refs_lock:
+        _refs_cache = None
+
+
+def resolve_refs(*names: str) -> list[str] | None:
+    """Resolve several revisions to commit SHAs with one rev-parse call.
+
+    Returns:
+        SHAs in the order given, or None if any name does not resolve.
+    """
+    result = run_git_command(["rev-parse", *names])
+    if result.returncode != 0:
+        return None
+    shas = result.stdout.split()
+    return shas if len(shas) == len(names) else None
 
 
 def get_current_commit() -> str | None:
     """Get the current commit SHA."""
-    result = run_git_command(["rev-parse", "HEAD"])
-    if result.returncode == 0:
-        return result.stdout.strip()
-    return None
+    key = ("commit",)
+    if key in _git_cache:
+        return _git_cache[key]
+
+    refs = load_all_refs()
+    if refs and "HEAD" in refs:
+        commit: str | None = refs["HEAD"]
+    else:
+        # Detached HEAD (or no snapshot) - ask git directly
+        result = run_git_command(["rev-parse", "HEAD"])
+        commit = result.stdout.strip() if result.returncode == 0 else None
+
+    _git_cache[key] = commit
+    return commit
 
 
 def get_remote_commit(remote: str, branch: str) -> str | None:
     """Get the commit SHA of a remote branch."""
+    refs = load_all_refs()
+    if refs is not None:
+        return refs.get(f"refs/remotes/{remote}/{branch}")
+
     result = run_git_command(["rev-parse", f"{remote}/{branch}"])
     if result.returncode == 0:
         return result.stdout.strip()
@@ -935,37 +1180,50 @@ def get_remote_commit(remote: str, branch: str) -> str | None:
 
 def get_configured_remotes() -> list[str]:
     """Get list of configured git remotes."""
-    result = run_git_command(["remote"])
-    if result.returncode == 0:
-        return [r.strip() for r in result.stdout.strip().split("\n") if r.strip()]
-    return []
+    global _git_remotes_cache
+    if _git_remotes_cache is None:
+        result = run_git_command(["remote"])
+        if result.returncode != 0:
+            return []
+        _git_remotes_cache = tuple(r.strip() for r in result.stdout.strip().split("\n") if r.strip())
+    return list(_git_remotes_cache)
 
 
 def get_remote_url(remote: str) -> str | None:
     """Get the URL of a remote."""
+    key = ("url", remote)
+    if key in _git_cache:
+        return _git_cache[key]
+
     result = run_git_command(["remote", "get-url", remote])
-    if result.returncode == 0:
-        return result.stdout.strip()
-    return None
+    url = result.stdout.strip() if result.returncode == 0 else None
+    _git_cache[key] = url
+    return url
 
 
 def fetch_remote(remote: str, timeout: int = 30) -> bool:
     """Fetch from a remote."""
     result = run_git_command(["fetch", remote], timeout=timeout)
+    invalidate_refs_cache()
     return result.returncode == 0
 
 
 def is_force_push_required(remote: str, branch: str) -> bool:
     """Check if a force push would be required."""
-    # Get local and remote commits
-    local_result = run_git_command(["rev-parse", branch])
-    remote_result = run_git_command(["rev-parse", f"{remote}/{branch}"])
+    # Get local and remote commits, preferring the cached ref snapshot
+    refs = load_all_refs() or {}
+    local_commit = refs.get(f"refs/heads/{branch}")
+    remote_commit = refs.get(f"refs/remotes/{remote}/{branch}")
 
-    if local_result.returncode != 0 or remote_result.returncode != 0:
+    if remote_commit is None and refs:
+        # No remote-tracking branch yet, so nothing can be overwritten
         return False
 
-    local_commit = local_result.stdout.strip()
-    remote_commit = remote_result.stdout.strip()
+    if local_commit is None or remote_commit is None:
+        resolved = resolve_refs(branch, f"{remote}/{branch}")
+        if resolved is None:
+            return False
+        local_commit, remote_commit = resolved
 
     if local_commit == remote_commit:
         return False
@@ -979,13 +1237,20 @@ def is_force_push_required(remote: str, branch: str) -> bool:
     return merge_base.stdout.strip() != remote_commit
 
 
-def get_sync_state(remote: str, branch: str) -> tuple[SyncState, int, int]:
-    """
-    Get the sync state between local and remote branch.
+def _classify_sync_state(ahead: int, behind: int) -> tuple[SyncState, int, int]:
+    """Turn ahead/behind counts into a (state, ahead, behind) tuple."""
+    if ahead == 0 and behind == 0:
+        return SyncState.IN_SYNC, 0, 0
+    elif ahead > 0 and behind == 0:
+        return SyncState.AHEAD, ahead, 0
+    elif ahead == 0 and behind > 0:
+        return SyncState.BEHIND, 0, behind
+    else:
+        return SyncState.DIVERGED, ahead, behind
 
-    Returns (state, ahead_count, behind_count).
-    """
-    # First, try to get the comparison
+
+def _rev_list_sync_state(remote: str, branch: str) -> tuple[SyncState, int, int]:
+    """Count ahead/behind for one pair with 'git rev-list --left-right'."""
     result = run_git_command(
         ["rev-list", "--left-right", "--count", f"{branch}...{remote}/{branch}"]
     )
@@ -1004,24 +1269,130 @@ def get_sync_state(remote: str, branch: str) -> tuple[SyncState, int, int]:
     except ValueError:
         return SyncState.UNKNOWN, 0, 0
 
-    if ahead == 0 and behind == 0:
-        return SyncState.IN_SYNC, 0, 0
-    elif ahead > 0 and behind == 0:
-        return SyncState.AHEAD, ahead, 0
-    elif ahead == 0 and behind > 0:
-        return SyncState.BEHIND, 0, behind
-    else:
-        return SyncState.DIVERGED, ahead, behind
+    return _classify_sync_state(ahead, behind)
+
+
+# Whether git understands %(ahead-behind:) (git 2.41+); None until probed
+_ahead_behind_supported: bool | None = None
+
+
+def _ahead_behind_for_remotes(branch: str, remotes: list[str]) -> dict[str, tuple[int, int]]:
+    """Count ahead/behind of a local branch against several remotes at once.
+
+    Uses one 'git for-each-ref' with the %(ahead-behind:) atom. Git before
+    2.41 rejects the atom; that is remembered and an empty mapping returned.
+
+    Returns:
+        Mapping of remote name to (ahead, behind) from the local branch's view
+    """
+    global _ahead_behind_supported
+    if _ahead_behind_supported is False:
+        return {}
+
+    refnames = {f"refs/remotes/{remote}/{branch}": remote for remote in remotes}
+    result = run_git_command(
+        ["for-each-ref", f"--format=%(refname) %(ahead-behind:refs/heads/{branch})", *refnames]
+    )
+    if result.returncode != 0:
+        _ahead_behind_supported = False
+        return {}
+    _ahead_behind_supported = True
+
+    counts: dict[str, tuple[int, int]] = {}
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        if len(parts) != 3 or parts[0] not in refnames:
+            continue
+        try:
+            # Counts are from the remote ref's side; flip them to the local view
+            counts[refnames[parts[0]]] = (int(parts[2]), int(parts[1]))
+        except ValueError:
+            continue
+    return counts
+
+
+def get_sync_states(
+    pairs: list[tuple[str, str]],
+) -> dict[tuple[str, str], tuple[SyncState, int, int]]:
+    """Get the sync state of many (remote, branch) pairs.
+
+    Identical tips are settled from the ref snapshot. Remaining remotes that
+    share a branch are counted together with one for-each-ref call where
+    git supports it; anything left falls back to a rev-list per pair.
+
+    Returns:
+        Mapping of (remote, branch) to (state, ahead_count, behind_count).
+    """
+    refs = load_all_refs() or {}
+    states: dict[tuple[str, str], tuple[SyncState, int, int]] = {}
+    pending: dict[str, list[str]] = {}
+
+    for remote, branch in pairs:
+        local_commit = refs.get(f"refs/heads/{branch}")
+        remote_commit = refs.get(f"refs/remotes/{remote}/{branch}")
+        if local_commit is None or remote_commit is None:
+            continue
+        if local_commit == remote_commit:
+            # Identical tips need no history walk
+            states[(remote, branch)] = (SyncState.IN_SYNC, 0, 0)
+        else:
+            pending.setdefault(branch, []).append(remote)
+
+    for branch, remotes in pending.items():
+        if len(remotes) > 1:
+            for remote, (ahead, behind) in _ahead_behind_for_remotes(branch, remotes).items():
+                states[(remote, branch)] = _classify_sync_state(ahead, behind)
+
+    for remote, branch in pairs:
+        if (remote, branch) not in states:
+            states[(remote, branch)] = _rev_list_sync_state(remote, branch)
+
+    return states
+
+
+def get_sync_state(remote: str, branch: str) -> tuple[SyncState, int, int]:
+    """
+    Get the sync state between local and remote branch.
+
+    Returns (state, ahead_count, behind_count).
+    """
+    return get_sync_states([(remote, branch)])[(remote, branch)]
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_branch_patterns(
+    patterns: tuple[str, ...],
+) -> tuple[bool, frozenset[str], re.Pattern[str] | None]:
+    """Compile branch glob patterns once per distinct pattern list.
+
+    Returns:
+        (match_all, literals, glob_regex) - match_all is set when "*" is
+        present, literals holds patterns without glob characters, and the
+        remaining globs are OR-ed into one regex (None when there are none)
+    """
+    if "*" in patterns:
+        return True, frozenset(), None
+
+    literals: set[str] = set()
+    globs: list[str] = []
+    for pattern in patterns:
+        pattern = os.path.normcase(pattern)
+        if any(c in pattern for c in "*?["):
+            globs.append(fnmatch.translate(pattern))
+        else:
+            literals.add(pattern)
+
+    glob_regex = re.compile("|".join(globs)) if globs else None
+    return False, frozenset(literals), glob_regex
 
 
 def branch_matches_pattern(branch: str, patterns: list[str]) -> bool:
     """Check if a branch name matches any of the patterns."""
-    for pattern in patterns:
-        if pattern == "*":
-            return True
-        if fnmatch.fnmatch(branch, pattern):
-            return True
-    return False
+    match_all, literals, glob_regex = _compile_branch_patterns(tuple(patterns))
+    if match_all:
+        return True
+    name = os.path.normcase(branch)
+    return name in literals or (glob_regex is not None and glob_regex.match(name) is not None)
 
 
 def load_config_file(config_path: Path | None = None) -> ConfigDict:
@@ -1101,9 +1472,16 @@ def discover_remotes(config: SyncConfig) -> SyncConfig:
     if not git_remotes:
         return config
 
+    # Resolve URLs up front; each lookup is an independent git call
+    if config.parallel and len(git_remotes) > 1:
+        with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+            urls = dict(zip(git_remotes, executor.map(get_remote_url, git_remotes)))
+    else:
+        urls = {remote: get_remote_url(remote) for remote in git_remotes}
+
     # Create smart configuration for each remote
     for i, remote in enumerate(git_remotes):
-        url = get_remote_url(remote)
+        url = urls[remote]
 
         if url:
             # Use smart defaults based on URL analysis
@@ -1134,6 +1512,192 @@ def discover_remotes(config: SyncConfig) -> SyncConfig:
     return config
 
 
+_last_iso_timestamp: tuple[int, str] = (-1, "")
+
+
+def _utc_iso_now() -> str:
+    """Return the current UTC time as an ISO 8601 timestamp with second precision.
+
+    The formatted string is reused until the second changes.
+    """
+    global _last_iso_timestamp
+    now = int(time.time())
+    cached_second, cached = _last_iso_timestamp
+    if now != cached_second:
+        cached = _format_utc_iso(now)
+        _last_iso_timestamp = (now, cached)
+    return cached
+
+
+def _format_utc_iso(epoch: float) -> str:
+    """Format epoch seconds as an ISO 8601 UTC timestamp with second precision."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(epoch))
+
+
+def _dump_json_line(data: Any) -> bytes:
+    """Serialize data as one compact JSON line, using orjson when available."""
+    try:
+        import orjson
+    except ImportError:
+        return (json.dumps(data, separators=(",", ":")) + "\n").encode("utf-8")
+    return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(raw)
+    return orjson.loads(raw)
+
+
+@contextlib.contextmanager
+def _queue_lock(path: Path) -> Iterator[None]:
+    """Serialize queue writers across processes via the queue lock file.
+
+    Uses flock where available; elsewhere each append is still a single
+    O_APPEND write, so only concurrent compactions can race.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
+
+    with open(path.with_name(QUEUE_LOCK_FILE), "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _append_queue_record(record: dict[str, Any], queue_path: Path | None = None) -> None:
+    """Append one record to the queue journal.
+
+    A single-document queue left by an older version is first rewritten as a
+    journal, since records appended after it would make the file unreadable.
+    """
+    path = queue_path or Path(QUEUE_FILE)
+    line = _dump_json_line(record)
+    try:
+        with _queue_lock(path):
+            if path.exists():
+                with open(path, "rb") as f:
+                    first = _read_first_line(f)
+                if first and not _is_journal_line(first):
+                    try:
+                        _write_queue(_parse_queue_file(path), path)
+                    except _QUEUE_PARSE_ERRORS as e:
+                        logger.error(f"Queue file {path} is unreadable, not updating it: {e}")
+                        return
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+    except OSError as e:
+        logger.error(f"Failed to update queue: {e}")
+
+
+def _replay_queue_journal(lines: Iterable[bytes]) -> OfflineQueue:
+    """Fold journal records into a queue, last write winning per remote/branch.
+
+    Records are consumed one at a time, so memory follows the number of live
+    items rather than the length of the journal.
+    """
+    queue = OfflineQueue()
+    items: dict[tuple[str, str], QueuedPush] = {}
+    first_enqueued: float | None = None
+    last_enqueued: float | None = None
+
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = _load_json(line)
+            op = record.pop("op", None)
+            if op == "meta":
+                queue.created_at = record.get("created_at", "")
+                queue.updated_at = record.get("updated_at", "")
+                continue
+
+            key = (record["remote"], record["branch"])
+            if op == "remove":
+                items.pop(key, None)
+            elif op == "put":
+                items[key] = QueuedPush.from_dict(record)
+            elif op == "enqueue":
+                existing = items.get(key)
+                if existing is not None:
+                    existing.commit_sha = record["commit_sha"]
+                    existing.retries += 1
+                    existing.last_error = record.get("last_error", "")
+                else:
+                    items[key] = QueuedPush.from_dict(record)
+                last_enqueued = _epoch_seconds(record["queued_at"])
+                if first_enqueued is None:
+                    first_enqueued = last_enqueued
+        except (ValueError, KeyError, TypeError, AttributeError):
+            # Torn final line from an interrupted append, or foreign data
+            continue
+
+    # Timestamps are formatted once, not per replayed record
+    if last_enqueued is not None:
+        queue.updated_at = _format_utc_iso(last_enqueued)
+        if not queue.created_at and first_enqueued is not None:
+            queue.created_at = _format_utc_iso(first_enqueued)
+
+    queue.items = list(items.values())
+    return queue
+
+
+# Errors raised by a queue file that exists but cannot be parsed
+_QUEUE_PARSE_ERRORS = (yaml.YAMLError, ValueError, KeyError, TypeError, AttributeError)
+
+
+def _read_first_line(f: IO[bytes]) -> bytes:
+    """Read the first non-blank line of a file, or b"" if there is none."""
+    first = f.readline()
+    while first and not first.strip():
+        first = f.readline()
+    return first
+
+
+def _is_journal_line(line: bytes) -> bool:
+    """Check whether a line is a queue journal record."""
+    try:
+        head = _load_json(line)
+    except ValueError:
+        return False
+    return isinstance(head, dict) and "op" in head
+
+
+def _parse_queue_file(path: Path) -> OfflineQueue:
+    """Parse a queue file in journal or legacy single-document form.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError, KeyError, TypeError, AttributeError, yaml.YAMLError: If a
+            single-document queue is corrupt
+    """
+    with open(path, "rb") as f:
+        first = _read_first_line(f)
+        if not first:
+            return OfflineQueue()
+        if _is_journal_line(first):
+            return _replay_queue_journal(itertools.chain((first,), f))
+        raw = first + f.read()
+
+    # Single-document queue written by an older version (JSON or YAML)
+    try:
+        data = _load_json(raw)
+    except ValueError:
+        data = yaml.safe_load(raw)
+    return OfflineQueue.from_dict(data or {})
+
+
 def load_queue(queue_path: Path | None = None) -> OfflineQueue:
     """Load the offline queue from disk."""
     path = queue_path or Path(QUEUE_FILE)
@@ -1141,29 +1705,64 @@ def load_queue(queue_path: Path | None = None) -> OfflineQueue:
         return OfflineQueue()
 
     try:
-        with open(path, encoding='utf-8') as f:
-            data = yaml.safe_load(f) or {}
-        return OfflineQueue.from_dict(data)
-    except (yaml.YAMLError, OSError):
+        return _parse_queue_file(path)
+    except (OSError, *_QUEUE_PARSE_ERRORS):
         return OfflineQueue()
 
 
-def save_queue(queue: OfflineQueue, queue_path: Path | None = None) -> bool:
-    """Save the offline queue to disk."""
-    path = queue_path or Path(QUEUE_FILE)
-    queue.updated_at = datetime.now(timezone.utc).isoformat()
+def _write_queue(queue: OfflineQueue, path: Path) -> None:
+    """Rewrite the journal as one meta record plus one record per item."""
+    queue.updated_at = _utc_iso_now()
     if not queue.created_at:
         queue.created_at = queue.updated_at
 
+    lines = [
+        _dump_json_line(
+            {"op": "meta", "created_at": queue.created_at, "updated_at": queue.updated_at}
+        )
+    ]
+    lines.extend(_dump_json_line({"op": "put", **item.to_dict()}) for item in queue.items)
+
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(b"".join(lines))
+    os.replace(tmp_path, path)
+
+
+def save_queue(queue: OfflineQueue, queue_path: Path | None = None) -> bool:
+    """Save the offline queue to disk."""
+    path = queue_path or Path(QUEUE_FILE)
     try:
-        with open(path, 'w', encoding='utf-8') as f:
-            yaml.dump(queue.to_dict(), f, default_flow_style=False, sort_keys=False)
+        with _queue_lock(path):
+            _write_queue(queue, path)
         return True
     except OSError as e:
         logger.error(f"Failed to save queue: {e}")
         return False
 
 
+def compact_queue(queue_path: Path | None = None) -> bool:
+    """Rewrite the queue journal without superseded or removed records."""
+    path = queue_path or Path(QUEUE_FILE)
+    try:
+        with _queue_lock(path):
+            if not path.exists():
+                return True
+            try:
+                queue = _parse_queue_file(path)
+            except _QUEUE_PARSE_ERRORS as e:
+                # Never discard a file that could not be read back
+                logger.error(f"Queue file {path} is unreadable, not compacting it: {e}")
+                return False
+            if queue.items:
+                _write_queue(queue, path)
+            else:
+                path.unlink()
+        return True
+    except OSError as e:
+        logger.error(f"Failed to compact queue: {e}")
+        return False
+
+
 def clear_queue(queue_path: Path | None = None) -> bool:
     """Clear the offline queue."""
     path = queue_path or Path(QUEUE_FILE)
@@ -1184,51 +1783,88 @@ def add_to_queue(
     error: str = "",
     queue_path: Path | None = None,
 ) -> None:
-    """Add a failed push to the offline queue."""
-    queue = load_queue(queue_path)
+    """Add a failed push to the offline queue.
 
-    # Check if already queued
-    for item in queue.items:
-        if item.remote == remote and item.branch == branch:
-            item.commit_sha = commit_sha
-            item.retries += 1
-            item.last_error = error
-            save_queue(queue, queue_path)
-            return
-
-    # Add new item
-    queue.items.append(
-        QueuedPush(
-            remote=remote,
-            branch=branch,
-            commit_sha=commit_sha,
-            queued_at=datetime.now(timezone.utc).isoformat(),
-            last_error=error,
-        )
+    Appends a single journal record; re-queuing a remote/branch that is
+    already queued bumps its retry count when the journal is replayed.
+    """
+    _append_queue_record(
+        {
+            "op": "enqueue",
+            "remote": remote,
+            "branch": branch,
+            "commit_sha": commit_sha,
+            "queued_at": time.time(),
+            "last_error": error,
+        },
+        queue_path,
     )
-    save_queue(queue, queue_path)
 
 
 def remove_from_queue(remote: str, branch: str, queue_path: Path | None = None) -> None:
     """Remove an item from the offline queue."""
-    queue = load_queue(queue_path)
-    queue.items = [
-        item for item in queue.items if not (item.remote == remote and item.branch == branch)
-    ]
-    save_queue(queue, queue_path)
+    _append_queue_record({"op": "remove", "remote": remote, "branch": branch}, queue_path)
 
 
-# Track active VPN connections for cleanup
+# Track active VPN connections for cleanup. Every access is a single dict
+# operation (set, pop, copy), each atomic in CPython, so no lock is needed;
+# anything needing check-then-act across workers must add one.
 _active_vpn_connections: dict[str, VpnConfig] = {}
-_vpn_lock = threading.Lock()
+
+
+# Characters that need a real shell (expansion, redirection, job control);
+# quoting alone is handled by shlex
+_SHELL_METACHARACTERS = frozenset("|&;<>()$`\\*?[]{}~#!\n")
+
+
+# Commands that looked simple but could not be executed directly (a shell
+# builtin, or a program missing from PATH); these go straight to the shell
+_shell_only_commands: set[str] = set()
+
+
+@functools.lru_cache(maxsize=None)
+def _split_simple_command(command: str) -> tuple[str, ...] | None:
+    """Split a command into argv when running it needs no shell features.
+
+    Returns:
+        The argv tuple, or None if the command must go through /bin/sh
+    """
+    if _SHELL_METACHARACTERS.intersection(command):
+        return None
+    try:
+        argv = tuple(shlex.split(command))
+    except ValueError:
+        return None
+    # Leading VAR=value assignments are a shell feature too
+    if not argv or "=" in argv[0]:
+        return None
+    return argv
 
 
 def run_shell_command(
     command: str,
     timeout: int | None = None,
 ) -> subprocess.CompletedProcess[str]:
-    """Run a shell command and return the result."""
+    """Run a shell command and return the result.
+
+    Plain commands are executed directly, saving the intermediate shell
+    process; anything using shell syntax, or naming a builtin rather than
+    a program, still runs through the shell.
+    """
     try:
+        argv = None if command in _shell_only_commands else _split_simple_command(command)
+        if argv is not None:
+            try:
+                return subprocess.run(
+                    argv,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                    check=False,
+                )
+            except OSError:
+                _shell_only_commands.add(command)
+
         result = subprocess.run(
             command,
             shell=True,
@@ -1242,26 +1878,276 @@ def run_shell_command(
         return subprocess.CompletedProcess(
             command, 124, stdout="", stderr=f"Command timed out after {timeout}s"
         )
-    except Exception as e:
-        return subprocess.CompletedProcess(
-            command, 1, stdout="", stderr=str(e)
-        )
+    except Exception as e:
+        return subprocess.CompletedProcess(
+            command, 1, stdout="", stderr=str(e)
+        )
+
+
+# Recent check_cmd outcomes by VPN name as (monotonic time, connected), so
+# back-to-back checks share one command run
+_VPN_CHECK_TTL = 2.0
+_vpn_check_cache: dict[str, tuple[float, bool]] = {}
+
+
+def is_vpn_connected(vpn_config: VpnConfig) -> bool:
+    """Check if a VPN is currently connected.
+
+    The outcome is reused for a couple of seconds; connecting or
+    disconnecting drops it so the next check sees the new state.
+    """
+    if not vpn_config.check_cmd:
+        # No check command - assume not connected
+        return False
+
+    now = time.monotonic()
+    cached = _vpn_check_cache.get(vpn_config.name)
+    if cached is not None and now - cached[0] < _VPN_CHECK_TTL:
+        return cached[1]
+
+    result = run_shell_command(vpn_config.check_cmd, timeout=10)
+    connected = result.returncode == 0
+    _vpn_check_cache[vpn_config.name] = (now, connected)
+    return connected
+
+
+def _vpn_interface_up(vpn_config: VpnConfig) -> bool:
+    """Cheaply tell whether a VPN this process connected is still up.
+
+    Only a VPN we connected ourselves whose interface still exists counts;
+    anything else needs the real check command.
+    """
+    return (
+        bool(vpn_config.interface)
+        and vpn_config.name in _active_vpn_connections
+        and os.path.exists(f"/sys/class/net/{vpn_config.interface}")
+    )
+
+
+# Backoff bounds for polling check_cmd after a connect, and the fixed wait
+# used instead when there is no check command
+_VPN_POLL_INITIAL_DELAY = 0.05
+_VPN_POLL_MAX_DELAY = 0.5
+_VPN_SETTLE_DELAY = 0.25
+
+
+def _wait_for_vpn(vpn_config: VpnConfig) -> bool:
+    """Poll check_cmd until the VPN reports connected or its timeout runs out.
+
+    Fast tunnels are seen within tens of milliseconds; slow ones get the
+    full timeout rather than a single check after a fixed pause.
+    """
+    deadline = time.monotonic() + vpn_config.timeout
+    delay = _VPN_POLL_INITIAL_DELAY
+    while True:
+        # Each poll must run the command, not reuse a cached "down"
+        _vpn_check_cache.pop(vpn_config.name, None)
+        if is_vpn_connected(vpn_config):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, _VPN_POLL_MAX_DELAY)
+
+
+# Printed between connect_cmd and check_cmd in a fused command, so a
+# failure can be pinned on one or the other
+_VPN_CONNECTED_MARKER = "__remote_sync_vpn_connected__"
+
+
+def _vpn_fuses_check(vpn_config: VpnConfig) -> bool:
+    """Whether connect_cmd and the first check_cmd run as one command."""
+    return vpn_config.fast_verify and bool(vpn_config.check_cmd) and not vpn_config.ready_regex
+
+
+def _vpn_connect_command(vpn_config: VpnConfig) -> str:
+    """Build the command that brings a VPN up.
+
+    With fast_verify, the first check runs in the same shell right after
+    a successful connect, saving a separate process round trip.
+    """
+    if _vpn_fuses_check(vpn_config):
+        return (
+            f"({vpn_config.connect_cmd}) && echo {_VPN_CONNECTED_MARKER} "
+            f"&& ({vpn_config.check_cmd})"
+        )
+    return vpn_config.connect_cmd
+
+
+def _vpn_connect_outcome(
+    vpn_config: VpnConfig,
+    result: subprocess.CompletedProcess[str],
+) -> tuple[bool, bool]:
+    """Read the result of _vpn_connect_command.
+
+    Returns:
+        (connect succeeded, connection already verified)
+    """
+    if _vpn_fuses_check(vpn_config):
+        verified = result.returncode == 0
+        return verified or _VPN_CONNECTED_MARKER in result.stdout, verified
+    return result.returncode == 0, False
+
+
+# Foreground VPN clients started with ready_regex, kept until disconnect
+_vpn_processes: dict[str, subprocess.Popen[bytes]] = {}
+_VPN_STOP_TIMEOUT = 5
+
+
+@functools.lru_cache(maxsize=None)
+def _devnull_fd() -> int:
+    """Open os.devnull once for child stdin; it stays open for the process."""
+    return os.open(os.devnull, os.O_RDONLY)
+
+
+def _drain_output(stream: Any) -> None:
+    """Read a pipe to EOF so its writer never blocks on a full buffer."""
+    while stream.read(65536):
+        pass
+    stream.close()
+
+
+def _start_vpn_until_ready(vpn_config: VpnConfig) -> subprocess.CompletedProcess[str]:
+    """Start connect_cmd and return as soon as its output matches ready_regex.
+
+    Clients such as openvpn print a readiness line long before they exit,
+    if they exit at all. On a match the process is left running, tracked
+    in _vpn_processes for disconnect_vpn, and its remaining output is
+    drained on a background thread. A command that exits first is
+    reported like run_shell_command would.
+    """
+    command = vpn_config.connect_cmd
+    timeout = vpn_config.timeout
+    pattern = re.compile(vpn_config.ready_regex)
+    # A session of its own lets disconnect stop everything the command
+    # started, not just the shell wrapping it
+    popen_kwargs: dict[str, Any] = {
+        "stdin": _devnull_fd(),
+        "stdout": subprocess.PIPE,
+        "stderr": subprocess.STDOUT,
+        "start_new_session": True,
+    }
+    argv = None if command in _shell_only_commands else _split_simple_command(command)
+    try:
+        proc = None
+        if argv is not None:
+            try:
+                proc = subprocess.Popen(argv, **popen_kwargs)
+            except OSError:
+                _shell_only_commands.add(command)
+        if proc is None:
+            proc = subprocess.Popen(command, shell=True, **popen_kwargs)
+    except OSError as e:
+        return subprocess.CompletedProcess(command, 1, stdout="", stderr=str(e))
+
+    assert proc.stdout is not None
+    fd = proc.stdout.fileno()
+    deadline = time.monotonic() + timeout
+    output = bytearray()
+    line_start = 0
+
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, selectors.EVENT_READ)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                _signal_vpn_client(proc, signal.SIGKILL)
+                proc.wait()
+                proc.stdout.close()
+                return subprocess.CompletedProcess(
+                    command, 124, stdout="", stderr=f"Command timed out after {timeout}s"
+                )
+            if not selector.select(remaining):
+                continue
+
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            output += chunk
+
+            # Only complete lines are matched
+            line_end = output.rfind(b"\n")
+            if line_end < line_start:
+                continue
+            lines = output[line_start:line_end].decode(errors="replace").splitlines()
+            line_start = line_end + 1
+            if any(pattern.search(line) for line in lines):
+                _vpn_processes[vpn_config.name] = proc
+                threading.Thread(target=_drain_output, args=(proc.stdout,), daemon=True).start()
+                return subprocess.CompletedProcess(
+                    command, 0, stdout=output.decode(errors="replace"), stderr=""
+                )
+
+    proc.stdout.close()
+    try:
+        returncode = proc.wait(timeout=max(deadline - time.monotonic(), 0))
+    except subprocess.TimeoutExpired:
+        _signal_vpn_client(proc, signal.SIGKILL)
+        proc.wait()
+        return subprocess.CompletedProcess(
+            command, 124, stdout="", stderr=f"Command timed out after {timeout}s"
+        )
+    return subprocess.CompletedProcess(
+        command, returncode, stdout=output.decode(errors="replace"), stderr=""
+    )
 
 
-def is_vpn_connected(vpn_config: VpnConfig) -> bool:
-    """Check if a VPN is currently connected."""
-    if not vpn_config.check_cmd:
-        # No check command - assume not connected
+def _signal_vpn_client(proc: subprocess.Popen[bytes], sig: int) -> bool:
+    """Signal a ready_regex client's whole process group.
+
+    Returns:
+        False once nothing in the group is left to signal
+    """
+    killpg = getattr(os, "killpg", None)
+    if killpg is not None:
+        try:
+            killpg(proc.pid, sig)
+            return True
+        except ProcessLookupError:
+            return False
+        except OSError:
+            pass
+    if proc.poll() is not None:
         return False
+    if sig:
+        proc.send_signal(sig)
+    return True
 
-    result = run_shell_command(vpn_config.check_cmd, timeout=10)
-    return result.returncode == 0
 
+def _stop_vpn_process(name: str) -> bool:
+    """Terminate a client started by _start_vpn_until_ready, if one is tracked.
 
-def connect_vpn(vpn_config: VpnConfig, dry_run: bool = False) -> VpnResult:
-    """Connect to a VPN."""
-    start_time = time.time()
+    The whole process group is asked to stop, then killed if anything in
+    it outlives _VPN_STOP_TIMEOUT.
+    """
+    proc = _vpn_processes.pop(name, None)
+    if proc is None:
+        return False
+
+    deadline = time.monotonic() + _VPN_STOP_TIMEOUT
+    _signal_vpn_client(proc, signal.SIGTERM)
+    # Reap the direct child each round so its zombie does not keep the group alive
+    while proc.poll() is None or _signal_vpn_client(proc, 0):
+        if time.monotonic() >= deadline:
+            _signal_vpn_client(proc, signal.SIGKILL)
+            break
+        time.sleep(_VPN_POLL_INITIAL_DELAY)
+    proc.wait()
+    return True
+
+
+# Connects in progress by VPN name; a second caller waits on the event
+# instead of starting the client again
+_vpn_inflight: dict[str, threading.Event] = {}
 
+
+def _vpn_connect_precheck(vpn_config: VpnConfig) -> VpnResult | None:
+    """Return the result for a VPN that cannot be connected as configured.
+
+    Returns:
+        None when the connect command can be tried
+    """
     if not vpn_config.connect_cmd:
         return VpnResult(
             vpn_name=vpn_config.name,
@@ -1269,8 +2155,23 @@ def connect_vpn(vpn_config: VpnConfig, dry_run: bool = False) -> VpnResult:
             message="No connect command configured",
         )
 
-    # Check if already connected
-    if vpn_config.check_cmd and is_vpn_connected(vpn_config):
+    regex_error = _ready_regex_error(vpn_config.ready_regex) if vpn_config.ready_regex else None
+    if regex_error is not None:
+        return VpnResult(
+            vpn_name=vpn_config.name,
+            connected=False,
+            message=f"Invalid ready_regex: {regex_error}",
+        )
+    return None
+
+
+def _vpn_connect_skipped(vpn_config: VpnConfig, already_connected: bool, dry_run: bool) -> VpnResult | None:
+    """Return the result for a connect that need not run the command.
+
+    Returns:
+        None when the connect command should run
+    """
+    if already_connected:
         logger.debug(f"VPN '{vpn_config.name}' is already connected")
         return VpnResult(
             vpn_name=vpn_config.name,
@@ -1284,72 +2185,162 @@ def connect_vpn(vpn_config: VpnConfig, dry_run: bool = False) -> VpnResult:
             connected=True,
             message=f"[DRY RUN] Would connect VPN: {vpn_config.connect_cmd}",
         )
+    return None
 
-    logger.info(f"Connecting to VPN '{vpn_config.name}'...")
-    result = run_shell_command(vpn_config.connect_cmd, timeout=vpn_config.timeout)
-    duration = time.time() - start_time
 
-    if result.returncode == 0:
-        # Track this connection for cleanup
-        with _vpn_lock:
-            _active_vpn_connections[vpn_config.name] = vpn_config
-
-        # Wait a moment for connection to stabilize
-        time.sleep(1)
-
-        # Verify connection if check command is available
-        if vpn_config.check_cmd:
-            if not is_vpn_connected(vpn_config):
-                return VpnResult(
-                    vpn_name=vpn_config.name,
-                    connected=False,
-                    message="VPN connect command succeeded but connection check failed",
-                    duration=round(duration, 2),
-                )
+def connect_vpn(vpn_config: VpnConfig, dry_run: bool = False) -> VpnResult:
+    """Connect to a VPN.
 
-        logger.success(f"Connected to VPN '{vpn_config.name}' in {duration:.1f}s")
-        return VpnResult(
-            vpn_name=vpn_config.name,
-            connected=True,
-            message="Connected successfully",
-            duration=round(duration, 2),
+    Concurrent calls for the same VPN run the connect command once; the
+    others wait for it and report the state it left behind.
+    """
+    start_time = time.monotonic()
+
+    precheck = _vpn_connect_precheck(vpn_config)
+    if precheck is not None:
+        return precheck
+
+    # Check if already connected, trying the interface before check_cmd
+    already_connected = _vpn_interface_up(vpn_config) or bool(
+        vpn_config.check_cmd and is_vpn_connected(vpn_config)
+    )
+    skipped = _vpn_connect_skipped(vpn_config, already_connected, dry_run)
+    if skipped is not None:
+        return skipped
+
+    event = threading.Event()
+    running = _vpn_inflight.setdefault(vpn_config.name, event)
+    if running is not event:
+        logger.debug(f"VPN '{vpn_config.name}' is already connecting, waiting...")
+        running.wait(timeout=vpn_config.timeout)
+        connected = (
+            is_vpn_connected(vpn_config)
+            if vpn_config.check_cmd
+            else vpn_config.name in _active_vpn_connections
         )
-    else:
-        error_msg = result.stderr.strip() or result.stdout.strip() or "Unknown error"
-        logger.error(f"Failed to connect VPN '{vpn_config.name}': {error_msg}")
+        return _concurrent_connect_result(vpn_config, connected, start_time)
+
+    try:
+        return _connect_vpn_now(vpn_config, start_time)
+    finally:
+        _vpn_inflight.pop(vpn_config.name, None)
+        event.set()
+
+
+def _concurrent_connect_result(vpn_config: VpnConfig, connected: bool, start_time: float) -> VpnResult:
+    """Build the result for a caller that waited on another caller's connect."""
+    return VpnResult(
+        vpn_name=vpn_config.name,
+        connected=connected,
+        message="Connected by a concurrent caller" if connected else "Concurrent connect failed",
+        duration=time.monotonic() - start_time,
+    )
+
+
+def _vpn_connect_failed(
+    vpn_config: VpnConfig,
+    result: subprocess.CompletedProcess[str],
+    duration: float,
+) -> VpnResult:
+    """Log and build the result for a connect command that failed."""
+    error_msg = result.stderr.strip() or result.stdout.strip() or "Unknown error"
+    logger.error(f"Failed to connect VPN '{vpn_config.name}': {error_msg}")
+    return VpnResult(
+        vpn_name=vpn_config.name,
+        connected=False,
+        message=error_msg,
+        duration=duration,
+    )
+
+
+def _vpn_connect_finished(vpn_config: VpnConfig, verified: bool, duration: float) -> VpnResult:
+    """Log and build the result once a connect has been checked, or not."""
+    if not verified:
         return VpnResult(
             vpn_name=vpn_config.name,
             connected=False,
-            message=error_msg,
-            duration=round(duration, 2),
+            message="VPN connect command succeeded but connection check failed",
+            duration=duration,
         )
 
+    logger.success(f"Connected to VPN '{vpn_config.name}' in {duration:.1f}s")
+    return VpnResult(
+        vpn_name=vpn_config.name,
+        connected=True,
+        message="Connected successfully",
+        duration=duration,
+    )
 
-def disconnect_vpn(vpn_config: VpnConfig, dry_run: bool = False) -> VpnResult:
-    """Disconnect from a VPN."""
-    start_time = time.time()
 
-    if not vpn_config.disconnect_cmd:
-        return VpnResult(
-            vpn_name=vpn_config.name,
-            connected=True,  # Assume still connected since we can't disconnect
-            message="No disconnect command configured",
-        )
+def _connect_vpn_now(vpn_config: VpnConfig, start_time: float) -> VpnResult:
+    """Run the connect command and verify the result, for connect_vpn."""
+    logger.info(f"Connecting to VPN '{vpn_config.name}'...")
+    if vpn_config.ready_regex:
+        result = _start_vpn_until_ready(vpn_config)
+    else:
+        result = run_shell_command(_vpn_connect_command(vpn_config), timeout=vpn_config.timeout)
+    _vpn_check_cache.pop(vpn_config.name, None)
+    duration = time.monotonic() - start_time
+    connect_ok, verified = _vpn_connect_outcome(vpn_config, result)
 
-    if dry_run:
+    if not connect_ok:
+        return _vpn_connect_failed(vpn_config, result, duration)
+
+    # Track this connection for cleanup
+    _active_vpn_connections[vpn_config.name] = vpn_config
+
+    # Verify connection if check command is available
+    if vpn_config.check_cmd:
+        verified = verified or _wait_for_vpn(vpn_config)
+    else:
+        # Nothing to poll; give the connection a moment to settle
+        time.sleep(_VPN_SETTLE_DELAY)
+        verified = True
+    return _vpn_connect_finished(vpn_config, verified, duration)
+
+
+def _vpn_stopped_result(vpn_config: VpnConfig, stopped: bool, start_time: float) -> VpnResult:
+    """Build the result for a VPN without a disconnect command.
+
+    Args:
+        stopped: Whether a client we started in the foreground was stopped
+    """
+    if stopped:
+        _vpn_check_cache.pop(vpn_config.name, None)
+        _active_vpn_connections.pop(vpn_config.name, None)
         return VpnResult(
             vpn_name=vpn_config.name,
             connected=False,
-            message=f"[DRY RUN] Would disconnect VPN: {vpn_config.disconnect_cmd}",
+            message="Disconnected successfully",
+            duration=time.monotonic() - start_time,
         )
+    return VpnResult(
+        vpn_name=vpn_config.name,
+        connected=True,  # Assume still connected since we can't disconnect
+        message="No disconnect command configured",
+    )
 
-    logger.debug(f"Disconnecting from VPN '{vpn_config.name}'...")
-    result = run_shell_command(vpn_config.disconnect_cmd, timeout=vpn_config.timeout)
-    duration = time.time() - start_time
+
+def _vpn_disconnect_dry_run(vpn_config: VpnConfig) -> VpnResult:
+    """Build the result for a disconnect skipped by dry_run."""
+    return VpnResult(
+        vpn_name=vpn_config.name,
+        connected=False,
+        message=f"[DRY RUN] Would disconnect VPN: {vpn_config.disconnect_cmd}",
+    )
+
+
+def _vpn_disconnect_outcome(
+    vpn_config: VpnConfig,
+    result: subprocess.CompletedProcess[str],
+    start_time: float,
+) -> VpnResult:
+    """Forget a VPN after its disconnect command ran and build the result."""
+    _vpn_check_cache.pop(vpn_config.name, None)
+    duration = time.monotonic() - start_time
 
     # Remove from active connections
-    with _vpn_lock:
-        _active_vpn_connections.pop(vpn_config.name, None)
+    _active_vpn_connections.pop(vpn_config.name, None)
 
     if result.returncode == 0:
         logger.debug(f"Disconnected from VPN '{vpn_config.name}'")
@@ -1357,7 +2348,7 @@ def disconnect_vpn(vpn_config: VpnConfig, dry_run: bool = False) -> VpnResult:
             vpn_name=vpn_config.name,
             connected=False,
             message="Disconnected successfully",
-            duration=round(duration, 2),
+            duration=duration,
         )
     else:
         error_msg = result.stderr.strip() or "Unknown error"
@@ -1365,20 +2356,191 @@ def disconnect_vpn(vpn_config: VpnConfig, dry_run: bool = False) -> VpnResult:
             vpn_name=vpn_config.name,
             connected=True,  # Assume still connected on failure
             message=f"Disconnect failed: {error_msg}",
-            duration=round(duration, 2),
+            duration=duration,
         )
 
 
+def disconnect_vpn(vpn_config: VpnConfig, dry_run: bool = False) -> VpnResult:
+    """Disconnect from a VPN."""
+    start_time = time.monotonic()
+
+    if not vpn_config.disconnect_cmd:
+        # A client we started in the foreground can still be stopped
+        stopped = not dry_run and _stop_vpn_process(vpn_config.name)
+        return _vpn_stopped_result(vpn_config, stopped, start_time)
+
+    if dry_run:
+        return _vpn_disconnect_dry_run(vpn_config)
+
+    logger.debug(f"Disconnecting from VPN '{vpn_config.name}'...")
+    result = run_shell_command(vpn_config.disconnect_cmd, timeout=vpn_config.timeout)
+    _stop_vpn_process(vpn_config.name)
+    return _vpn_disconnect_outcome(vpn_config, result, start_time)
+
+
 def disconnect_all_vpns(dry_run: bool = False) -> list[VpnResult]:
-    """Disconnect all active VPN connections."""
-    results = []
-    with _vpn_lock:
-        active = list(_active_vpn_connections.values())
+    """Disconnect all active VPN connections.
 
-    for vpn_config in active:
-        results.append(disconnect_vpn(vpn_config, dry_run))
+    Disconnects are independent and mostly wait on their commands, so
+    several run side by side and the total time is that of the slowest.
+    """
+    # Snapshot first: disconnect_vpn removes entries as we go
+    active = list(_active_vpn_connections.copy().values())
+    if len(active) < 2:
+        return [disconnect_vpn(vpn_config, dry_run) for vpn_config in active]
 
-    return results
+    with ThreadPoolExecutor(max_workers=min(len(active), 8)) as executor:
+        return list(executor.map(lambda vpn_config: disconnect_vpn(vpn_config, dry_run), active))
+
+
+async def _run_shell_command_async(
+    command: str,
+    timeout: float | None = None,
+) -> subprocess.CompletedProcess[str]:
+    """Run a command on the event loop, mirroring run_shell_command's results."""
+    argv = None if command in _shell_only_commands else _split_simple_command(command)
+    try:
+        proc = None
+        if argv is not None:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *argv, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+                )
+            except OSError:
+                _shell_only_commands.add(command)
+        if proc is None:
+            proc = await asyncio.create_subprocess_shell(
+                command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            )
+    except OSError as e:
+        return subprocess.CompletedProcess(command, 1, stdout="", stderr=str(e))
+
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return subprocess.CompletedProcess(
+            command, 124, stdout="", stderr=f"Command timed out after {timeout}s"
+        )
+    return subprocess.CompletedProcess(
+        command,
+        proc.returncode if proc.returncode is not None else -1,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
+
+
+async def is_vpn_connected_async(vpn_config: VpnConfig) -> bool:
+    """Async variant of is_vpn_connected, sharing its result cache."""
+    if not vpn_config.check_cmd:
+        return False
+
+    now = time.monotonic()
+    cached = _vpn_check_cache.get(vpn_config.name)
+    if cached is not None and now - cached[0] < _VPN_CHECK_TTL:
+        return cached[1]
+
+    result = await _run_shell_command_async(vpn_config.check_cmd, timeout=10)
+    connected = result.returncode == 0
+    _vpn_check_cache[vpn_config.name] = (now, connected)
+    return connected
+
+
+async def _wait_for_vpn_async(vpn_config: VpnConfig) -> bool:
+    """Async variant of _wait_for_vpn."""
+    deadline = time.monotonic() + vpn_config.timeout
+    delay = _VPN_POLL_INITIAL_DELAY
+    while True:
+        _vpn_check_cache.pop(vpn_config.name, None)
+        if await is_vpn_connected_async(vpn_config):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, _VPN_POLL_MAX_DELAY)
+
+
+async def connect_vpn_async(vpn_config: VpnConfig, dry_run: bool = False) -> VpnResult:
+    """Async variant of connect_vpn, for bringing up several VPNs at once.
+
+    Shares connect_vpn's in-flight bookkeeping, so a VPN that is already
+    connecting on another thread or task is waited for, not started again.
+    """
+    start_time = time.monotonic()
+
+    precheck = _vpn_connect_precheck(vpn_config)
+    if precheck is not None:
+        return precheck
+
+    already_connected = _vpn_interface_up(vpn_config) or bool(
+        vpn_config.check_cmd and await is_vpn_connected_async(vpn_config)
+    )
+    skipped = _vpn_connect_skipped(vpn_config, already_connected, dry_run)
+    if skipped is not None:
+        return skipped
+
+    event = threading.Event()
+    running = _vpn_inflight.setdefault(vpn_config.name, event)
+    if running is not event:
+        logger.debug(f"VPN '{vpn_config.name}' is already connecting, waiting...")
+        await asyncio.to_thread(running.wait, vpn_config.timeout)
+        connected = (
+            await is_vpn_connected_async(vpn_config)
+            if vpn_config.check_cmd
+            else vpn_config.name in _active_vpn_connections
+        )
+        return _concurrent_connect_result(vpn_config, connected, start_time)
+
+    try:
+        return await _connect_vpn_now_async(vpn_config, start_time)
+    finally:
+        _vpn_inflight.pop(vpn_config.name, None)
+        event.set()
+
+
+async def _connect_vpn_now_async(vpn_config: VpnConfig, start_time: float) -> VpnResult:
+    """Run the connect command and verify the result, for connect_vpn_async."""
+    logger.info(f"Connecting to VPN '{vpn_config.name}'...")
+    if vpn_config.ready_regex:
+        result = await asyncio.to_thread(_start_vpn_until_ready, vpn_config)
+    else:
+        result = await _run_shell_command_async(
+            _vpn_connect_command(vpn_config), timeout=vpn_config.timeout
+        )
+    _vpn_check_cache.pop(vpn_config.name, None)
+    duration = time.monotonic() - start_time
+    connect_ok, verified = _vpn_connect_outcome(vpn_config, result)
+
+    if not connect_ok:
+        return _vpn_connect_failed(vpn_config, result, duration)
+
+    _active_vpn_connections[vpn_config.name] = vpn_config
+
+    if vpn_config.check_cmd:
+        verified = verified or await _wait_for_vpn_async(vpn_config)
+    else:
+        await asyncio.sleep(_VPN_SETTLE_DELAY)
+        verified = True
+    return _vpn_connect_finished(vpn_config, verified, duration)
+
+
+async def disconnect_vpn_async(vpn_config: VpnConfig, dry_run: bool = False) -> VpnResult:
+    """Async variant of disconnect_vpn."""
+    start_time = time.monotonic()
+
+    if not vpn_config.disconnect_cmd:
+        stopped = not dry_run and await asyncio.to_thread(_stop_vpn_process, vpn_config.name)
+        return _vpn_stopped_result(vpn_config, stopped, start_time)
+
+    if dry_run:
+        return _vpn_disconnect_dry_run(vpn_config)
+
+    logger.debug(f"Disconnecting from VPN '{vpn_config.name}'...")
+    result = await _run_shell_command_async(vpn_config.disconnect_cmd, timeout=vpn_config.timeout)
+    await asyncio.to_thread(_stop_vpn_process, vpn_config.name)
+    return _vpn_disconnect_outcome(vpn_config, result, start_time)
 
 
 def get_vpn_for_remote(remote_config: RemoteConfig, config: SyncConfig) -> VpnConfig | None:
@@ -1389,8 +2551,30 @@ def get_vpn_for_remote(remote_config: RemoteConfig, config: SyncConfig) -> VpnCo
     return config.vpn_configs.get(remote_config.vpn)
 
 
+# Open VpnContext users per VPN name, and the names whose connection was
+# brought up by a context (and so is taken down after its last user).
+# Entering and leaving are check-then-act, so both hold that VPN's lock;
+# contexts for different VPNs never wait on each other.
+_vpn_users: dict[str, int] = {}
+_vpn_owned: set[str] = set()
+_vpn_locks: dict[str, threading.Lock] = {}
+
+
+def _vpn_lock(name: str) -> threading.Lock:
+    """Return the lock guarding VpnContext state for one VPN."""
+    lock = _vpn_locks.get(name)
+    if lock is None:
+        # setdefault is atomic, so racing callers still share one lock
+        lock = _vpn_locks.setdefault(name, threading.Lock())
+    return lock
+
+
 class VpnContext:
-    """Context manager for VPN connections with automatic cleanup."""
+    """Context manager for VPN connections with automatic cleanup.
+
+    Contexts for the same VPN share one connection: the first to enter
+    connects, later ones just join, and the last to leave disconnects.
+    """
 
     def __init__(
         self,
@@ -1408,20 +2592,41 @@ class VpnContext:
         if not self.vpn_config or not self.auto_connect:
             return self
 
-        # Check if already connected
-        if self.vpn_config.check_cmd and is_vpn_connected(self.vpn_config):
-            self.was_already_connected = True
-            self.connected = True
-            return self
+        name = self.vpn_config.name
+        with _vpn_lock(name):
+            users = _vpn_users.get(name, 0)
+            if users:
+                # Another context holds this VPN open
+                self.was_already_connected = True
+                self.connected = True
+            elif _vpn_interface_up(self.vpn_config) or (
+                self.vpn_config.check_cmd and is_vpn_connected(self.vpn_config)
+            ):
+                self.was_already_connected = True
+                self.connected = True
+            else:
+                result = connect_vpn(self.vpn_config, self.dry_run)
+                self.connected = result.connected
+                if self.connected:
+                    _vpn_owned.add(name)
 
-        result = connect_vpn(self.vpn_config, self.dry_run)
-        self.connected = result.connected
+            if self.connected:
+                _vpn_users[name] = users + 1
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        # Only disconnect if we connected (not if it was already connected)
-        if self.vpn_config and self.connected and not self.was_already_connected:
-            disconnect_vpn(self.vpn_config, self.dry_run)
+        if not self.vpn_config or not self.connected:
+            return None
+
+        name = self.vpn_config.name
+        with _vpn_lock(name):
+            users = _vpn_users.pop(name, 1) - 1
+            if users:
+                _vpn_users[name] = users
+            elif name in _vpn_owned:
+                # Last user of a connection a context opened
+                _vpn_owned.discard(name)
+                disconnect_vpn(self.vpn_config, self.dry_run)
         return None
 
 
@@ -1439,8 +2644,15 @@ def get_repo_root() -> Path | None:
 
 
 def get_current_branch(repo_path: Path | None = None) -> str | None:
-    """Get the current branch name of a git repository."""
+    """Get the current branch name of a git repository.
+
+    The branch of the repository we run in is memoized; other paths are
+    always queried since we may switch their branch ourselves.
+    """
     if repo_path is None:
+        key = ("branch",)
+        if key in _git_cache:
+            return _git_cache[key]
         result = run_git_command(["rev-parse", "--abbrev-ref", "HEAD"])
     else:
         result = subprocess.run(
@@ -1451,10 +2663,15 @@ def get_current_branch(repo_path: Path | None = None) -> str | None:
             check=False,
         )
 
+    branch: str | None = None
     if result.returncode == 0:
         branch = result.stdout.strip()
-        return branch if branch != "HEAD" else None  # Detached HEAD
-    return None
+        if branch == "HEAD":
+            branch = None  # Detached HEAD
+
+    if repo_path is None:
+        _git_cache[("branch",)] = branch
+    return branch
 
 
 def is_git_repo(path: Path) -> bool:
@@ -2092,22 +3309,88 @@ def check_remote_health(
         )
 
 
+async def _run_git_command_async(
+    args: list[str],
+    timeout: float | None = None,
+) -> subprocess.CompletedProcess[str]:
+    """Run a git command on the event loop, mirroring run_git_command's results."""
+    cmd = [get_git_binary()] + args
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            env=_get_git_env(),
+        )
+    except FileNotFoundError:
+        return subprocess.CompletedProcess(cmd, 127, stdout="", stderr="git command not found")
+
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return subprocess.CompletedProcess(
+            cmd, 124, stdout="", stderr=f"Command timed out after {timeout}s"
+        )
+    return subprocess.CompletedProcess(
+        cmd,
+        proc.returncode if proc.returncode is not None else -1,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
+
+
+async def check_remote_health_async(
+    remote: str,
+    timeout: int = 5,
+) -> HealthCheckResult:
+    """Async variant of check_remote_health, for probing many remotes at once."""
+    key = ("url", remote)
+    if key not in _git_cache:
+        url_result = await _run_git_command_async(["remote", "get-url", remote])
+        _git_cache[key] = url_result.stdout.strip() if url_result.returncode == 0 else None
+    url = _git_cache[key] or ""
+    start_time = time.time()
+
+    # Use ls-remote to check connectivity
+    result = await _run_git_command_async(["ls-remote", "--heads", remote], timeout=timeout)
+    latency = (time.time() - start_time) * 1000  # Convert to ms
+
+    if result.returncode == 0:
+        return HealthCheckResult(
+            remote=remote,
+            status=RemoteStatus.REACHABLE,
+            url=url,
+            latency_ms=round(latency, 2),
+        )
+    return HealthCheckResult(
+        remote=remote,
+        status=RemoteStatus.UNREACHABLE,
+        url=url,
+        latency_ms=round(latency, 2),
+        error=result.stderr.strip(),
+    )
+
+
 def check_all_remotes_health(
     config: SyncConfig,
 ) -> list[HealthCheckResult]:
-    """Check health of all configured remotes."""
+    """Check health of all configured remotes.
+
+    In parallel mode every remote is probed at once on a single event loop;
+    the checks only wait on the network, so max_workers does not apply.
+    """
     results: list[HealthCheckResult] = []
 
     if config.parallel and len(config.remotes) > 1:
-        with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
-            futures = {
-                executor.submit(
-                    check_remote_health, remote, config.health_check_timeout
-                ): remote
-                for remote in config.remotes
-            }
-            for future in as_completed(futures):
-                results.append(future.result())
+        async def gather_health() -> list[HealthCheckResult]:
+            return list(await asyncio.gather(
+                *(
+                    check_remote_health_async(remote, config.health_check_timeout)
+                    for remote in config.remotes
+                )
+            ))
+
+        results = asyncio.run(gather_health())
     else:
         for remote in config.remotes:
             results.append(check_remote_health(remote, config.health_check_timeout))
@@ -2190,6 +3473,7 @@ def push_to_remote(
         result = run_git_command(push_args, timeout=remote_config.timeout)
 
         if result.returncode == 0:
+            invalidate_refs_cache()
             duration = time.time() - start_time
             return PushResult(
                 remote=remote,
@@ -2229,14 +3513,110 @@ def push_to_remote(
     )
 
 
+def _parse_push_porcelain(output: str) -> dict[str, bool]:
+    """Map destination refs from 'git push --porcelain' output to success."""
+    landed: dict[str, bool] = {}
+    for line in output.splitlines():
+        parts = line.split("\t")
+        if len(parts) < 2 or not line[:1] or line[0] not in " +-*=!":
+            continue
+        dst = parts[1].rpartition(":")[2]
+        landed[dst] = line[0] != "!"
+    return landed
+
+
+def push_branches_to_remote(
+    remote: str,
+    branches: list[str],
+    remote_config: RemoteConfig,
+    force: bool = False,
+    dry_run: bool = False,
+    vpn_config: VpnConfig | None = None,
+) -> list[PushResult]:
+    """Push several branches to one remote with a single git push.
+
+    The force-push policy is applied per branch first. The remaining
+    branches go out in one 'git push --porcelain', so git negotiates and
+    packs objects once. Any branch that push did not land is pushed again
+    on its own through push_to_remote, which owns the retry, backoff and
+    VPN handling; VPN remotes and dry runs take that path directly.
+
+    Returns:
+        One PushResult per branch, in the order given
+    """
+    if len(branches) < 2 or dry_run or vpn_config is not None:
+        return [
+            push_to_remote(remote, branch, remote_config, force, dry_run, vpn_config)
+            for branch in branches
+        ]
+
+    start_time = time.time()
+    refs = load_all_refs() or {}
+    head_commit = get_current_commit() or ""
+    results: dict[str, PushResult] = {}
+    to_push: list[str] = []
+
+    for branch in branches:
+        if is_force_push_required(remote, branch) and not force:
+            if remote_config.force_push == ForcePushPolicy.BLOCK:
+                results[branch] = PushResult(
+                    remote=remote,
+                    branch=branch,
+                    status=PushStatus.BLOCKED,
+                    message=f"Force push blocked by policy for {remote}",
+                    commit_sha=refs.get(f"refs/heads/{branch}", head_commit),
+                )
+                continue
+            if remote_config.force_push == ForcePushPolicy.WARN:
+                logger.warning(f"Force push required for {remote}/{branch}")
+        to_push.append(branch)
+
+    if to_push:
+        push_args = ["push", "--porcelain", remote, *to_push]
+        if force:
+            push_args.insert(1, "--force-with-lease")
+
+        result = run_git_command(push_args, timeout=remote_config.timeout)
+        landed = _parse_push_porcelain(result.stdout)
+        invalidate_refs_cache()
+        duration = round(time.time() - start_time, 2)
+
+        for branch in to_push:
+            if landed.get(f"refs/heads/{branch}"):
+                results[branch] = PushResult(
+                    remote=remote,
+                    branch=branch,
+                    status=PushStatus.SUCCESS,
+                    message=f"Successfully pushed {branch} to {remote}",
+                    duration=duration,
+                    commit_sha=refs.get(f"refs/heads/{branch}", head_commit),
+                )
+            else:
+                logger.debug(f"Combined push missed {remote}/{branch}, pushing it alone...")
+                results[branch] = push_to_remote(
+                    remote, branch, remote_config, force, dry_run, None
+                )
+
+    return [results[branch] for branch in branches]
+
+
 def get_sync_status(
     remote: str,
     branch: str,
 ) -> SyncStatusResult:
     """Get sync status for a remote/branch pair."""
+    return _build_sync_status(remote, branch, get_sync_state(remote, branch))
+
+
+def _build_sync_status(
+    remote: str,
+    branch: str,
+    sync_state: tuple[SyncState, int, int],
+) -> SyncStatusResult:
+    """Assemble a SyncStatusResult from a computed sync state."""
     local_commit = get_current_commit() or ""
     remote_commit = get_remote_commit(remote, branch) or ""
-    state, ahead, behind = get_sync_state(remote, branch)
+    state, ahead, behind = sync_state
 
     return SyncStatusResult(
         remote=remote,
@@ -2281,7 +3661,7 @@ def sync_to_remotes(
     matching_remotes = [
         (name, cfg)
         for name, cfg in sorted_remotes
-        if branch_matches_pattern(branch, cfg.branches)
+        if cfg.matches_branch(branch)
     ]
 
     if not matching_remotes:
@@ -2297,8 +3677,15 @@ def sync_to_remotes(
     # Push to remotes
     # Note: VPN connections are NOT parallelized to avoid conflicts
     # Remotes requiring VPN are pushed sequentially, others can be parallel
-    vpn_remotes = [(n, c) for n, c in matching_remotes if c.vpn and c.vpn in config.vpn_configs]
-    non_vpn_remotes = [(n, c) for n, c in matching_remotes if not c.vpn or c.vpn not in config.vpn_configs]
+    # One pass, resolving each remote's VPN once
+    vpn_remotes: list[tuple[str, RemoteConfig, VpnConfig]] = []
+    non_vpn_remotes: list[tuple[str, RemoteConfig]] = []
+    for name, cfg in matching_remotes:
+        vpn_cfg = get_vpn_for_remote(cfg, config)
+        if vpn_cfg is not None:
+            vpn_remotes.append((name, cfg, vpn_cfg))
+        else:
+            non_vpn_remotes.append((name, cfg))
 
     # Push non-VPN remotes in parallel
     if config.parallel and len(non_vpn_remotes) > 1:
@@ -2326,7 +3713,7 @@ def sync_to_remotes(
                             remote=push_result.remote,
                             branch=push_result.branch,
                             commit_sha=push_result.commit_sha,
-                            queued_at=datetime.now(timezone.utc).isoformat(),
+                            queued_at=time.time(),
                             last_error=push_result.message,
                         )
                     )
@@ -2347,14 +3734,13 @@ def sync_to_remotes(
                         remote=push_result.remote,
                         branch=push_result.branch,
                         commit_sha=push_result.commit_sha,
-                        queued_at=datetime.now(timezone.utc).isoformat(),
+                        queued_at=time.time(),
                         last_error=push_result.message,
                     )
                 )
 
     # Push VPN remotes sequentially (VPN connections can conflict if parallelized)
-    for name, cfg in vpn_remotes:
-            vpn_cfg = get_vpn_for_remote(cfg, config)
+    for name, cfg, vpn_cfg in vpn_remotes:
             push_result = push_to_remote(name, branch, cfg, force, config.dry_run, vpn_cfg)
             result.push_results.append(push_result)
 
@@ -2371,7 +3757,7 @@ def sync_to_remotes(
                         remote=push_result.remote,
                         branch=push_result.branch,
                         commit_sha=push_result.commit_sha,
-                        queued_at=datetime.now(timezone.utc).isoformat(),
+                        queued_at=time.time(),
                         last_error=push_result.message,
                     )
                 )
@@ -2393,29 +3779,39 @@ def process_queue(config: SyncConfig, force: bool = False) -> SyncResult:
 
     logger.info(f"Processing {len(queue.items)} queued push(es)...")
 
-    for item in list(queue.items):  # Copy list to allow modification
-        remote_config = config.remotes.get(item.remote, RemoteConfig(name=item.remote))
+    # Branches queued for the same remote share one push
+    items_by_remote: dict[str, list[QueuedPush]] = {}
+    for item in queue.items:
+        items_by_remote.setdefault(item.remote, []).append(item)
+
+    for remote, items in items_by_remote.items():
+        remote_config = config.remotes.get(remote, RemoteConfig(name=remote))
         vpn_cfg = get_vpn_for_remote(remote_config, config)
-        push_result = push_to_remote(
-            item.remote,
-            item.branch,
+        push_results = push_branches_to_remote(
+            remote,
+            [item.branch for item in items],
             remote_config,
             force,
             config.dry_run,
             vpn_cfg,
         )
-        result.push_results.append(push_result)
 
-        if push_result.status == PushStatus.SUCCESS:
-            remove_from_queue(item.remote, item.branch)
-        else:
-            # Update queue item with new error
-            add_to_queue(
-                item.remote,
-                item.branch,
-                item.commit_sha,
-                push_result.message,
-            )
+        for item, push_result in zip(items, push_results):
+            result.push_results.append(push_result)
+
+            if push_result.status == PushStatus.SUCCESS:
+                remove_from_queue(item.remote, item.branch)
+            else:
+                # Update queue item with new error
+                add_to_queue(
+                    item.remote,
+                    item.branch,
+                    item.commit_sha,
+                    push_result.message,
+                )
+
+    # Drop the records superseded while draining
+    compact_queue()
 
     # Disconnect any VPNs that were connected
     disconnect_all_vpns(config.dry_run)
@@ -2437,8 +3833,9 @@ def get_all_sync_statuses(config: SyncConfig, branch: str | None = None) -> list
         for remote in config.remotes:
             fetch_remote(remote)
 
+    states = get_sync_states([(remote, branch) for remote in config.remotes])
     for remote in config.remotes:
-        results.append(get_sync_status(remote, branch))
+        results.append(_build_sync_status(remote, branch, states[(remote, branch)]))
 
     return results
 
@@ -2575,7 +3972,8 @@ def print_queue_status(queue: OfflineQueue) -> None:
     for item in queue.items:
         print(f"  • {Colors.CYAN}{item.remote}/{item.branch}{Colors.RESET}")
         print(f"    Commit: {Colors.DIM}{item.commit_sha[:8]}{Colors.RESET}")
-        print(f"    Queued: {Colors.DIM}{item.queued_at}{Colors.RESET}")
+        queued = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(item.queued_at))
+        print(f"    Queued: {Colors.DIM}{queued}{Colors.RESET}")
         if item.retries > 0:
             print(f"    Retries: {Colors.YELLOW}{item.retries}{Colors.RESET}")
         if item.last_error:
@@ -6,8 +6,10 @@ import json
 import os
 import stat
 import subprocess
+import threading
+import time
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -37,7 +39,9 @@ from pre_commit.binary_track import (
     TrackConfig,
     TrackingMethod,
     categorize_build_failure,
+    check_all_binaries,
     check_binary_health,
+    codesign_all_binaries,
     codesign_binary,
     compute_file_hash,
     ensure_binary_executable,
@@ -56,9 +60,13 @@ from pre_commit.binary_track import (
     load_config_file,
     load_env_config,
     load_manifest,
+    rebuild_binary,
+    rebuild_stale_binaries,
+    run_streaming_command,
     save_manifest,
     start_service,
     stop_service,
+    verify_all_signatures,
     verify_signature,
 )
 
@@ -111,6 +119,26 @@ class TestBinaryConfig:
         assert config.env == {"CGO_ENABLED": "0"}
         assert config.timeout == 600
 
+    def test_from_dict_env_values_are_strings(self) -> None:
+        """Test that non-string YAML env values are normalized to strings."""
+        config = BinaryConfig.from_dict("mytool", {"env": {"CGO_ENABLED": 0, "DEBUG": True}})
+        assert config.env == {"CGO_ENABLED": "0", "DEBUG": "True"}
+
+    def test_get_build_environment(self) -> None:
+        """Test that binary env overrides are layered over the process environment."""
+        config = BinaryConfig(name="test", env={"PATH": "/custom/bin", "EXTRA": "1"})
+        env = config.get_build_environment()
+        assert env["PATH"] == "/custom/bin"
+        assert env["EXTRA"] == "1"
+        assert "PATH" in os.environ and os.environ["PATH"] != "/custom/bin"
+
+    def test_get_build_environment_sees_later_changes(self, monkeypatch: MonkeyPatch) -> None:
+        """Test that environment changes made after an earlier build are picked up."""
+        config = BinaryConfig(name="test")
+        config.get_build_environment()
+        monkeypatch.setenv("BINARY_TRACK_TEST_LATE_VAR", "1")
+        assert config.get_build_environment()["BINARY_TRACK_TEST_LATE_VAR"] == "1"
+
     def test_get_expanded_install_path(self) -> None:
         """Test expanding ~ in install path."""
         config = BinaryConfig(
@@ -121,6 +149,28 @@ class TestBinaryConfig:
         assert "~" not in str(expanded)
         assert str(expanded).endswith(".local/bin/test")
 
+    def test_expanded_install_path_is_reused(self) -> None:
+        """Test that the expanded install path is computed once and follows edits."""
+        config = BinaryConfig(name="mytool", install_path="~/.local/bin/mytool")
+
+        first = config.get_expanded_install_path()
+        assert first == Path.home() / ".local" / "bin" / "mytool"
+        assert config.get_expanded_install_path() is first
+
+        config.install_path = "~/bin/mytool"
+        assert config.get_expanded_install_path() == Path.home() / "bin" / "mytool"
+
+    def test_expanded_install_path_follows_home(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a cached expansion is not reused after HOME changes."""
+        config = BinaryConfig(name="mytool", install_path="~/bin/mytool")
+        config.get_expanded_install_path()
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("USERPROFILE", str(tmp_path))
+        assert config.get_expanded_install_path() == tmp_path / "bin" / "mytool"
+
 
 class TestTrackConfig:
     """Tests for the TrackConfig dataclass."""
@@ -136,6 +186,7 @@ class TestTrackConfig:
         assert config.pre_commit_policy == PreCommitPolicy.WARN
         assert config.track_by == TrackingMethod.GIT_COMMIT
         assert config.parallel_builds is True
+        assert config.parallel_codesign is True
         assert config.max_workers == 4
 
     def test_from_dict_with_binaries(self) -> None:
@@ -225,6 +276,66 @@ class TestLoadConfigFile:
         with pytest.raises(FileNotFoundError):
             load_config_file(Path("nonexistent.json"), root_dir=tmp_path)
 
+    def test_parsed_config_is_cached(self, tmp_path: Path) -> None:
+        """Test that an unchanged config is served from the JSON cache in .git."""
+        from pre_commit.binary_track import CONFIG_CACHE_FILE
+
+        (tmp_path / ".git").mkdir()
+        config_file = tmp_path / ".binariesrc.yaml"
+        config_file.write_text("track_by: mtime\n")
+        os.utime(config_file, (time.time() - 60, time.time() - 60))
+
+        assert load_config_file(root_dir=tmp_path) == {"track_by": "mtime"}
+        assert not (tmp_path / CONFIG_CACHE_FILE).exists()
+        cache_file = tmp_path / ".git" / CONFIG_CACHE_FILE
+        cached = json.loads(cache_file.read_text())
+        cached["data"] = {"track_by": "hash"}
+        cache_file.write_text(json.dumps(cached))
+
+        assert load_config_file(root_dir=tmp_path) == {"track_by": "hash"}
+
+    def test_edited_config_bypasses_cache(self, tmp_path: Path) -> None:
+        """Test that changing the config file invalidates the cache."""
+        from pre_commit.binary_track import CONFIG_CACHE_FILE
+
+        (tmp_path / ".git").mkdir()
+        config_file = tmp_path / ".binariesrc.yaml"
+        config_file.write_text("track_by: mtime\n")
+        os.utime(config_file, (time.time() - 60, time.time() - 60))
+        load_config_file(root_dir=tmp_path)
+
+        config_file.write_text("track_by: git_commit\n")
+
+        assert load_config_file(root_dir=tmp_path) == {"track_by": "git_commit"}
+        # Freshly written files are not cached until past the racy window
+        cache_file = tmp_path / ".git" / CONFIG_CACHE_FILE
+        assert json.loads(cache_file.read_text())["data"] == {"track_by": "mtime"}
+
+    def test_config_cache_follows_gitdir_file(self, tmp_path: Path) -> None:
+        """Test that worktree-style .git files point the cache at the real git directory."""
+        from pre_commit.binary_track import CONFIG_CACHE_FILE
+
+        git_dir = tmp_path / "main.git" / "worktrees" / "wt"
+        git_dir.mkdir(parents=True)
+        root = tmp_path / "wt"
+        root.mkdir()
+        (root / ".git").write_text(f"gitdir: {git_dir}\n")
+        config_file = root / ".binariesrc.yaml"
+        config_file.write_text("track_by: mtime\n")
+        os.utime(config_file, (time.time() - 60, time.time() - 60))
+
+        assert load_config_file(root_dir=root) == {"track_by": "mtime"}
+        assert (git_dir / CONFIG_CACHE_FILE).exists()
+
+    def test_config_not_cached_outside_git(self, tmp_path: Path) -> None:
+        """Test that no cache file is written when there is no git directory."""
+        config_file = tmp_path / ".binariesrc.yaml"
+        config_file.write_text("track_by: mtime\n")
+        os.utime(config_file, (time.time() - 60, time.time() - 60))
+
+        assert load_config_file(root_dir=tmp_path) == {"track_by": "mtime"}
+        assert [p.name for p in tmp_path.iterdir()] == [".binariesrc.yaml"]
+
 
 class TestLoadEnvConfig:
     """Tests for the load_env_config function."""
@@ -327,6 +438,36 @@ class TestSaveLoadManifest:
         assert "mytool" in loaded.records
         assert loaded.records["mytool"].source_commit == "abc123"
 
+    def test_save_stamps_utc_timestamps(self, tmp_path: Path) -> None:
+        """Test that saving sets ISO 8601 UTC created/updated timestamps."""
+        from datetime import datetime, timezone
+
+        manifest = BuildManifest()
+        save_manifest(manifest, tmp_path)
+
+        stamped = datetime.fromisoformat(manifest.updated_at)
+        assert stamped.tzinfo == timezone.utc
+        assert abs((datetime.now(timezone.utc) - stamped).total_seconds()) < 5
+        assert manifest.created_at == manifest.updated_at
+
+    def test_saved_manifest_is_json(self, tmp_path: Path) -> None:
+        """Test that the manifest is written as JSON."""
+        record = BuildRecord(binary_name="mytool", built_at="2024-01-15T10:00:00Z")
+        save_manifest(BuildManifest(records={"mytool": record}), tmp_path)
+
+        data = json.loads((tmp_path / ".binary-track-manifest.json").read_text())
+        assert data["records"]["mytool"]["built_at"] == "2024-01-15T10:00:00Z"
+
+    def test_load_legacy_yaml_manifest(self, tmp_path: Path) -> None:
+        """Test that manifests written as YAML by earlier versions still load."""
+        record = BuildRecord(binary_name="mytool", built_at="2024-01-15T10:00:00Z", source_commit="abc")
+        (tmp_path / ".binary-track-manifest.json").write_text(
+            yaml.dump(BuildManifest(records={"mytool": record}).to_dict(), default_flow_style=False)
+        )
+
+        loaded = load_manifest(tmp_path)
+        assert loaded.records["mytool"].source_commit == "abc"
+
     def test_load_missing_manifest(self, tmp_path: Path) -> None:
         """Test loading when no manifest exists."""
         manifest = load_manifest(tmp_path)
@@ -383,6 +524,17 @@ class TestExpandPatterns:
         files = expand_patterns(tmp_path, ["*.rs"])
         assert files == []
 
+    def test_overlapping_patterns_listed_once(self, tmp_path: Path) -> None:
+        """Test that files matched by several patterns appear once, in first-match order."""
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.go").touch()
+        (src / "b.go").touch()
+
+        files = expand_patterns(tmp_path, ["src/b.go", "src/**/*.go", "src/*.go"])
+
+        assert [f.name for f in files] == ["b.go", "a.go"]
+
 
 class TestComputeFileHash:
     """Tests for the compute_file_hash function."""
@@ -414,6 +566,23 @@ class TestComputeFileHash:
 
         assert compute_file_hash(file1) != compute_file_hash(file2)
 
+    @pytest.mark.parametrize("file_digest", [True, False])
+    def test_matches_hashlib_across_buffer_boundaries(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch, file_digest: bool
+    ) -> None:
+        """Test both hashing paths against hashlib for a file spanning several reads."""
+        import hashlib
+
+        if not file_digest:
+            monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        monkeypatch.setattr("pre_commit.binary_track.HASH_READ_BUFFER", 1000)
+        content = os.urandom(4500)
+        file = tmp_path / "blob.bin"
+        file.write_bytes(content)
+
+        assert compute_file_hash(file) == hashlib.sha256(content).hexdigest()
+        assert compute_file_hash(file, "md5") == hashlib.md5(content).hexdigest()
+
     def test_missing_file_returns_empty(self, tmp_path: Path) -> None:
         """Test that missing file returns empty string."""
         result = compute_file_hash(tmp_path / "nonexistent.txt")
@@ -452,6 +621,30 @@ class TestCheckBinaryHealth:
         assert result.executable is True
         assert result.status == BinaryStatus.CURRENT
 
+    def test_world_executable_skips_access_check(self, tmp_path: Path) -> None:
+        """Test that a 0755 binary is judged executable from its mode bits alone."""
+        binary = tmp_path / "mytool"
+        binary.write_text("#!/bin/sh\necho hello")
+        binary.chmod(0o755)
+
+        config = BinaryConfig(name="mytool", install_path=str(binary), check_in_path=False)
+        with patch("pre_commit.binary_track.os.access") as access:
+            result = check_binary_health(config)
+
+        access.assert_not_called()
+        assert result.status == BinaryStatus.CURRENT
+
+    def test_app_bundle_directory_is_executable(self, tmp_path: Path) -> None:
+        """Test that an .app bundle directory counts as an existing, executable binary."""
+        bundle = tmp_path / "MyApp.app"
+        bundle.mkdir()
+
+        config = BinaryConfig(name="MyApp", install_path=str(bundle), check_in_path=False)
+        result = check_binary_health(config)
+
+        assert result.exists is True
+        assert result.executable is True
+
     def test_not_executable(self, tmp_path: Path) -> None:
         """Test checking a file that's not executable."""
         binary = tmp_path / "mytool"
@@ -554,6 +747,68 @@ class TestGetSourceFingerprint:
         assert "main.go" in hashes
         assert mtimes == {}
 
+    def test_large_source_sets_hash_in_parallel(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Test that many files are hashed on a thread pool with identical results."""
+        monkeypatch.setattr("pre_commit.binary_track.PARALLEL_HASH_MIN_FILES", 2)
+        for i in range(6):
+            (tmp_path / f"f{i}.go").write_text(f"package f{i}")
+        threads: set[int] = set()
+
+        def record_thread(path: Path, algorithm: str = "sha256") -> str:
+            threads.add(threading.get_ident())
+            return compute_file_hash(path, algorithm)
+
+        with patch("pre_commit.binary_track.compute_file_hash", side_effect=record_thread):
+            _, hashes, _ = get_source_fingerprint(tmp_path, ["*.go"], TrackingMethod.HASH)
+
+        assert threading.get_ident() not in threads
+        assert hashes == {f"f{i}.go": compute_file_hash(tmp_path / f"f{i}.go") for i in range(6)}
+
+    def test_hash_reused_while_mtime_and_size_unchanged(self, tmp_path: Path) -> None:
+        """Test that unchanged files are not re-hashed."""
+        source = tmp_path / "main.go"
+        source.write_text("package main")
+        os.utime(source, (time.time() - 3600, time.time() - 3600))
+
+        _, first, _ = get_source_fingerprint(tmp_path, ["*.go"], TrackingMethod.HASH)
+        with patch("pre_commit.binary_track.compute_file_hash") as compute:
+            _, second, _ = get_source_fingerprint(tmp_path, ["*.go"], TrackingMethod.HASH)
+
+        compute.assert_not_called()
+        assert second == first
+
+    def test_hash_recomputed_when_file_changes(self, tmp_path: Path) -> None:
+        """Test that a modified file is re-hashed."""
+        source = tmp_path / "main.go"
+        source.write_text("package main")
+        os.utime(source, (time.time() - 3600, time.time() - 3600))
+        _, first, _ = get_source_fingerprint(tmp_path, ["*.go"], TrackingMethod.HASH)
+
+        source.write_text("package main // changed")
+        os.utime(source, (time.time() - 1800, time.time() - 1800))
+        _, second, _ = get_source_fingerprint(tmp_path, ["*.go"], TrackingMethod.HASH)
+
+        assert second["main.go"] != first["main.go"]
+
+    def test_hashes_persist_through_manifest(self, tmp_path: Path) -> None:
+        """Test that cached hashes are saved with the manifest and reused after loading."""
+        from pre_commit import binary_track
+
+        source = tmp_path / "main.go"
+        source.write_text("package main")
+        os.utime(source, (time.time() - 3600, time.time() - 3600))
+        get_source_fingerprint(tmp_path, ["*.go"], TrackingMethod.HASH)
+        save_manifest(BuildManifest(), tmp_path)
+
+        with binary_track._file_hash_cache_lock:
+            binary_track._file_hash_cache.pop(str(source))
+        manifest = load_manifest(tmp_path)
+        assert "main.go" in manifest.file_hashes
+
+        with patch("pre_commit.binary_track.compute_file_hash") as compute:
+            get_source_fingerprint(tmp_path, ["*.go"], TrackingMethod.HASH)
+        compute.assert_not_called()
+
     def test_mtime_method(self, tmp_path: Path) -> None:
         """Test fingerprinting by mtime."""
         (tmp_path / "main.go").write_text("package main")
@@ -597,6 +852,19 @@ class TestTrackResult:
         assert data["statuses"][0]["status"] == "stale"
 
 
+class TestLogger:
+    """Tests for the Logger class."""
+
+    def test_debug_enabled_only_when_verbose_and_printing(self) -> None:
+        """Test that debug output is enabled only in verbose, non-quiet, non-JSON mode."""
+        from pre_commit.binary_track import Logger
+
+        assert Logger(verbose=True).is_debug_enabled()
+        assert not Logger().is_debug_enabled()
+        assert not Logger(verbose=True, quiet=True).is_debug_enabled()
+        assert not Logger(verbose=True, json_output=True).is_debug_enabled()
+
+
 class TestIntegration:
     """Integration tests for binary tracking."""
 
@@ -962,6 +1230,235 @@ class TestVerifySignature:
             # An unsigned script should be reported as unsigned or invalid
             assert result.status in (CodesignStatus.UNSIGNED, CodesignStatus.INVALID)
 
+    def _fake_codesign(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch, verify_rc: int, verify_err: str, display_err: str
+    ) -> Path:
+        """Install a stand-in codesign script and return the file logging its invocations."""
+        calls = tmp_path / "codesign-calls"
+        script = tmp_path / "codesign"
+        script.write_text(
+            "#!/bin/sh\n"
+            f'echo "$1" >> "{calls}"\n'
+            'case "$1" in\n'
+            f"  -v) printf '%s\\n' '{verify_err}' >&2; exit {verify_rc};;\n"
+            f"  -d) printf '%s\\n' '{display_err}' >&2; exit 0;;\n"
+            "esac\n"
+        )
+        script.chmod(0o755)
+        monkeypatch.setattr(
+            "pre_commit.binary_track._global_track_config",
+            TrackConfig(system_binaries={"codesign": str(script)}),
+        )
+        return calls
+
+    def test_valid_signature_reports_identity(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Test that a valid signature is reported with its signing authority."""
+        binary_path = tmp_path / "tool"
+        binary_path.write_bytes(b"binary")
+        self._fake_codesign(
+            tmp_path,
+            monkeypatch,
+            0,
+            "tool: valid on disk",
+            "Executable=tool\nAuthority=Developer ID Application: Example\nAuthority=Apple Root CA",
+        )
+
+        result = verify_signature(binary_path, MagicMock())
+
+        assert result.status == CodesignStatus.VALID
+        assert result.identity == "Developer ID Application: Example"
+        assert result.details == "tool: valid on disk"
+
+    def test_adhoc_signature_identity(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Test that an ad-hoc signature without an Authority is reported as ad-hoc."""
+        binary_path = tmp_path / "tool"
+        binary_path.write_bytes(b"binary")
+        self._fake_codesign(
+            tmp_path, monkeypatch, 0, "tool: valid on disk", "Executable=tool\nSigned with a adhoc identity"
+        )
+
+        result = verify_signature(binary_path, MagicMock())
+
+        assert result.status == CodesignStatus.VALID
+        assert result.identity == "ad-hoc"
+
+    def test_identity_resolved_with_verification(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Test that codesign -d runs together with the verification."""
+        binary_path = tmp_path / "tool"
+        binary_path.write_bytes(b"binary")
+        calls = self._fake_codesign(
+            tmp_path, monkeypatch, 0, "tool: valid on disk", "Authority=Developer ID Application: Example"
+        )
+
+        result = verify_signature(binary_path, MagicMock())
+
+        assert sorted(calls.read_text().split()) == ["-d", "-v"]
+        assert result.identity == "Developer ID Application: Example"
+
+    def test_unsigned_binary_detected(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Test that codesign's 'not signed' output maps to UNSIGNED."""
+        binary_path = tmp_path / "tool"
+        binary_path.write_bytes(b"binary")
+        self._fake_codesign(tmp_path, monkeypatch, 1, "tool: code object is not signed at all", "")
+
+        result = verify_signature(binary_path, MagicMock())
+
+        assert result.status == CodesignStatus.UNSIGNED
+        assert result.identity == ""
+
+    def test_codesign_lookup_is_cached(self) -> None:
+        """Test that the PATH lookup for codesign happens once per process."""
+        from pre_commit import binary_track
+
+        binary_track._which.cache_clear()
+        try:
+            with patch("shutil.which", return_value="/usr/bin/codesign") as which:
+                assert is_codesign_available()
+                assert is_codesign_available()
+            which.assert_called_once_with("codesign")
+        finally:
+            binary_track._which.cache_clear()
+
+
+class TestCodesignAllBinaries:
+    """Tests for the codesign_all_binaries function."""
+
+    def _make_config(self, tmp_path: Path, **kwargs: Any) -> TrackConfig:
+        binaries = {
+            name: BinaryConfig(
+                name=name,
+                install_path=str(tmp_path / name),
+                codesign=CodesignConfig(enabled=name != "plain"),
+            )
+            for name in ("alpha", "plain", "beta", "gamma")
+        }
+        return TrackConfig(root_dir=tmp_path, binaries=binaries, quiet=True, **kwargs)
+
+    @patch("pre_commit.binary_track.is_codesign_available", return_value=True)
+    def test_signs_in_parallel_preserving_order(self, _available: MagicMock, tmp_path: Path) -> None:
+        """Test that enabled binaries are signed concurrently and reported in config order."""
+        config = self._make_config(tmp_path)
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_sign(binary_config: BinaryConfig, *args: Any) -> CodesignResult:
+            barrier.wait()
+            return CodesignResult(name=binary_config.name, status=CodesignStatus.SIGNED)
+
+        with patch("pre_commit.binary_track.codesign_binary", side_effect=fake_sign):
+            results = codesign_all_binaries(config, MagicMock())
+
+        assert [r.name for r in results] == ["alpha", "beta", "gamma"]
+
+    @patch("pre_commit.binary_track.is_codesign_available", return_value=True)
+    def test_sequential_when_disabled(self, _available: MagicMock, tmp_path: Path) -> None:
+        """Test that parallel_codesign=False signs one binary at a time."""
+        config = self._make_config(tmp_path, parallel_codesign=False)
+        threads: set[int] = set()
+
+        def fake_sign(binary_config: BinaryConfig, *args: Any) -> CodesignResult:
+            threads.add(threading.get_ident())
+            return CodesignResult(name=binary_config.name, status=CodesignStatus.SIGNED)
+
+        with patch("pre_commit.binary_track.codesign_binary", side_effect=fake_sign):
+            results = codesign_all_binaries(config, MagicMock())
+
+        assert [r.name for r in results] == ["alpha", "beta", "gamma"]
+        assert threads == {threading.get_ident()}
+
+    def _make_installed_config(self, tmp_path: Path, **kwargs: Any) -> TrackConfig:
+        binaries = {}
+        for name in ("alpha", "beta", "gamma"):
+            (tmp_path / name).write_bytes(b"binary")
+            binaries[name] = BinaryConfig(
+                name=name,
+                install_path=str(tmp_path / name),
+                codesign=CodesignConfig(enabled=True, identity="Example ID", **kwargs),
+            )
+        return TrackConfig(root_dir=tmp_path, binaries=binaries, quiet=True)
+
+    @patch("pre_commit.binary_track.is_codesign_available", return_value=True)
+    @patch("subprocess.run")
+    def test_batches_binaries_with_same_flags(
+        self, mock_run: MagicMock, _available: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that binaries sharing signing flags are signed by one codesign call."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=b"")
+        config = self._make_installed_config(tmp_path)
+
+        results = codesign_all_binaries(config, MagicMock())
+
+        assert mock_run.call_count == 1
+        cmd = mock_run.call_args.args[0]
+        assert cmd[1:4] == ["-s", "Example ID", "-f"]
+        assert cmd[4:] == [str(tmp_path / n) for n in ("alpha", "beta", "gamma")]
+        assert [(r.name, r.status) for r in results] == [
+            (n, CodesignStatus.SIGNED) for n in ("alpha", "beta", "gamma")
+        ]
+
+    @patch("pre_commit.binary_track.is_codesign_available", return_value=True)
+    @patch("subprocess.run")
+    def test_failed_batch_retries_individually(
+        self, mock_run: MagicMock, _available: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that a failing batch is re-signed per binary to attribute errors."""
+        config = self._make_installed_config(tmp_path)
+
+        def fake_run(cmd: list[str], **kwargs: Any) -> MagicMock:
+            failed = len(cmd) > 5 or cmd[-1].endswith("beta")
+            return MagicMock(returncode=1 if failed else 0, stdout=b"", stderr=b"bad beta" if failed else b"")
+
+        mock_run.side_effect = fake_run
+        results = codesign_all_binaries(config, MagicMock())
+
+        assert mock_run.call_count == 4
+        assert [r.status for r in results] == [
+            CodesignStatus.SIGNED,
+            CodesignStatus.FAILED,
+            CodesignStatus.SIGNED,
+        ]
+        assert results[1].message == "codesign failed: bad beta"
+
+    @patch("pre_commit.binary_track.is_codesign_available", return_value=True)
+    @patch("subprocess.run")
+    def test_unforced_signing_is_not_batched(
+        self, mock_run: MagicMock, _available: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that binaries signed without -f are signed one at a time."""
+        mock_run.return_value = MagicMock(returncode=0, stdout=b"", stderr=b"")
+        config = self._make_installed_config(tmp_path, force=False)
+
+        codesign_all_binaries(config, MagicMock())
+
+        assert mock_run.call_count == 3
+
+
+class TestVerifyAllSignatures:
+    """Tests for the verify_all_signatures function."""
+
+    @patch("pre_commit.binary_track.is_codesign_available", return_value=True)
+    def test_verifies_concurrently_and_reports_in_order(
+        self, _available: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that signatures are checked in parallel but reported in config order."""
+        names = ["zeta", "alpha", "mid"]
+        config = TrackConfig(
+            root_dir=tmp_path,
+            binaries={n: BinaryConfig(name=n, install_path=str(tmp_path / f"{n}.bin")) for n in names},
+            max_workers=3,
+        )
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_verify(path: Path, logger: Any) -> CodesignResult:
+            barrier.wait()
+            return CodesignResult(name=path.name, status=CodesignStatus.UNSIGNED)
+
+        logger = MagicMock()
+        with patch("pre_commit.binary_track.verify_signature", side_effect=fake_verify):
+            results = verify_all_signatures(config, logger)
+
+        assert [r.name for r in results] == names
+        assert [c.args[2] for c in logger.status_line.call_args_list] == names
+
 
 class TestPlatform:
     """Tests for platform detection."""
@@ -1679,6 +2176,43 @@ class TestCategorizeBuildFailure:
         )
         assert reason == BuildFailureReason.LINKER_ERROR
 
+    def test_syntax_error(self) -> None:
+        """Test detection of generic syntax errors."""
+        reason, suggestion = categorize_build_failure(
+            1, "", "main.py:3: SyntaxError: Syntax Error near ')'", ""
+        )
+        assert reason == BuildFailureReason.COMPILATION_ERROR
+        assert "syntax" in suggestion.lower()
+
+    def test_swift_keywords_across_streams(self) -> None:
+        """Test that keywords are matched across stderr and stdout."""
+        reason, suggestion = categorize_build_failure(
+            1, "main.swift:4:1: ERROR: expected expression", "Compiling Swift module", "swift"
+        )
+        assert reason == BuildFailureReason.COMPILATION_ERROR
+        assert "xcode" in suggestion.lower()
+
+    def test_swift_error_requires_swift_mention(self) -> None:
+        """Test that a bare 'error:' is not treated as a Swift compilation error."""
+        reason, _ = categorize_build_failure(1, "error: something broke", "", "swift")
+        assert reason == BuildFailureReason.UNKNOWN
+
+    def test_cpp_aliases_share_rules(self) -> None:
+        """Test that c, cpp, and c++ use the same language rules."""
+        for language in ("c", "cpp", "c++"):
+            reason, suggestion = categorize_build_failure(
+                1, "main.cc:1:1: error: expected ';'", "", language
+            )
+            assert reason == BuildFailureReason.COMPILATION_ERROR
+            assert "c/c++" in suggestion.lower()
+
+    def test_rule_priority_is_preserved(self) -> None:
+        """Test that earlier rules win even if later keywords appear first."""
+        reason, _ = categorize_build_failure(
+            1, "cannot open foo.o\npermission denied", "", ""
+        )
+        assert reason == BuildFailureReason.PERMISSION_DENIED
+
     def test_unknown_error(self) -> None:
         """Test fallback to unknown for unrecognized errors."""
         from pre_commit.binary_track import categorize_build_failure, BuildFailureReason
@@ -1689,6 +2223,60 @@ class TestCategorizeBuildFailure:
         assert reason == BuildFailureReason.UNKNOWN
 
 
+class TestRunStreamingCommand:
+    """Tests for the run_streaming_command function."""
+
+    def test_captures_stdout_and_stderr(self, tmp_path: Path) -> None:
+        """Test that both streams are captured along with the exit code."""
+        proc = run_streaming_command(
+            "echo out; echo err >&2; exit 3", tmp_path, dict(os.environ), 10, MagicMock()
+        )
+        assert proc.returncode == 3
+        assert proc.stdout == "out\n"
+        assert proc.stderr == "err\n"
+
+    def test_keeps_only_output_tail(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Test that only the last OUTPUT_TAIL_LINES lines are retained."""
+        monkeypatch.setattr("pre_commit.binary_track.OUTPUT_TAIL_LINES", 3)
+        proc = run_streaming_command(
+            "for i in 1 2 3 4 5 6; do echo line$i; done", tmp_path, dict(os.environ), 10, MagicMock()
+        )
+        assert proc.stdout.splitlines() == ["line4", "line5", "line6"]
+
+    def test_captures_output_larger_than_read_buffer(self, tmp_path: Path) -> None:
+        """Test that a line longer than the pipe read buffer is captured intact."""
+        proc = run_streaming_command(
+            "head -c 200000 /dev/zero | tr '\\0' x; echo", tmp_path, dict(os.environ), 10, MagicMock()
+        )
+        assert proc.stdout == "x" * 200000 + "\n"
+
+    def test_forwards_lines_to_logger(self, tmp_path: Path) -> None:
+        """Test that output is streamed to the logger as debug lines."""
+        logger = MagicMock()
+        run_streaming_command("echo hello", tmp_path, dict(os.environ), 10, logger)
+        logger.debug.assert_called_with("hello")
+
+    def test_timeout_raises(self, tmp_path: Path) -> None:
+        """Test that a command exceeding its timeout is killed."""
+        with pytest.raises(subprocess.TimeoutExpired):
+            run_streaming_command("exec sleep 5", tmp_path, dict(os.environ), 0.2, MagicMock())
+
+    def test_timeout_kills_forked_children(self, tmp_path: Path) -> None:
+        """Test that a timeout also stops commands the shell forked."""
+        start = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired):
+            run_streaming_command("sleep 3; true", tmp_path, dict(os.environ), 0.3, MagicMock())
+        assert time.monotonic() - start < 2
+
+    def test_without_pidfd_support(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Test the Popen.wait fallback used on platforms without pidfd_open."""
+        monkeypatch.delattr(os, "pidfd_open", raising=False)
+        proc = run_streaming_command("exit 4", tmp_path, dict(os.environ), 10, MagicMock())
+        assert proc.returncode == 4
+        with pytest.raises(subprocess.TimeoutExpired):
+            run_streaming_command("exec sleep 5", tmp_path, dict(os.environ), 0.2, MagicMock())
+
+
 class TestRebuildResultEnhancements:
     """Tests for enhanced RebuildResult dataclass."""
 
@@ -2036,6 +2624,24 @@ class TestGetServiceStatus:
         assert result.success is True
         mock_run.assert_called_once()
 
+    @patch("subprocess.run")
+    def test_fixed_argv_commands_allow_posix_spawn(self, mock_run: MagicMock) -> None:
+        """Test service manager commands are spawned without shell or close_fds."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        config = ServiceConfig(
+            enabled=True,
+            service_type=ServiceType.LAUNCHD,
+            name="com.example.test",
+        )
+        get_service_status(config, MagicMock())
+
+        args, kwargs = mock_run.call_args
+        assert args[0][0].endswith("launchctl")
+        assert args[0][1:] == ["list", "com.example.test"]
+        assert kwargs["close_fds"] is False
+        assert "shell" not in kwargs
+
     @patch("subprocess.run")
     def test_launchd_service_not_found(self, mock_run: MagicMock) -> None:
         """Test detecting launchd service not found."""
@@ -2056,8 +2662,9 @@ class TestGetServiceStatus:
 
         assert result.status == ServiceStatus.NOT_FOUND
 
+    @patch("pre_commit.binary_track._systemctl_is_active_dbus", return_value=None)
     @patch("subprocess.run")
-    def test_systemd_service_running(self, mock_run: MagicMock) -> None:
+    def test_systemd_service_running(self, mock_run: MagicMock, _mock_dbus: MagicMock) -> None:
         """Test detecting running systemd service."""
         mock_run.return_value = MagicMock(returncode=0, stdout="active\n", stderr="")
 
@@ -2073,8 +2680,9 @@ class TestGetServiceStatus:
         assert result.status == ServiceStatus.RUNNING
         assert result.success is True
 
+    @patch("pre_commit.binary_track._systemctl_is_active_dbus", return_value=None)
     @patch("subprocess.run")
-    def test_systemd_service_stopped(self, mock_run: MagicMock) -> None:
+    def test_systemd_service_stopped(self, mock_run: MagicMock, _mock_dbus: MagicMock) -> None:
         """Test detecting stopped systemd service."""
         mock_run.return_value = MagicMock(returncode=3, stdout="inactive\n", stderr="")
 
@@ -2089,6 +2697,55 @@ class TestGetServiceStatus:
 
         assert result.status == ServiceStatus.STOPPED
 
+    @patch("pre_commit.binary_track._systemctl_is_active_dbus", return_value=("active", False))
+    @patch("subprocess.run")
+    def test_systemd_service_running_via_dbus(self, mock_run: MagicMock, _mock_dbus: MagicMock) -> None:
+        """Test that D-Bus state is used without forking systemctl."""
+        config = ServiceConfig(
+            enabled=True,
+            service_type=ServiceType.SYSTEMD,
+            name="myservice",
+        )
+
+        result = get_service_status(config, MagicMock())
+
+        assert result.status == ServiceStatus.RUNNING
+        mock_run.assert_not_called()
+
+    @patch("subprocess.run")
+    def test_systemd_dbus_timeout_falls_back_to_systemctl(self, mock_run: MagicMock) -> None:
+        """Test that D-Bus calls are time-limited and a timeout falls back to systemctl."""
+        from pre_commit.binary_track import _SYSTEMD_DBUS_TIMEOUT
+
+        bus = MagicMock()
+        bus.get_object.return_value.LoadUnit.side_effect = Exception("NoReply: timed out")
+        mock_run.return_value = MagicMock(returncode=0, stdout="active\n", stderr="")
+        config = ServiceConfig(
+            enabled=True,
+            service_type=ServiceType.SYSTEMD,
+            name="myservice",
+        )
+
+        with patch("pre_commit.binary_track._get_systemd_bus", return_value=bus):
+            result = get_service_status(config, MagicMock())
+
+        assert bus.get_object.return_value.LoadUnit.call_args.kwargs["timeout"] == _SYSTEMD_DBUS_TIMEOUT
+        assert result.status == ServiceStatus.RUNNING
+        mock_run.assert_called_once()
+
+    @patch("pre_commit.binary_track._systemctl_is_active_dbus", return_value=("inactive", True))
+    def test_systemd_service_not_found_via_dbus(self, _mock_dbus: MagicMock) -> None:
+        """Test that units systemd can't load are reported as not found."""
+        config = ServiceConfig(
+            enabled=True,
+            service_type=ServiceType.SYSTEMD,
+            name="missing",
+        )
+
+        result = get_service_status(config, MagicMock())
+
+        assert result.status == ServiceStatus.NOT_FOUND
+
     @patch("subprocess.run")
     def test_custom_service_running(self, mock_run: MagicMock) -> None:
         """Test detecting running custom service."""
@@ -2121,6 +2778,20 @@ class TestGetServiceStatus:
         assert result.status == ServiceStatus.UNKNOWN
         assert "No status command" in result.message
 
+    def test_custom_service_empty_status_cmd(self) -> None:
+        """Test an empty status command is treated as not configured."""
+        config = ServiceConfig(
+            enabled=True,
+            service_type=ServiceType.CUSTOM,
+            name="myservice",
+            status_cmd="",
+        )
+
+        result = get_service_status(config, MagicMock())
+
+        assert result.status == ServiceStatus.UNKNOWN
+        assert "No status command" in result.message
+
 
 class TestStopService:
     """Tests for the stop_service function."""
@@ -2186,6 +2857,27 @@ class TestStopService:
 
         assert result.success is False
 
+    @patch("subprocess.run")
+    def test_stop_failure_message_is_truncated(self, mock_run: MagicMock) -> None:
+        """Test that huge command output is truncated to its tail in the message."""
+        mock_run.return_value = MagicMock(
+            returncode=1,
+            stdout="",
+            stderr="x" * 100_000 + "real cause",
+        )
+
+        config = ServiceConfig(
+            enabled=True,
+            service_type=ServiceType.SYSTEMD,
+            name="myservice",
+        )
+
+        result = stop_service(config, MagicMock())
+
+        assert result.success is False
+        assert result.message.endswith("real cause")
+        assert len(result.message) < 5000
+
     def test_custom_service_no_stop_cmd(self) -> None:
         """Test custom service without stop command."""
         config = ServiceConfig(
@@ -2200,6 +2892,20 @@ class TestStopService:
         assert result.success is False
         assert "No stop command" in result.message
 
+    def test_custom_service_empty_stop_cmd(self) -> None:
+        """Test an empty stop command is treated as not configured."""
+        config = ServiceConfig(
+            enabled=True,
+            service_type=ServiceType.CUSTOM,
+            name="myservice",
+            stop_cmd="",
+        )
+
+        result = stop_service(config, MagicMock())
+
+        assert result.success is False
+        assert "No stop command" in result.message
+
 
 class TestStartService:
     """Tests for the start_service function."""
@@ -2303,4 +3009,539 @@ class TestBuildFailureReasonServiceErrors:
 
     def test_service_start_failed_reason(self) -> None:
         """Test SERVICE_START_FAILED reason exists."""
-        assert BuildFailureReason.SERVICE_START_FAILED.value == "service_start_failed"
\ No newline at end of file
+        assert BuildFailureReason.SERVICE_START_FAILED.value == "service_start_failed"
+
+
+class TestRebuildBinary:
+    """Tests for the rebuild_binary function."""
+
+    def _make_config(self, tmp_path: Path, **kwargs: Any) -> tuple[BinaryConfig, TrackConfig]:
+        (tmp_path / "main.c").write_text("int main() {}")
+        binary_config = BinaryConfig(
+            name="mytool",
+            source_patterns=["*.c"],
+            install_path=str(tmp_path / "mytool"),
+            build_cmd=f"touch {tmp_path / 'mytool'}",
+            **kwargs,
+        )
+        config = TrackConfig(
+            root_dir=tmp_path,
+            binaries={"mytool": binary_config},
+            track_by=TrackingMethod.HASH,
+        )
+        return binary_config, config
+
+    def test_success_records_manifest(self, tmp_path: Path) -> None:
+        """Test a successful build is recorded with a source fingerprint."""
+        binary_config, config = self._make_config(tmp_path)
+        manifest = BuildManifest()
+
+        with patch(
+            "pre_commit.binary_track.get_source_fingerprint", wraps=get_source_fingerprint
+        ) as fingerprint:
+            result = rebuild_binary(binary_config, config, manifest, MagicMock())
+
+        assert result.status == RebuildStatus.SUCCESS
+        assert fingerprint.call_count == 1
+        record = manifest.records["mytool"]
+        assert record.success is True
+        assert "main.c" in record.source_hashes
+        assert os.access(tmp_path / "mytool", os.X_OK)
+
+    def test_test_failure_records_manifest(self, tmp_path: Path) -> None:
+        """Test a failing test command marks the build as TEST_FAILED."""
+        binary_config, config = self._make_config(tmp_path, test_cmd="echo broken >&2; exit 1")
+        manifest = BuildManifest()
+
+        with patch(
+            "pre_commit.binary_track.get_source_fingerprint", wraps=get_source_fingerprint
+        ) as fingerprint:
+            result = rebuild_binary(binary_config, config, manifest, MagicMock())
+
+        assert result.status == RebuildStatus.TEST_FAILED
+        assert result.failure_reason == BuildFailureReason.TEST_FAILED
+        assert fingerprint.call_count == 1
+        record = manifest.records["mytool"]
+        assert record.success is False
+        assert "broken" in record.error
+
+    def test_fingerprint_overlaps_with_tests(self, tmp_path: Path) -> None:
+        """Test that source fingerprinting runs while the test command runs."""
+        binary_config, config = self._make_config(tmp_path, test_cmd="true")
+        manifest = BuildManifest()
+        tests_started = threading.Event()
+
+        def slow_fingerprint(*args: Any) -> tuple[str, dict[str, str], dict[str, float]]:
+            assert tests_started.wait(timeout=5)
+            return get_source_fingerprint(*args)
+
+        def fake_tests(*args: Any) -> tuple[bool, str, float]:
+            tests_started.set()
+            return True, "", 0.0
+
+        with patch("pre_commit.binary_track.get_source_fingerprint", side_effect=slow_fingerprint):
+            with patch("pre_commit.binary_track.run_test_command", side_effect=fake_tests):
+                result = rebuild_binary(binary_config, config, manifest, MagicMock())
+
+        assert result.status == RebuildStatus.SUCCESS
+        assert "main.c" in manifest.records["mytool"].source_hashes
+
+    def test_build_failure_is_categorized(self, tmp_path: Path) -> None:
+        """Test a failing build is recorded and categorized."""
+        binary_config, config = self._make_config(tmp_path)
+        binary_config.build_cmd = "echo 'gcc: command not found' >&2; exit 127"
+        manifest = BuildManifest()
+
+        result = rebuild_binary(binary_config, config, manifest, MagicMock())
+
+        assert result.status == RebuildStatus.FAILED
+        assert result.exit_code == 127
+        assert result.failure_reason == BuildFailureReason.COMMAND_NOT_FOUND
+        assert manifest.records["mytool"].success is False
+
+    def test_retries_until_success(self, tmp_path: Path) -> None:
+        """Test that failed builds are retried up to retry_count times."""
+        marker = tmp_path / "attempted"
+        binary_config, config = self._make_config(tmp_path, retry_count=1, retry_delay_seconds=0)
+        binary_config.build_cmd = f"test -e {marker} || {{ touch {marker}; exit 1; }}"
+        manifest = BuildManifest()
+
+        result = rebuild_binary(binary_config, config, manifest, MagicMock())
+
+        assert result.status == RebuildStatus.SUCCESS
+        assert result.retry_attempt == 1
+
+
+class TestCheckAllBinaries:
+    """Tests for the check_all_binaries function."""
+
+    def test_checks_concurrently_and_reports_in_order(self, tmp_path: Path) -> None:
+        """Test that statuses are computed in parallel but kept in config order."""
+        names = ["zeta", "alpha", "mid"]
+        config = TrackConfig(
+            root_dir=tmp_path,
+            binaries={n: BinaryConfig(name=n, install_path=str(tmp_path / n)) for n in names},
+            max_workers=3,
+            quiet=True,
+        )
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_status(binary_config: BinaryConfig, *args: Any) -> BinaryStatusResult:
+            barrier.wait()
+            status = BinaryStatus.STALE if binary_config.name == "mid" else BinaryStatus.CURRENT
+            return BinaryStatusResult(name=binary_config.name, status=status, install_path="")
+
+        logger = MagicMock()
+        with patch("pre_commit.binary_track.get_binary_status", side_effect=fake_status):
+            result = check_all_binaries(config, logger)
+
+        assert [s.name for s in result.statuses] == names
+        assert [c.args[2] for c in logger.status_line.call_args_list] == names
+        assert result.stale_count == 1
+        assert result.all_current is False
+
+
+class TestCompileSourceMatcher:
+    """Tests for the watch-mode source pattern matcher."""
+
+    PATTERNS = ["src/**/*.go", "*.mod", "cmd/tool/main.go", "lib/[a-c]?.rs", "/abs/dir/*.c", "docs/[!x]*.md"]
+    PATHS = [
+        "/repo/src/pkg/a.go",
+        "/repo/src/a.go",
+        "/repo/src/pkg/deep/a.go",
+        "/repo/go.mod",
+        "/repo/sub/go.mod",
+        "/repo/cmd/tool/main.go",
+        "/repo/cmd/other/main.go",
+        "/repo/lib/b1.rs",
+        "/repo/lib/d1.rs",
+        "/abs/dir/x.c",
+        "/other/abs/dir/x.c",
+        "/repo/docs/readme.md",
+        "/repo/docs/xreadme.md",
+        "/repo/README",
+    ]
+
+    def test_matches_like_path_match_or_fnmatch(self) -> None:
+        """Test the compiled matcher agrees with Path.match/fnmatch for every pattern."""
+        import fnmatch
+
+        from pre_commit.binary_track import _compile_source_matcher
+
+        for pattern in self.PATTERNS:
+            matcher = _compile_source_matcher([pattern])
+            for path in self.PATHS:
+                expected = Path(path).match(pattern) or fnmatch.fnmatch(path, pattern)
+                assert bool(matcher.match(path)) == expected, (pattern, path)
+
+    def test_union_of_patterns(self) -> None:
+        """Test that a path matching any one pattern matches the combined regex."""
+        from pre_commit.binary_track import _compile_source_matcher
+
+        matcher = _compile_source_matcher(["*.mod", "cmd/tool/main.go"])
+        assert matcher.match("/repo/go.mod")
+        assert matcher.match("/repo/cmd/tool/main.go")
+        assert not matcher.match("/repo/src/a.go")
+
+    def test_no_patterns_matches_nothing(self) -> None:
+        """Test that a binary without source patterns never matches."""
+        from pre_commit.binary_track import _compile_source_matcher
+
+        assert not _compile_source_matcher([]).match("/repo/a.go")
+
+
+class TestRebuildChanged:
+    """Tests for the watch-mode batch rebuild helper."""
+
+    def _make_config(self, tmp_path: Path, **kwargs: Any) -> TrackConfig:
+        binaries = {n: BinaryConfig(name=n, install_path=str(tmp_path / n)) for n in ("one", "two", "three")}
+        return TrackConfig(root_dir=tmp_path, binaries=binaries, **kwargs)
+
+    def test_saves_manifest_once_per_batch(self, tmp_path: Path) -> None:
+        """Test that several ready binaries are rebuilt and saved with a single write."""
+        from pre_commit.binary_track import _rebuild_changed
+
+        config = self._make_config(tmp_path)
+        with patch("pre_commit.binary_track.rebuild_binary") as rebuild:
+            with patch("pre_commit.binary_track.save_manifest") as save:
+                _rebuild_changed(["one", "three", "gone"], config, BuildManifest(), MagicMock())
+
+        assert sorted(c.args[0].name for c in rebuild.call_args_list) == ["one", "three"]
+        save.assert_called_once()
+
+    def test_sequential_without_parallel_builds(self, tmp_path: Path) -> None:
+        """Test that rebuilds run in order on the calling thread when parallel builds are off."""
+        from pre_commit.binary_track import _rebuild_changed
+
+        config = self._make_config(tmp_path, parallel_builds=False)
+        threads: list[int] = []
+        with patch(
+            "pre_commit.binary_track.rebuild_binary",
+            side_effect=lambda *args: threads.append(threading.get_ident()),
+        ) as rebuild, patch("pre_commit.binary_track.save_manifest"):
+            _rebuild_changed(["two", "one"], config, BuildManifest(), MagicMock())
+
+        assert [c.args[0].name for c in rebuild.call_args_list] == ["two", "one"]
+        assert threads == [threading.get_ident()] * 2
+
+    def test_nothing_ready_skips_save(self, tmp_path: Path) -> None:
+        """Test that no manifest write happens when no tracked binary changed."""
+        from pre_commit.binary_track import _rebuild_changed
+
+        with patch("pre_commit.binary_track.save_manifest") as save:
+            _rebuild_changed(["gone"], self._make_config(tmp_path), BuildManifest(), MagicMock())
+
+        save.assert_not_called()
+
+
+class TestRebuildStaleBinaries:
+    """Tests for the rebuild_stale_binaries function."""
+
+    def _make_config(self, tmp_path: Path, **kwargs: Any) -> TrackConfig:
+        binaries = {n: BinaryConfig(name=n, install_path=str(tmp_path / n)) for n in ("fresh", "old")}
+        return TrackConfig(root_dir=tmp_path, binaries=binaries, quiet=True, **kwargs)
+
+    def _statuses(self) -> list[BinaryStatusResult]:
+        return [
+            BinaryStatusResult(name="fresh", status=BinaryStatus.CURRENT, install_path=""),
+            BinaryStatusResult(name="old", status=BinaryStatus.STALE, install_path=""),
+        ]
+
+    def test_rebuilds_only_stale_binaries(self, tmp_path: Path) -> None:
+        """Test that only binaries whose status is stale or missing are rebuilt."""
+        from pre_commit.binary_track import RebuildResult
+
+        config = self._make_config(tmp_path, dry_run=True)
+        by_name = {status.name: status for status in self._statuses()}
+
+        def fake_status(binary_config: BinaryConfig, *args: Any) -> BinaryStatusResult:
+            return by_name[binary_config.name]
+
+        with patch("pre_commit.binary_track.get_binary_status", side_effect=fake_status):
+            with patch(
+                "pre_commit.binary_track.rebuild_binary",
+                return_value=RebuildResult(name="old", status=RebuildStatus.SUCCESS),
+            ) as rebuild:
+                result = rebuild_stale_binaries(config, MagicMock())
+
+        assert [c.args[0].name for c in rebuild.call_args_list] == ["old"]
+        assert [s.name for s in result.statuses] == ["fresh", "old"]
+
+
+class TestWatchDirectories:
+    """Tests for resolving watch-mode directories from source patterns."""
+
+    def test_uses_literal_prefix_or_root(self, tmp_path: Path) -> None:
+        """Test that patterns are watched from their existing literal directory prefix."""
+        from pre_commit.binary_track import _watch_directories
+
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        (tmp_path / "go.mod").write_text("module x")
+
+        watched = _watch_directories(
+            tmp_path, ["src/pkg/**/*.go", "src/*.go", "missing/*.go", "go.mod", "*.c"]
+        )
+
+        assert watched == {tmp_path / "src" / "pkg", tmp_path / "src", tmp_path}
+
+    def test_shared_prefixes_are_stat_once(self, tmp_path: Path) -> None:
+        """Test that a directory prefix shared by several patterns is only stat'ed once."""
+        from pre_commit.binary_track import _watch_directories
+
+        (tmp_path / "src").mkdir()
+        with patch("pre_commit.binary_track.os.stat", wraps=os.stat) as stat_call:
+            watched = _watch_directories(tmp_path, ["src/*.go", "src/*.mod", "src/**/*.c"])
+
+        assert watched == {tmp_path / "src"}
+        assert stat_call.call_count == 1
+
+
+class TestEditConfigFile:
+    """Tests for adding and removing binaries in the config file."""
+
+    CONFIG = """# Project binaries
+binaries:
+  keep:
+    build_cmd: make keep  # builds keep
+    install_path: ~/.local/bin/keep
+  drop:
+    build_cmd: make drop
+    install_path: ~/.local/bin/drop
+"""
+
+    def _load(self, tmp_path: Path) -> TrackConfig:
+        config_path = tmp_path / ".binariesrc.yaml"
+        config_path.write_text(self.CONFIG)
+        return TrackConfig.from_dict(yaml.safe_load(self.CONFIG), root_dir=tmp_path)
+
+    def test_remove_binary_from_yaml_config(self, tmp_path: Path) -> None:
+        """Test that removing a binary rewrites the YAML config without it."""
+        from pre_commit.binary_track import remove_binary
+
+        config = self._load(tmp_path)
+        remove_binary(config, MagicMock(), "drop")
+
+        data = yaml.safe_load((tmp_path / ".binariesrc.yaml").read_text())
+        assert list(data["binaries"]) == ["keep"]
+
+    def test_add_binary_appends_to_yaml_config(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Test that the interactive add writes the new binary into the YAML config."""
+        from pre_commit.binary_track import add_binary_interactive
+
+        config = self._load(tmp_path)
+        answers = iter(["new", "src/*.go", "go build", "~/.local/bin/new", "go", "y"])
+        monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+
+        add_binary_interactive(config, MagicMock())
+
+        data = yaml.safe_load((tmp_path / ".binariesrc.yaml").read_text())
+        assert list(data["binaries"]) == ["keep", "drop", "new"]
+        assert data["binaries"]["new"]["source_patterns"] == ["src/*.go"]
+
+    def test_remove_binary_keeps_comments_with_ruamel(self, tmp_path: Path) -> None:
+        """Test that comments survive an edit when ruamel.yaml is installed."""
+        pytest.importorskip("ruamel.yaml")
+        from pre_commit.binary_track import remove_binary
+
+        config = self._load(tmp_path)
+        remove_binary(config, MagicMock(), "drop")
+
+        text = (tmp_path / ".binariesrc.yaml").read_text()
+        assert "# Project binaries" in text
+        assert "# builds keep" in text
+        assert "drop" not in text
+
+
+class TestCollectReadyRebuilds:
+    """Tests for merging watch-mode change events with debouncing."""
+
+    def test_debounces_repeated_events(self) -> None:
+        """Test that only binaries quiet for the debounce period are released."""
+        import queue
+
+        from pre_commit.binary_track import _collect_ready_rebuilds
+
+        events: queue.SimpleQueue[tuple[str, float]] = queue.SimpleQueue()
+        now = time.monotonic()
+        events.put(("old", now - 10))
+        events.put(("busy", now - 10))
+        events.put(("busy", now))
+        pending: dict[str, float] = {}
+
+        ready = _collect_ready_rebuilds(events, pending, 1.0, 0.01)
+
+        assert ready == ["old"]
+        assert list(pending) == ["busy"]
+
+    def test_returns_nothing_when_idle(self) -> None:
+        """Test that an empty queue waits briefly and releases nothing."""
+        import queue
+
+        from pre_commit.binary_track import _collect_ready_rebuilds
+
+        assert _collect_ready_rebuilds(queue.SimpleQueue(), {}, 1.0, 0.01) == []
+
+
+class TestParseArgs:
+    """Tests for command-line parsing."""
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            [],
+            ["--check"],
+            ["-q", "--pre-commit"],
+            ["--verify", "--json"],
+            ["--rebuild-all", "--dry-run", "--verbose"],
+            ["-v", "--show-paths"],
+        ],
+    )
+    def test_simple_flags_match_full_parser(self, argv: list[str]) -> None:
+        """Test that the fast path parses exactly like the argparse parser."""
+        from pre_commit.binary_track import _build_parser, _parse_simple_args
+
+        fast = _parse_simple_args(argv)
+
+        assert fast is not None
+        assert vars(fast) == vars(_build_parser().parse_args(argv))
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--remove", "tool"],
+            ["--config", "x.yaml"],
+            ["--check", "--verify"],
+            ["-vq"],
+            ["--check", "--check"],
+        ],
+    )
+    def test_other_arguments_need_full_parser(self, argv: list[str]) -> None:
+        """Test that anything beyond plain boolean flags falls back to argparse."""
+        from pre_commit.binary_track import _parse_simple_args
+
+        assert _parse_simple_args(argv) is None
+
+    def test_full_parser_is_built_once(self) -> None:
+        """Test that repeated slow-path parses reuse one parser."""
+        from pre_commit.binary_track import _build_parser, parse_args
+
+        first = parse_args(["--remove", "a"])
+        second = parse_args(["--remove", "b"])
+
+        assert (first.remove, second.remove) == ("a", "b")
+        assert _build_parser() is _build_parser()
+
+
+class TestReportCodesignResults:
+    """Tests for the codesign results reporting in main()."""
+
+    def test_counts_failing_statuses_and_prints_json(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that failing statuses set the exit code and every result is printed."""
+        from pre_commit.binary_track import _report_codesign_results
+
+        results = [
+            CodesignResult(name="a", status=CodesignStatus.VALID, identity="ad-hoc"),
+            CodesignResult(name="b", status=CodesignStatus.UNSIGNED),
+        ]
+
+        assert _report_codesign_results(results, (CodesignStatus.FAILED,), False) == 0
+        assert capsys.readouterr().out == ""
+        assert _report_codesign_results(results, (CodesignStatus.UNSIGNED,), True) == 1
+        output = json.loads(capsys.readouterr().out)
+        assert [(r["name"], r["status"], r["identity"]) for r in output] == [
+            ("a", "valid", "ad-hoc"),
+            ("b", "unsigned", ""),
+        ]
+
+
+class TestExampleConfig:
+    """Tests for the example configuration shown when nothing is configured."""
+
+    def test_example_is_a_valid_config(self) -> None:
+        """Test that the example parses into a usable configuration."""
+        from pre_commit.binary_track import _EXAMPLE_CONFIG_YAML
+
+        config = TrackConfig.from_dict(yaml.safe_load(_EXAMPLE_CONFIG_YAML))
+
+        assert config.binaries["mytool"].source_patterns == ["cmd/mytool/**/*.go", "internal/**/*.go"]
+        assert config.binaries["mytool"].language == "go"
+        assert config.pre_commit_policy == PreCommitPolicy.WARN
+
+
+class TestMainDispatch:
+    """Tests for action dispatch in main()."""
+
+    def _configure(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Write a one-binary config and run from its directory."""
+        (tmp_path / ".binariesrc.yaml").write_text("binaries:\n  tool:\n    build_cmd: make\n")
+        monkeypatch.chdir(tmp_path)
+
+    def test_action_flag_selects_handler(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Test that an action flag runs its handler and maps the result to an exit code."""
+        from pre_commit.binary_track import TrackResult, main
+
+        self._configure(tmp_path, monkeypatch)
+        with patch("pre_commit.binary_track.verify_binaries", return_value=TrackResult(all_current=False)) as verify:
+            assert main(["--health", "-q"]) == 1
+        verify.assert_called_once()
+
+    def test_status_is_default_and_never_fails(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Test that running without an action shows status and exits 0 even when stale."""
+        from pre_commit.binary_track import TrackResult, main
+
+        self._configure(tmp_path, monkeypatch)
+        with patch("pre_commit.binary_track.check_all_binaries", return_value=TrackResult(all_current=False)):
+            assert main(["-q"]) == 0
+            assert main(["--check", "-q"]) == 1
+
+    def test_invalid_yaml_reports_error(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that a config that fails to parse exits 1 and other errors propagate."""
+        from pre_commit.binary_track import main
+
+        (tmp_path / ".binariesrc.yaml").write_text("binaries: [unclosed\n")
+        monkeypatch.chdir(tmp_path)
+        assert main(["-q"]) == 1
+        assert "Invalid YAML in config file" in capsys.readouterr().err
+
+        with patch("pre_commit.binary_track.load_config_file", side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                main(["-q"])
+
+
+class TestPeekPreCommitPolicy:
+    """Tests for reading the pre-commit policy ahead of the full config load."""
+
+    def test_reads_top_level_key(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Test that the top-level key is found and nested or commented ones are not."""
+        from pre_commit.binary_track import _peek_pre_commit_policy
+
+        monkeypatch.delenv("BINARY_TRACK_POLICY", raising=False)
+        config_file = tmp_path / ".binariesrc.yaml"
+        config_file.write_text("binaries:\n  t:\n    pre_commit_policy: block\npre_commit_policy: 'ignore'  # quiet\n")
+        assert _peek_pre_commit_policy(None, tmp_path) == "ignore"
+
+        config_file.write_text("# pre_commit_policy: ignore\nbinaries: {}\n")
+        assert _peek_pre_commit_policy(None, tmp_path) is None
+
+    def test_environment_overrides_file(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Test that BINARY_TRACK_POLICY wins over the config file, as in the full load."""
+        from pre_commit.binary_track import _peek_pre_commit_policy
+
+        (tmp_path / ".binariesrc.yaml").write_text("pre_commit_policy: ignore\n")
+        monkeypatch.setenv("BINARY_TRACK_POLICY", "block")
+
+        assert _peek_pre_commit_policy(None, tmp_path) == "block"
+
+    def test_ignore_policy_skips_config_load(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Test that --pre-commit under the ignore policy exits before loading the config."""
+        from pre_commit.binary_track import main
+
+        monkeypatch.delenv("BINARY_TRACK_POLICY", raising=False)
+        (tmp_path / ".binariesrc.yaml").write_text("pre_commit_policy: ignore\n")
+        monkeypatch.chdir(tmp_path)
+
+        with patch("pre_commit.binary_track.load_config_file", side_effect=AssertionError) as load:
+            assert main(["--pre-commit"]) == 0
+        load.assert_not_called()
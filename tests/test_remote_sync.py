@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import subprocess
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
@@ -29,6 +30,7 @@ from pre_commit.remote_sync import (
     SyncTargetResult,
     SyncTargetType,
     VpnConfig,
+    VpnContext,
     VpnResult,
     add_to_queue,
     branch_matches_pattern,
@@ -39,18 +41,24 @@ from pre_commit.remote_sync import (
     connect_vpn,
     disconnect_vpn,
     discover_remotes,
+    get_configured_remotes,
+    get_current_commit,
+    get_remote_commit,
+    get_remote_url,
     get_sync_state,
     get_target_branch,
     get_vpn_for_remote,
     is_force_push_required,
     is_git_repo,
     is_vpn_connected,
+    load_all_refs,
     load_config_file,
     load_env_config,
     load_queue,
     main,
     merge_configs,
     remove_from_queue,
+    reset_git_caches,
     save_queue,
     switch_branch_at_path,
     sync_to_filesystem,
@@ -61,6 +69,15 @@ if TYPE_CHECKING:
     from _pytest.monkeypatch import MonkeyPatch
 
 
+@pytest.fixture(autouse=True)
+def _reset_git_state() -> None:
+    """Drop cached git and VPN state so mocked commands never leak between tests."""
+    from pre_commit.remote_sync import _vpn_check_cache
+
+    reset_git_caches()
+    _vpn_check_cache.clear()
+
+
 class TestRemoteConfig:
     """Tests for RemoteConfig dataclass."""
 
@@ -101,6 +118,14 @@ class TestRemoteConfig:
         config = RemoteConfig.from_dict("origin", {"force_push": "invalid"})
         assert config.force_push == ForcePushPolicy.BLOCK
 
+    def test_from_dict_non_string_enum_values(self) -> None:
+        """Test that non-string enum values from YAML fall back to defaults."""
+        config = RemoteConfig.from_dict("origin", {"force_push": ["allow"]})
+        assert config.force_push == ForcePushPolicy.BLOCK
+
+        target = FilesystemTarget.from_dict("backup", {"path": "/b", "branch_mode": None})
+        assert target.branch_mode == BranchMode.MATCH
+
 
 class TestSyncConfig:
     """Tests for SyncConfig dataclass."""
@@ -160,6 +185,71 @@ class TestBranchMatchesPattern:
         assert branch_matches_pattern("release/1.0", patterns) is True
         assert branch_matches_pattern("feature/foo", patterns) is False
 
+    def test_patterns_compiled_once(self) -> None:
+        """Test that a pattern list is compiled once and reused."""
+        from pre_commit.remote_sync import _compile_branch_patterns
+
+        _compile_branch_patterns.cache_clear()
+        patterns = ["main", "release/*"]
+        for branch in ("main", "release/2.0", "dev"):
+            branch_matches_pattern(branch, patterns)
+
+        assert _compile_branch_patterns.cache_info().misses == 1
+
+    def test_mixed_patterns_agree_with_fnmatch(self) -> None:
+        """Test literal and combined-glob matching against fnmatch."""
+        import fnmatch
+
+        patterns = ["main", "release/*", "hotfix-?", "v[0-9]*", "dev"]
+        branches = [
+            "main", "mainline", "release/1.0", "release", "hotfix-1",
+            "hotfix-12", "v2.0", "vx", "dev", "develop", "feature/main",
+        ]
+        for branch in branches:
+            expected = any(fnmatch.fnmatch(branch, p) for p in patterns)
+            assert branch_matches_pattern(branch, patterns) is expected, branch
+
+    def test_remote_config_matches_branch(self) -> None:
+        """Test matching follows branches reassigned after parsing."""
+        remote = RemoteConfig.from_dict("origin", {"branches": ["main"]})
+        assert remote.matches_branch("main") is True
+
+        remote.branches = ["release/*"]
+        assert remote.matches_branch("main") is False
+        assert remote.matches_branch("release/1.0") is True
+
+
+class TestLogger:
+    """Tests for Logger output."""
+
+    def test_levels_and_streams(self, capsys) -> None:
+        """Test each level writes one line to the right stream."""
+        from pre_commit.remote_sync import Logger
+
+        log = Logger(verbose=True)
+        log.info("hello")
+        log.success("done")
+        log.warning("careful")
+        log.debug("detail")
+        log.error("boom")
+
+        captured = capsys.readouterr()
+        assert captured.out == "ℹ hello\n✓ done\n⚠ careful\n  detail\n"
+        assert captured.err == "✗ boom\n"
+
+    def test_quiet_suppresses_all_but_errors(self, capsys) -> None:
+        """Test quiet mode only lets errors through."""
+        from pre_commit.remote_sync import Logger
+
+        log = Logger(verbose=True, quiet=True)
+        log.info("hello")
+        log.warning("careful")
+        log.error("boom")
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert captured.err == "✗ boom\n"
+
 
 class TestQueuedPush:
     """Tests for QueuedPush dataclass."""
@@ -170,7 +260,7 @@ class TestQueuedPush:
             remote="origin",
             branch="main",
             commit_sha="abc123",
-            queued_at="2024-01-01T00:00:00Z",
+            queued_at=1704067200.0,
             retries=2,
             last_error="Connection timeout",
         )
@@ -178,6 +268,7 @@ class TestQueuedPush:
         assert data["remote"] == "origin"
         assert data["branch"] == "main"
         assert data["commit_sha"] == "abc123"
+        assert data["queued_at"] == 1704067200.0
         assert data["retries"] == 2
 
     def test_from_dict(self) -> None:
@@ -192,8 +283,16 @@ class TestQueuedPush:
         assert push.remote == "mirror"
         assert push.branch == "develop"
         assert push.commit_sha == "def456"
+        assert push.queued_at == 1704153600.0
         assert push.retries == 0
 
+    def test_from_dict_epoch(self) -> None:
+        """Test that epoch seconds are read back as a float."""
+        push = QueuedPush.from_dict(
+            {"remote": "origin", "branch": "main", "commit_sha": "abc", "queued_at": 1704067200.5}
+        )
+        assert push.queued_at == 1704067200.5
+
 
 class TestOfflineQueue:
     """Tests for OfflineQueue dataclass."""
@@ -206,7 +305,7 @@ class TestOfflineQueue:
                     remote="origin",
                     branch="main",
                     commit_sha="abc123",
-                    queued_at="2024-01-01T00:00:00Z",
+                    queued_at=1704067200.0,
                 ),
             ],
             created_at="2024-01-01T00:00:00Z",
@@ -329,7 +428,7 @@ class TestQueueOperations:
                     remote="origin",
                     branch="main",
                     commit_sha="abc123",
-                    queued_at="2024-01-01T00:00:00Z",
+                    queued_at=1704067200.0,
                 ),
             ],
         )
@@ -339,6 +438,197 @@ class TestQueueOperations:
 
         assert len(loaded.items) == 1
         assert loaded.items[0].remote == "origin"
+        assert loaded.items[0].queued_at == 1704067200.0
+
+    def test_utc_iso_now(self) -> None:
+        """Test the cached timestamp matches datetime's UTC ISO format."""
+        from datetime import datetime, timezone
+
+        from pre_commit.remote_sync import _utc_iso_now
+
+        with patch("time.time", return_value=1700000000.75):
+            first = _utc_iso_now()
+            assert _utc_iso_now() is first
+
+        assert first == datetime.fromtimestamp(1700000000, timezone.utc).isoformat()
+
+    def test_add_to_queue_appends_json_lines(self, tmp_path: Path) -> None:
+        """Test that each enqueue appends one JSON line."""
+        queue_path = tmp_path / ".remote-sync-queue.json"
+
+        add_to_queue("origin", "main", "abc123", "Error", queue_path)
+        add_to_queue("origin", "main", "def456", "Error", queue_path)
+
+        records = [json.loads(line) for line in queue_path.read_text().splitlines()]
+        assert [r["op"] for r in records] == ["enqueue", "enqueue"]
+        assert records[1]["commit_sha"] == "def456"
+        assert isinstance(records[1]["queued_at"], float)
+
+    def test_replay_formats_queue_timestamps(self, tmp_path: Path) -> None:
+        """Test that replayed enqueue records set ISO created/updated times."""
+        queue_path = tmp_path / ".remote-sync-queue.json"
+        with patch("time.time", return_value=1704067200.0):
+            add_to_queue("origin", "main", "abc123", "", queue_path)
+        with patch("time.time", return_value=1704067260.0):
+            add_to_queue("mirror", "main", "abc123", "", queue_path)
+
+        queue = load_queue(queue_path)
+        assert queue.created_at == "2024-01-01T00:00:00+00:00"
+        assert queue.updated_at == "2024-01-01T00:01:00+00:00"
+
+    def test_compact_queue(self, tmp_path: Path) -> None:
+        """Test that compaction keeps only live items."""
+        from pre_commit.remote_sync import compact_queue
+
+        queue_path = tmp_path / ".remote-sync-queue.json"
+        add_to_queue("origin", "main", "abc123", "Error 1", queue_path)
+        add_to_queue("origin", "main", "def456", "Error 2", queue_path)
+        add_to_queue("mirror", "develop", "aaa111", "", queue_path)
+        remove_from_queue("mirror", "develop", queue_path)
+
+        assert compact_queue(queue_path) is True
+
+        lines = queue_path.read_text().splitlines()
+        assert len(lines) == 2  # meta + one item
+        queue = load_queue(queue_path)
+        assert [(i.remote, i.commit_sha, i.retries) for i in queue.items] == [
+            ("origin", "def456", 1)
+        ]
+
+        remove_from_queue("origin", "main", queue_path)
+        compact_queue(queue_path)
+        assert not queue_path.exists()
+
+    def test_load_queue_skips_torn_line(self, tmp_path: Path) -> None:
+        """Test that a partially written trailing record is ignored."""
+        queue_path = tmp_path / ".remote-sync-queue.json"
+        add_to_queue("origin", "main", "abc123", "", queue_path)
+        with open(queue_path, "a") as f:
+            f.write('{"op": "enqueue", "remote": "mir')
+
+        queue = load_queue(queue_path)
+        assert [i.remote for i in queue.items] == ["origin"]
+
+    def test_load_queue_streams_long_journal(self, tmp_path: Path) -> None:
+        """Test replaying a long journal with blank lines and churn."""
+        queue_path = tmp_path / ".remote-sync-queue.json"
+        with open(queue_path, "w") as f:
+            f.write("\n\n")
+            for i in range(500):
+                f.write(json.dumps({
+                    "op": "enqueue", "remote": "origin", "branch": f"b{i % 5}",
+                    "commit_sha": f"sha{i}", "queued_at": "2024-01-01T00:00:00+00:00",
+                }) + "\n")
+                if i % 5 == 4:
+                    f.write(json.dumps({"op": "remove", "remote": "origin", "branch": "b0"}) + "\n")
+
+        queue = load_queue(queue_path)
+        assert [i.branch for i in queue.items] == ["b1", "b2", "b3", "b4"]
+        assert queue.items[-1].commit_sha == "sha499"
+        assert queue.items[-1].retries == 99
+
+    def test_load_legacy_json_queue(self, tmp_path: Path) -> None:
+        """Test that single-document JSON queues still load."""
+        queue_path = tmp_path / ".remote-sync-queue.json"
+        queue_path.write_text(
+            json.dumps(
+                {
+                    "created_at": "2024-01-01T00:00:00+00:00",
+                    "items": [
+                        {
+                            "remote": "origin",
+                            "branch": "main",
+                            "commit_sha": "abc123",
+                            "queued_at": "2024-01-01T00:00:00+00:00",
+                        }
+                    ],
+                },
+                indent=2,
+            )
+        )
+
+        queue = load_queue(queue_path)
+        assert [i.remote for i in queue.items] == ["origin"]
+        assert queue.items[0].queued_at == 1704067200.0
+
+    def test_load_legacy_yaml_queue(self, tmp_path: Path) -> None:
+        """Test that YAML queues from older versions still load."""
+        queue_path = tmp_path / ".remote-sync-queue.json"
+        queue_path.write_text(
+            "created_at: '2024-01-01T00:00:00+00:00'\n"
+            "items:\n"
+            "- remote: origin\n"
+            "  branch: main\n"
+            "  commit_sha: abc123\n"
+            "  queued_at: '2024-01-01T00:00:00+00:00'\n"
+            "  retries: 2\n"
+        )
+
+        queue = load_queue(queue_path)
+        assert len(queue.items) == 1
+        assert queue.items[0].retries == 2
+
+    def test_load_queue_malformed_queued_at(self, tmp_path: Path) -> None:
+        """Test that an unparseable queued_at yields an empty queue instead of raising."""
+        queue_path = tmp_path / ".remote-sync-queue.json"
+        queue_path.write_text(
+            json.dumps(
+                {
+                    "items": [
+                        {
+                            "remote": "origin",
+                            "branch": "main",
+                            "commit_sha": "abc123",
+                            "queued_at": "yesterday",
+                        }
+                    ],
+                }
+            )
+        )
+
+        queue = load_queue(queue_path)
+        assert queue.items == []
+
+    def test_add_to_legacy_queue_survives_processing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that appending to an old single-document queue keeps every item."""
+        from pre_commit.remote_sync import process_queue
+
+        monkeypatch.chdir(tmp_path)
+        queue_path = tmp_path / ".remote-sync-queue.json"
+        queue_path.write_text(
+            "created_at: '2024-01-01T00:00:00+00:00'\n"
+            "items:\n"
+            "- remote: origin\n"
+            "  branch: main\n"
+            "  commit_sha: abc123\n"
+            "  queued_at: '2024-01-01T00:00:00+00:00'\n"
+        )
+
+        add_to_queue("mirror", "develop", "def456", "Timeout")
+
+        def failed_pushes(remote: str, branches: list[str], *args: object) -> list[PushResult]:
+            return [PushResult(remote=remote, branch=b, status=PushStatus.FAILED, message="down") for b in branches]
+
+        with patch("pre_commit.remote_sync.push_branches_to_remote", side_effect=failed_pushes):
+            process_queue(SyncConfig())
+
+        queue = load_queue(queue_path)
+        assert sorted((i.remote, i.branch) for i in queue.items) == [
+            ("mirror", "develop"),
+            ("origin", "main"),
+        ]
+
+    def test_compact_keeps_unreadable_queue(self, tmp_path: Path) -> None:
+        """Test that compaction never deletes a queue file it could not parse."""
+        from pre_commit.remote_sync import compact_queue
+
+        queue_path = tmp_path / ".remote-sync-queue.json"
+        queue_path.write_text("items: [unclosed\n")
+
+        assert compact_queue(queue_path) is False
+        assert queue_path.read_text() == "items: [unclosed\n"
 
     def test_add_to_queue(self, tmp_path: Path) -> None:
         """Test adding items to queue."""
@@ -413,6 +703,49 @@ class TestGitOperations:
         assert result.status == RemoteStatus.UNREACHABLE
         assert "Connection refused" in result.error
 
+    def test_check_all_remotes_health_concurrent(self) -> None:
+        """Test that parallel health checks run together on one event loop."""
+        import asyncio
+
+        from pre_commit.remote_sync import check_all_remotes_health
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_git(args, timeout=None):
+            nonlocal in_flight, peak
+            if args[0] == "remote":
+                return subprocess.CompletedProcess(args, 0, f"git@host:{args[2]}.git\n", "")
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            code = 128 if args[-1] == "down" else 0
+            return subprocess.CompletedProcess(args, code, "", "unreachable" if code else "")
+
+        names = ["origin", "down", "m1", "m2", "m3", "m4", "m5"]
+        config = SyncConfig(remotes={n: RemoteConfig(name=n) for n in names}, max_workers=2)
+        with patch("pre_commit.remote_sync._run_git_command_async", side_effect=fake_git):
+            results = check_all_remotes_health(config)
+
+        assert [r.remote for r in results] == names
+        assert peak == len(names)
+        assert results[1].status == RemoteStatus.UNREACHABLE
+        assert results[1].error == "unreachable"
+        assert results[0].url == "git@host:origin.git"
+
+    def test_check_remote_health_async_missing_git(self) -> None:
+        """Test that a missing git binary reports the remote unreachable."""
+        import asyncio
+
+        from pre_commit.remote_sync import check_remote_health_async
+
+        with patch("pre_commit.remote_sync.get_git_binary", return_value="/nonexistent/git"):
+            result = asyncio.run(check_remote_health_async("origin"))
+
+        assert result.status == RemoteStatus.UNREACHABLE
+        assert result.error == "git command not found"
+
     @patch("pre_commit.remote_sync.run_git_command")
     def test_get_sync_state_in_sync(self, mock_run: MagicMock) -> None:
         """Test sync state when in sync."""
@@ -471,9 +804,8 @@ class TestGitOperations:
         # Mock responses for rev-parse and merge-base
         def side_effect(args, **kwargs):
             if args[0] == "rev-parse":
-                if "origin" in args[1]:
-                    return subprocess.CompletedProcess(args, 0, "abc123", "")
-                return subprocess.CompletedProcess(args, 0, "def456", "")
+                shas = ["abc123" if "origin" in name else "def456" for name in args[1:]]
+                return subprocess.CompletedProcess(args, 0, "\n".join(shas), "")
             if args[0] == "merge-base":
                 return subprocess.CompletedProcess(args, 0, "abc123", "")
             return subprocess.CompletedProcess(args, 1, "", "error")
@@ -485,6 +817,285 @@ class TestGitOperations:
         assert result is False
 
 
+class TestRefsSnapshot:
+    """Tests for the cached for-each-ref snapshot."""
+
+    REFS_OUTPUT = (
+        "*aaa111 refs/heads/main\n"
+        " bbb222 refs/heads/feature\n"
+        " aaa111 refs/remotes/origin/main\n"
+        " ccc333 refs/remotes/backup/main\n"
+    )
+
+    @patch("pre_commit.remote_sync.run_git_command")
+    def test_load_all_refs_parses_and_caches(self, mock_run: MagicMock) -> None:
+        """Test that refs are loaded once and HEAD is recorded."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            ["git", "for-each-ref"], 0, stdout=self.REFS_OUTPUT, stderr=""
+        )
+
+        refs = load_all_refs()
+        assert refs is not None
+        assert refs["refs/heads/feature"] == "bbb222"
+        assert refs["HEAD"] == "aaa111"
+
+        assert get_current_commit() == "aaa111"
+        assert get_remote_commit("backup", "main") == "ccc333"
+        assert get_remote_commit("backup", "missing") is None
+        assert mock_run.call_count == 1
+
+    @patch("pre_commit.remote_sync.run_git_command")
+    def test_in_sync_without_rev_list(self, mock_run: MagicMock) -> None:
+        """Test that identical tips skip the rev-list walk."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            ["git", "for-each-ref"], 0, stdout=self.REFS_OUTPUT, stderr=""
+        )
+
+        assert get_sync_state("origin", "main") == (SyncState.IN_SYNC, 0, 0)
+        assert is_force_push_required("origin", "main") is False
+        assert mock_run.call_count == 1
+
+    @patch("pre_commit.remote_sync.run_git_command")
+    def test_invalidate_reloads(self, mock_run: MagicMock) -> None:
+        """Test that invalidation forces a fresh snapshot."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            ["git", "for-each-ref"], 0, stdout=self.REFS_OUTPUT, stderr=""
+        )
+
+        load_all_refs()
+        reset_git_caches()
+        load_all_refs()
+        assert mock_run.call_count == 2
+
+    @patch("pre_commit.remote_sync.run_git_command")
+    def test_is_force_push_required_no_remote_branch(self, mock_run: MagicMock) -> None:
+        """Test that a branch missing on the remote never needs a force push."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            ["git", "for-each-ref"], 0, stdout="*aaa111 refs/heads/main\n", stderr=""
+        )
+
+        assert is_force_push_required("origin", "main") is False
+        assert mock_run.call_count == 1
+
+    @patch("pre_commit.remote_sync.run_git_command")
+    def test_resolve_refs_single_call(self, mock_run: MagicMock) -> None:
+        """Test that several names are resolved by one rev-parse."""
+        from pre_commit.remote_sync import resolve_refs
+
+        mock_run.return_value = subprocess.CompletedProcess(
+            ["git", "rev-parse"], 0, stdout="aaa111\nbbb222\n", stderr=""
+        )
+
+        assert resolve_refs("main", "origin/main") == ["aaa111", "bbb222"]
+        mock_run.assert_called_once_with(["rev-parse", "main", "origin/main"])
+
+        mock_run.return_value = subprocess.CompletedProcess(
+            ["git", "rev-parse"], 128, stdout="aaa111\norigin/nope\n", stderr="fatal"
+        )
+        assert resolve_refs("main", "origin/nope") is None
+
+
+class TestGetSyncStates:
+    """Tests for batched sync state computation."""
+
+    REFS_OUTPUT = (
+        "*aaa111 refs/heads/main\n"
+        " aaa111 refs/remotes/origin/main\n"
+        " bbb222 refs/remotes/gitlab/main\n"
+        " ccc333 refs/remotes/backup/main\n"
+    )
+
+    @staticmethod
+    def _side_effect(ahead_behind_code: int):
+        def side_effect(args, **kwargs):
+            if args[0] == "for-each-ref" and "refs/heads" in args:
+                return subprocess.CompletedProcess(args, 0, TestGetSyncStates.REFS_OUTPUT, "")
+            if args[0] == "for-each-ref":
+                out = "refs/remotes/gitlab/main 0 2\nrefs/remotes/backup/main 1 3\n"
+                return subprocess.CompletedProcess(args, ahead_behind_code, out, "")
+            if args[0] == "rev-list":
+                return subprocess.CompletedProcess(args, 0, "5\t0", "")
+            return subprocess.CompletedProcess(args, 1, "", "error")
+
+        return side_effect
+
+    @patch("pre_commit.remote_sync.run_git_command")
+    def test_batched_ahead_behind(self, mock_run: MagicMock) -> None:
+        """Test that remotes sharing a branch are counted in one call."""
+        from pre_commit.remote_sync import get_sync_states
+
+        mock_run.side_effect = self._side_effect(0)
+        pairs = [("origin", "main"), ("gitlab", "main"), ("backup", "main"), ("new", "main")]
+
+        states = get_sync_states(pairs)
+
+        assert states[("origin", "main")] == (SyncState.IN_SYNC, 0, 0)
+        assert states[("gitlab", "main")] == (SyncState.AHEAD, 2, 0)
+        assert states[("backup", "main")] == (SyncState.DIVERGED, 3, 1)
+        # Unknown to the snapshot, so checked individually
+        assert states[("new", "main")] == (SyncState.AHEAD, 5, 0)
+        assert [c[0][0][0] for c in mock_run.call_args_list] == [
+            "for-each-ref", "for-each-ref", "rev-list"
+        ]
+
+    @patch("pre_commit.remote_sync.run_git_command")
+    def test_old_git_falls_back_to_rev_list(self, mock_run: MagicMock) -> None:
+        """Test that git without %(ahead-behind:) uses rev-list and is not retried."""
+        from pre_commit.remote_sync import get_sync_states
+
+        mock_run.side_effect = self._side_effect(128)
+        pairs = [("gitlab", "main"), ("backup", "main")]
+
+        assert get_sync_states(pairs)[("gitlab", "main")] == (SyncState.AHEAD, 5, 0)
+        get_sync_states(pairs)
+
+        commands = [c[0][0][0] for c in mock_run.call_args_list]
+        assert commands == ["for-each-ref", "for-each-ref"] + ["rev-list"] * 4
+
+
+class TestPushBranchesToRemote:
+    """Tests for pushing several queued branches in one git push."""
+
+    REFS_OUTPUT = "*aaa111 refs/heads/main\n bbb222 refs/heads/feature\n"
+
+    PUSH_OUTPUT = (
+        "To /srv/git/repo.git\n"
+        "*\trefs/heads/main:refs/heads/main\t[new branch]\n"
+        "!\trefs/heads/feature:refs/heads/feature\t[rejected] (fetch first)\n"
+        "Done\n"
+    )
+
+    def test_parse_push_porcelain(self) -> None:
+        """Test that porcelain lines map destination refs to success."""
+        from pre_commit.remote_sync import _parse_push_porcelain
+
+        assert _parse_push_porcelain(self.PUSH_OUTPUT) == {
+            "refs/heads/main": True,
+            "refs/heads/feature": False,
+        }
+
+    @patch("pre_commit.remote_sync.push_to_remote")
+    @patch("pre_commit.remote_sync.run_git_command")
+    def test_single_push_with_fallback(
+        self, mock_run: MagicMock, mock_push: MagicMock
+    ) -> None:
+        """Test that one push covers all branches and misses are retried alone."""
+        from pre_commit.remote_sync import push_branches_to_remote
+
+        def fake_git(args: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+            if args[0] == "for-each-ref":
+                return subprocess.CompletedProcess(args, 0, stdout=self.REFS_OUTPUT, stderr="")
+            return subprocess.CompletedProcess(args, 1, stdout=self.PUSH_OUTPUT, stderr="")
+
+        mock_run.side_effect = fake_git
+        mock_push.return_value = PushResult(
+            remote="origin", branch="feature", status=PushStatus.FAILED, message="rejected"
+        )
+
+        results = push_branches_to_remote(
+            "origin", ["main", "feature"], RemoteConfig(name="origin")
+        )
+
+        push_calls = [c for c in mock_run.call_args_list if c.args[0][0] == "push"]
+        assert len(push_calls) == 1
+        assert push_calls[0].args[0] == ["push", "--porcelain", "origin", "main", "feature"]
+        assert [r.branch for r in results] == ["main", "feature"]
+        assert results[0].status == PushStatus.SUCCESS
+        assert results[0].commit_sha == "aaa111"
+        assert results[1].status == PushStatus.FAILED
+        mock_push.assert_called_once()
+        assert mock_push.call_args.args[:2] == ("origin", "feature")
+
+    @patch("pre_commit.remote_sync.push_to_remote")
+    def test_single_branch_uses_push_to_remote(self, mock_push: MagicMock) -> None:
+        """Test that a lone branch goes straight through push_to_remote."""
+        from pre_commit.remote_sync import push_branches_to_remote
+
+        mock_push.return_value = PushResult(
+            remote="origin", branch="main", status=PushStatus.SUCCESS
+        )
+
+        results = push_branches_to_remote("origin", ["main"], RemoteConfig(name="origin"))
+
+        assert results == [mock_push.return_value]
+        mock_push.assert_called_once()
+
+
+class TestGitCaches:
+    """Tests for memoized git queries."""
+
+    @patch("pre_commit.remote_sync.run_git_command")
+    def test_remote_queries_are_memoized(self, mock_run: MagicMock) -> None:
+        """Test that repeated remote lookups spawn git once each."""
+        def side_effect(args, **kwargs):
+            if args == ["remote"]:
+                return subprocess.CompletedProcess(args, 0, "origin\nbackup\n", "")
+            return subprocess.CompletedProcess(args, 0, f"git@host:{args[2]}.git\n", "")
+
+        mock_run.side_effect = side_effect
+
+        for _ in range(3):
+            assert get_configured_remotes() == ["origin", "backup"]
+            assert get_remote_url("origin") == "git@host:origin.git"
+        assert mock_run.call_count == 2
+
+        reset_git_caches()
+        get_remote_url("origin")
+        assert mock_run.call_count == 3
+
+    @patch("pre_commit.remote_sync.run_git_command")
+    def test_failed_remote_list_not_cached(self, mock_run: MagicMock) -> None:
+        """Test that a failed 'git remote' is retried on the next call."""
+        mock_run.return_value = subprocess.CompletedProcess(["git"], 128, "", "fatal")
+
+        assert get_configured_remotes() == []
+        assert get_configured_remotes() == []
+        assert mock_run.call_count == 2
+
+
+class TestGitEnv:
+    """Tests for the shared git subprocess environment."""
+
+    def test_repository_pinned_from_subdirectory(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        """Test that the repo is located once and the branch memo primed."""
+        from pre_commit.remote_sync import _get_git_env, get_current_branch
+
+        monkeypatch.delenv("GIT_DIR", raising=False)
+        subprocess.run(["git", "init", "-q", "-b", "trunk", str(tmp_path)], check=True)
+        subprocess.run(
+            ["git", "-C", str(tmp_path), "-c", "user.name=t", "-c", "user.email=t@t",
+             "commit", "-q", "--allow-empty", "-m", "init"],
+            check=True,
+        )
+        nested = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+        monkeypatch.chdir(nested)
+
+        env = _get_git_env()
+
+        assert Path(env["GIT_DIR"]) == (tmp_path / ".git").resolve()
+        assert Path(env["GIT_WORK_TREE"]) == tmp_path.resolve()
+        assert env["GIT_OPTIONAL_LOCKS"] == "0"
+        with patch("pre_commit.remote_sync.run_git_command") as mock_run:
+            assert get_current_branch() == "trunk"
+            mock_run.assert_not_called()
+
+    def test_outside_repository(self, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+        """Test that discovery is left to git outside a repository."""
+        from pre_commit.remote_sync import _get_git_env
+
+        monkeypatch.delenv("GIT_DIR", raising=False)
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+        monkeypatch.chdir(tmp_path)
+
+        env = _get_git_env()
+
+        assert "GIT_DIR" not in env
+        assert env["GIT_OPTIONAL_LOCKS"] == "0"
+
+
 class TestDiscoverRemotes:
     """Tests for discover_remotes function."""
 
@@ -505,6 +1116,23 @@ class TestDiscoverRemotes:
         # Origin should have priority 1
         assert config.remotes["origin"].priority == 1
 
+    @patch("pre_commit.remote_sync.get_configured_remotes")
+    @patch("pre_commit.remote_sync.get_remote_url")
+    def test_discover_remotes_parallel_keeps_order(
+        self, mock_url: MagicMock, mock_remotes: MagicMock
+    ) -> None:
+        """Test that parallel URL probing keeps remote order and priorities."""
+        names = ["origin", "upstream", "backup", "mirror", "gitlab"]
+        mock_remotes.return_value = names
+        mock_url.side_effect = lambda r: None if r == "mirror" else f"https://github.com/{r}/repo.git"
+
+        config = discover_remotes(SyncConfig(max_workers=3))
+
+        assert list(config.remotes) == names
+        assert mock_url.call_count == len(names)
+        assert config.remotes["backup"].priority == 12
+        assert config.remotes["mirror"] == RemoteConfig(name="mirror", priority=13)
+
     @patch("pre_commit.remote_sync.get_configured_remotes")
     def test_discover_remotes_skips_if_configured(
         self, mock_remotes: MagicMock
@@ -693,6 +1321,8 @@ class TestVpnConfig:
         assert config.connect_cmd == ""
         assert config.disconnect_cmd == ""
         assert config.check_cmd == ""
+        assert config.interface == ""
+        assert config.fast_verify is False
         assert config.timeout == 60  # Increased default for VPN connections
         assert config.auto_connect is True
 
@@ -712,6 +1342,53 @@ class TestVpnConfig:
         assert config.auto_connect is False
 
 
+class TestRunShellCommand:
+    """Tests for run_shell_command."""
+
+    def test_split_simple_command(self) -> None:
+        """Test which commands can skip the shell."""
+        from pre_commit.remote_sync import _split_simple_command
+
+        assert _split_simple_command("sudo wg-quick up 'my vpn'") == ("sudo", "wg-quick", "up", "my vpn")
+        assert _split_simple_command("nmcli con up id=work") == ("nmcli", "con", "up", "id=work")
+        assert _split_simple_command("ip link show | grep wg0") is None
+        assert _split_simple_command("vpn connect $PROFILE") is None
+        assert _split_simple_command("VPN_USER=me vpn connect") is None
+        assert _split_simple_command("vpn 'unterminated") is None
+
+    @patch("subprocess.run")
+    def test_simple_command_runs_without_shell(self, mock_run: MagicMock) -> None:
+        """Test a plain command is executed directly."""
+        from pre_commit.remote_sync import run_shell_command
+
+        mock_run.return_value = subprocess.CompletedProcess([], 0, "", "")
+
+        run_shell_command("wg-quick up wg0", timeout=5)
+
+        assert mock_run.call_args[0][0] == ("wg-quick", "up", "wg0")
+        assert "shell" not in mock_run.call_args[1]
+
+    def test_builtin_falls_back_to_shell(self) -> None:
+        """Test shell builtins and syntax still work."""
+        from pre_commit.remote_sync import run_shell_command
+
+        assert run_shell_command("cd /").returncode == 0
+        assert run_shell_command("echo one | tr a-z A-Z").stdout == "ONE\n"
+        assert run_shell_command("definitely-not-a-command-xyz").returncode == 127
+
+    def test_failed_exec_is_remembered(self) -> None:
+        """Test that a command which cannot be exec'd goes straight to the shell next time."""
+        from pre_commit.remote_sync import _shell_only_commands, run_shell_command
+
+        run_shell_command("cd /")
+        assert "cd /" in _shell_only_commands
+
+        with patch("subprocess.run", wraps=subprocess.run) as mock_run:
+            assert run_shell_command("cd /").returncode == 0
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[1]["shell"] is True
+
+
 class TestVpnOperations:
     """Tests for VPN connect/disconnect operations."""
 
@@ -745,6 +1422,25 @@ class TestVpnOperations:
         )
         assert is_vpn_connected(vpn_config) is False
 
+    @patch("pre_commit.remote_sync.run_shell_command")
+    def test_is_vpn_connected_reuses_recent_result(self, mock_run: MagicMock) -> None:
+        """Test that back-to-back checks run check_cmd once until a connect."""
+        mock_run.return_value = subprocess.CompletedProcess("cmd", 0, stdout="", stderr="")
+
+        vpn_config = VpnConfig(
+            name="test-vpn",
+            connect_cmd="connect",
+            disconnect_cmd="disconnect",
+            check_cmd="check",
+        )
+        assert is_vpn_connected(vpn_config) is True
+        assert is_vpn_connected(vpn_config) is True
+        assert mock_run.call_count == 1
+
+        disconnect_vpn(vpn_config)
+        assert is_vpn_connected(vpn_config) is True
+        assert mock_run.call_count == 3
+
     def test_is_vpn_connected_no_check_cmd(self) -> None:
         """Test VPN connection check without check command."""
         vpn_config = VpnConfig(
@@ -777,6 +1473,246 @@ class TestVpnOperations:
         assert result.connected is True
         assert result.vpn_name == "test-vpn"
 
+    @patch("pre_commit.remote_sync.time.sleep")
+    @patch("pre_commit.remote_sync.run_shell_command")
+    def test_connect_vpn_polls_until_up(
+        self, mock_run: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """Test that the check command is polled with growing delays."""
+        checks = iter([1, 1, 1, 0])
+
+        def fake_shell(command: str, timeout: int | None = None) -> subprocess.CompletedProcess[str]:
+            rc = next(checks) if command == "vpn status" else 0
+            return subprocess.CompletedProcess(command, rc, stdout="", stderr="")
+
+        mock_run.side_effect = fake_shell
+        vpn_config = VpnConfig(
+            name="test-vpn",
+            connect_cmd="vpn connect",
+            disconnect_cmd="vpn disconnect",
+            check_cmd="vpn status",
+        )
+        result = connect_vpn(vpn_config, dry_run=False)
+
+        assert result.connected is True
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.05, 0.1]
+
+    @patch("pre_commit.remote_sync.time.sleep")
+    @patch("pre_commit.remote_sync.run_shell_command")
+    def test_connect_vpn_check_never_passes(
+        self, mock_run: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """Test that polling gives up once the VPN timeout has passed."""
+        mock_run.side_effect = lambda command, timeout=None: subprocess.CompletedProcess(
+            command, 1 if command == "vpn status" else 0, stdout="", stderr=""
+        )
+        vpn_config = VpnConfig(
+            name="test-vpn",
+            connect_cmd="vpn connect",
+            disconnect_cmd="vpn disconnect",
+            check_cmd="vpn status",
+            timeout=0,
+        )
+        result = connect_vpn(vpn_config, dry_run=False)
+
+        assert result.connected is False
+        assert "connection check failed" in result.message
+        mock_sleep.assert_not_called()
+
+    @patch("pre_commit.remote_sync.os.path.exists")
+    @patch("pre_commit.remote_sync.run_shell_command")
+    def test_connect_vpn_interface_skips_check(
+        self, mock_run: MagicMock, mock_exists: MagicMock
+    ) -> None:
+        """Test that a tracked VPN with a live interface needs no check command."""
+        from pre_commit.remote_sync import _active_vpn_connections
+
+        vpn_config = VpnConfig(
+            name="test-vpn",
+            connect_cmd="wg-quick up wg0",
+            disconnect_cmd="wg-quick down wg0",
+            check_cmd="wg show wg0",
+            interface="wg0",
+        )
+        mock_exists.return_value = True
+        _active_vpn_connections["test-vpn"] = vpn_config
+        try:
+            result = connect_vpn(vpn_config)
+        finally:
+            _active_vpn_connections.pop("test-vpn", None)
+
+        assert result.message == "Already connected"
+        mock_exists.assert_called_once_with("/sys/class/net/wg0")
+        mock_run.assert_not_called()
+
+    def test_connect_vpn_fast_verify(self, tmp_path: Path) -> None:
+        """Test that fast_verify connects and checks in a single command."""
+        from pre_commit import remote_sync
+
+        flag = tmp_path / "up"
+        vpn_config = VpnConfig(
+            name="test-vpn",
+            connect_cmd=f"touch {flag}",
+            disconnect_cmd=f"rm {flag}",
+            check_cmd=f"test -e {flag}",
+            fast_verify=True,
+        )
+        with patch.object(
+            remote_sync, "run_shell_command", wraps=remote_sync.run_shell_command
+        ) as mock_run:
+            result = connect_vpn(vpn_config)
+
+        assert result.connected is True
+        assert mock_run.call_count == 2  # pre-connect check + fused connect/check
+        remote_sync._active_vpn_connections.pop("test-vpn", None)
+
+    @patch("pre_commit.remote_sync._wait_for_vpn")
+    def test_connect_vpn_fast_verify_connect_fails(self, mock_wait: MagicMock) -> None:
+        """Test that a failed connect in the fused command is not polled."""
+        vpn_config = VpnConfig(
+            name="test-vpn",
+            connect_cmd="echo refused >&2; exit 4",
+            disconnect_cmd="true",
+            check_cmd="false",
+            fast_verify=True,
+        )
+        result = connect_vpn(vpn_config)
+
+        assert result.connected is False
+        assert result.message == "refused"
+        mock_wait.assert_not_called()
+
+    def test_connect_vpn_ready_regex(self, tmp_path: Path) -> None:
+        """Test that a foreground client counts as up once it prints the ready line."""
+        import sys
+
+        from pre_commit.remote_sync import _vpn_processes
+
+        script = tmp_path / "client.py"
+        script.write_text(
+            "import time\n"
+            "print('Peer connection initiated', flush=True)\n"
+            "print('Initialization Sequence Completed', flush=True)\n"
+            "time.sleep(30)\n"
+        )
+        vpn_config = VpnConfig(
+            name="test-vpn",
+            connect_cmd=f"{sys.executable} {script}",
+            disconnect_cmd="",
+            ready_regex="Sequence Completed",
+            timeout=10,
+        )
+
+        start = time.monotonic()
+        result = connect_vpn(vpn_config)
+        assert result.connected is True
+        assert time.monotonic() - start < 10
+        proc = _vpn_processes["test-vpn"]
+        assert proc.poll() is None
+
+        result = disconnect_vpn(vpn_config)
+        assert result.connected is False
+        assert proc.poll() is not None
+        assert "test-vpn" not in _vpn_processes
+
+    def test_disconnect_stops_shell_client_group(self) -> None:
+        """Test that disconnect stops what a shell connect_cmd started, not just the shell."""
+        import os
+
+        from pre_commit.remote_sync import _vpn_processes
+
+        vpn_config = VpnConfig(
+            name="test-vpn",
+            connect_cmd="echo ready; sleep 300 | cat",
+            disconnect_cmd="",
+            ready_regex="ready",
+            timeout=10,
+        )
+        assert connect_vpn(vpn_config).connected is True
+        pgid = _vpn_processes["test-vpn"].pid
+
+        assert disconnect_vpn(vpn_config).connected is False
+        with pytest.raises(ProcessLookupError):
+            os.killpg(pgid, 0)
+
+    @patch("pre_commit.remote_sync.logger")
+    def test_invalid_ready_regex(self, mock_logger: MagicMock) -> None:
+        """Test that a bad ready_regex is reported instead of raising."""
+        vpn_config = VpnConfig.from_dict(
+            "test-vpn", {"connect_cmd": "vpn up", "ready_regex": "("}
+        )
+        assert "Invalid ready_regex for VPN 'test-vpn'" in mock_logger.warning.call_args[0][0]
+
+        result = connect_vpn(vpn_config)
+        assert result.connected is False
+        assert result.message.startswith("Invalid ready_regex:")
+
+    def test_devnull_fd_is_shared(self) -> None:
+        """Test that /dev/null is opened once and survives child processes."""
+        import os
+        import sys
+
+        from pre_commit.remote_sync import _devnull_fd
+
+        fd = _devnull_fd()
+        assert _devnull_fd() == fd
+        subprocess.run([sys.executable, "-c", "pass"], stdin=fd, check=True)
+        os.fstat(fd)  # still open
+
+    def test_connect_vpn_ready_regex_client_exits(self, tmp_path: Path) -> None:
+        """Test that a client exiting before the ready line reports its output."""
+        import sys
+
+        script = tmp_path / "client.py"
+        script.write_text("import sys\nprint('AUTH_FAILED')\nsys.exit(1)\n")
+        vpn_config = VpnConfig(
+            name="test-vpn",
+            connect_cmd=f"{sys.executable} {script}",
+            disconnect_cmd="",
+            ready_regex="Sequence Completed",
+        )
+        result = connect_vpn(vpn_config)
+
+        assert result.connected is False
+        assert result.message == "AUTH_FAILED"
+
+    @patch("pre_commit.remote_sync.run_shell_command")
+    def test_concurrent_connects_share_one_command(self, mock_run: MagicMock) -> None:
+        """Test that a second caller waits for the connect already running."""
+        import threading
+
+        from pre_commit.remote_sync import _active_vpn_connections
+
+        entered = threading.Event()
+        release = threading.Event()
+
+        def slow_connect(command: str, timeout: int | None = None) -> subprocess.CompletedProcess[str]:
+            entered.set()
+            release.wait(5)
+            return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+        mock_run.side_effect = slow_connect
+        vpn_config = VpnConfig(name="test-vpn", connect_cmd="vpn up", disconnect_cmd="vpn down")
+        results: list[VpnResult] = []
+
+        first = threading.Thread(target=lambda: results.append(connect_vpn(vpn_config)))
+        first.start()
+        assert entered.wait(5)
+        second = threading.Thread(target=lambda: results.append(connect_vpn(vpn_config)))
+        second.start()
+        threading.Event().wait(0.2)
+        release.set()
+        first.join(5)
+        second.join(5)
+        _active_vpn_connections.pop("test-vpn", None)
+
+        assert mock_run.call_count == 1
+        assert [r.connected for r in results] == [True, True]
+        assert sorted(r.message for r in results) == [
+            "Connected by a concurrent caller",
+            "Connected successfully",
+        ]
+
     def test_connect_vpn_dry_run(self) -> None:
         """Test VPN connection in dry run mode."""
         vpn_config = VpnConfig(
@@ -830,6 +1766,165 @@ class TestVpnOperations:
         assert result.connected is False
         assert "DRY RUN" in result.message
 
+    def test_connect_vpn_async(self) -> None:
+        """Test that VPNs are connected concurrently and tracked for cleanup."""
+        import asyncio
+
+        from pre_commit.remote_sync import (
+            _active_vpn_connections,
+            connect_vpn_async,
+            disconnect_vpn_async,
+        )
+
+        async def connect_both() -> list[VpnResult]:
+            return list(await asyncio.gather(*(connect_vpn_async(c) for c in vpn_configs)))
+
+        vpn_configs = [
+            VpnConfig(name=name, connect_cmd="true", disconnect_cmd="true")
+            for name in ("vpn-a", "vpn-b")
+        ]
+        results = asyncio.run(connect_both())
+
+        assert [r.vpn_name for r in results] == ["vpn-a", "vpn-b"]
+        assert all(r.connected for r in results)
+        assert set(_active_vpn_connections) >= {"vpn-a", "vpn-b"}
+
+        for vpn_config in vpn_configs:
+            result = asyncio.run(disconnect_vpn_async(vpn_config))
+            assert result.connected is False
+        assert not {"vpn-a", "vpn-b"} & set(_active_vpn_connections)
+
+    def test_connect_vpn_async_coalesces_same_vpn(self, tmp_path: Path) -> None:
+        """Test that concurrent async connects for one VPN run its command once."""
+        import asyncio
+
+        from pre_commit.remote_sync import _active_vpn_connections, connect_vpn_async
+
+        async def connect_twice() -> list[VpnResult]:
+            return list(await asyncio.gather(connect_vpn_async(vpn_config), connect_vpn_async(vpn_config)))
+
+        calls = tmp_path / "calls"
+        vpn_config = VpnConfig(
+            name="shared-vpn", connect_cmd=f"echo up >> {calls}; sleep 0.3", disconnect_cmd="true"
+        )
+        results = asyncio.run(connect_twice())
+        _active_vpn_connections.pop("shared-vpn", None)
+
+        assert calls.read_text().split() == ["up"]
+        assert [r.connected for r in results] == [True, True]
+        assert sorted(r.message for r in results) == [
+            "Connected by a concurrent caller",
+            "Connected successfully",
+        ]
+
+    def test_connect_vpn_async_failure(self) -> None:
+        """Test that a failing connect command reports its error."""
+        import asyncio
+
+        from pre_commit.remote_sync import connect_vpn_async
+
+        vpn_config = VpnConfig(
+            name="test-vpn", connect_cmd="echo refused >&2; exit 3", disconnect_cmd="true"
+        )
+        result = asyncio.run(connect_vpn_async(vpn_config))
+
+        assert result.connected is False
+        assert result.message == "refused"
+
+    @patch("pre_commit.remote_sync.disconnect_vpn")
+    @patch("pre_commit.remote_sync.connect_vpn")
+    def test_vpn_context_shares_connection(
+        self, mock_connect: MagicMock, mock_disconnect: MagicMock
+    ) -> None:
+        """Test that nested contexts connect once and disconnect after the last exit."""
+        mock_connect.return_value = VpnResult(vpn_name="test-vpn", connected=True)
+        vpn_config = VpnConfig(
+            name="test-vpn", connect_cmd="vpn connect", disconnect_cmd="vpn disconnect"
+        )
+
+        with VpnContext(vpn_config) as outer:
+            with VpnContext(vpn_config) as inner:
+                assert inner.connected is True
+            mock_disconnect.assert_not_called()
+            assert outer.connected is True
+
+        mock_connect.assert_called_once()
+        mock_disconnect.assert_called_once()
+
+        with VpnContext(vpn_config):
+            pass
+        assert mock_connect.call_count == 2
+
+    @patch("pre_commit.remote_sync.disconnect_vpn")
+    @patch("pre_commit.remote_sync.connect_vpn")
+    def test_vpn_context_locks_per_vpn(
+        self, mock_connect: MagicMock, mock_disconnect: MagicMock
+    ) -> None:
+        """Test that a slow connect only blocks contexts for the same VPN."""
+        import threading
+
+        from pre_commit.remote_sync import _vpn_lock
+
+        mock_connect.side_effect = lambda vpn_config, dry_run: VpnResult(
+            vpn_name=vpn_config.name, connected=True
+        )
+        slow = VpnConfig(name="slow-vpn", connect_cmd="up", disconnect_cmd="down")
+        fast = VpnConfig(name="fast-vpn", connect_cmd="up", disconnect_cmd="down")
+
+        assert _vpn_lock("slow-vpn") is _vpn_lock("slow-vpn")
+        fast_context = VpnContext(fast)
+        with _vpn_lock("slow-vpn"):
+            # Entering another VPN's context must not wait on this lock
+            worker = threading.Thread(target=fast_context.__enter__)
+            worker.start()
+            worker.join(timeout=5)
+            assert not worker.is_alive()
+        fast_context.__exit__(None, None, None)
+
+        with VpnContext(slow):
+            pass
+        assert mock_disconnect.call_count == 2
+
+    @patch("pre_commit.remote_sync.disconnect_vpn")
+    @patch("pre_commit.remote_sync.connect_vpn")
+    @patch("pre_commit.remote_sync.is_vpn_connected")
+    def test_vpn_context_leaves_existing_connection(
+        self, mock_is_connected: MagicMock, mock_connect: MagicMock, mock_disconnect: MagicMock
+    ) -> None:
+        """Test that a VPN that was already up is never disconnected."""
+        mock_is_connected.return_value = True
+        vpn_config = VpnConfig(
+            name="test-vpn",
+            connect_cmd="vpn connect",
+            disconnect_cmd="vpn disconnect",
+            check_cmd="vpn status",
+        )
+
+        with VpnContext(vpn_config) as outer:
+            with VpnContext(vpn_config):
+                pass
+            assert outer.was_already_connected is True
+
+        mock_connect.assert_not_called()
+        mock_disconnect.assert_not_called()
+        mock_is_connected.assert_called_once()
+
+    @patch("pre_commit.remote_sync.run_shell_command")
+    def test_disconnect_all_vpns(self, mock_run: MagicMock) -> None:
+        """Test that every tracked VPN is disconnected and untracked."""
+        from pre_commit.remote_sync import _active_vpn_connections, disconnect_all_vpns
+
+        mock_run.return_value = subprocess.CompletedProcess("cmd", 0, stdout="", stderr="")
+        for name in ("vpn-a", "vpn-b"):
+            _active_vpn_connections[name] = VpnConfig(
+                name=name, connect_cmd="vpn up", disconnect_cmd="vpn down"
+            )
+
+        results = disconnect_all_vpns()
+
+        assert sorted(r.vpn_name for r in results) == ["vpn-a", "vpn-b"]
+        assert _active_vpn_connections == {}
+
 
 class TestVpnConfigInRemote:
     """Tests for VPN configuration in remote settings."""
@@ -993,6 +2088,15 @@ class TestFilesystemTarget:
         assert target.exclude == ["*.pyc", "__pycache__"]
         assert target.delete is True
 
+    def test_default_excludes_not_shared(self) -> None:
+        """Test each target gets its own default exclude list."""
+        first = FilesystemTarget.from_dict("a", {"path": "/a", "exclude": None})
+        second = FilesystemTarget.from_dict("b", {"path": "/b"})
+
+        first.exclude.append("*.log")
+        assert "*.log" not in second.exclude
+        assert FilesystemTarget.from_dict("c", {"exclude": []}).exclude == []
+
 
 class TestRsyncTarget:
     """Tests for RsyncTarget configuration."""